@@ -15,6 +15,7 @@ the LLM's arguments through.
 
 from __future__ import annotations
 
+import json
 import logging
 from pathlib import Path
 from typing import Any
@@ -23,6 +24,23 @@ from omnigent.tools import ToolRegistry
 
 logger = logging.getLogger("omnibrain.agent_tools")
 
+# Email and calendar results carry long lists of previews and attendees;
+# orjson (optional, ``pip install omnibrain[fast]``) serializes them several
+# times faster than the stdlib codec the registry would otherwise use.
+try:
+    import orjson
+
+    def _dumps(obj: Any) -> str:
+        try:
+            return orjson.dumps(
+                obj, option=orjson.OPT_NON_STR_KEYS | orjson.OPT_INDENT_2,
+            ).decode()
+        except TypeError:
+            return json.dumps(obj, indent=2)
+except ImportError:
+    def _dumps(obj: Any) -> str:
+        return json.dumps(obj, indent=2)
+
 
 # ═══════════════════════════════════════════════════════════════════════════
 # Schema converter: OpenAI function-calling → Omnigent ToolRegistry schema
@@ -133,8 +151,8 @@ def _register_email_tools(registry: ToolRegistry, data_dir: Path) -> None:
         from omnibrain.tools.email_tools import (
             EMAIL_TOOL_SCHEMAS,
             classify_email,
-            fetch_emails,
-            search_emails,
+            fetch_emails_async,
+            search_emails_async,
         )
     except ImportError:
         logger.debug("Email tools not available (missing dependencies)")
@@ -143,21 +161,21 @@ def _register_email_tools(registry: ToolRegistry, data_dir: Path) -> None:
     # fetch_emails
     async def _fetch_emails(
         max_results: int = 20, query: str = "", since_hours: int = 24, **kw: Any,
-    ) -> dict:
-        result = fetch_emails(data_dir, max_results=max_results, query=query, since_hours=since_hours)
-        return result  # ToolRegistry handles JSON serialization
+    ) -> str:
+        result = await fetch_emails_async(data_dir, max_results=max_results, query=query, since_hours=since_hours)
+        return _dumps(result)
 
     # search_emails
-    async def _search_emails(query: str, max_results: int = 20, **kw: Any) -> dict:
-        result = search_emails(data_dir, query=query, max_results=max_results)
-        return result  # ToolRegistry handles JSON serialization
+    async def _search_emails(query: str, max_results: int = 20, **kw: Any) -> str:
+        result = await search_emails_async(data_dir, query=query, max_results=max_results)
+        return _dumps(result)
 
     # classify_email
     async def _classify_email(
         email_id: str, subject: str, sender: str = "", body_preview: str = "", **kw: Any,
-    ) -> dict:
+    ) -> str:
         result = classify_email(data_dir, email_id=email_id, subject=subject, sender=sender, body_preview=body_preview)
-        return result  # ToolRegistry handles JSON serialization
+        return _dumps(result)
 
     handlers = {
         "fetch_emails": _fetch_emails,
@@ -183,25 +201,25 @@ def _register_calendar_tools(
     try:
         from omnibrain.tools.calendar_tools import (
             CALENDAR_TOOL_SCHEMAS,
-            generate_meeting_brief,
-            get_today_events,
-            get_upcoming_events,
+            generate_meeting_brief_async,
+            get_today_events_async,
+            get_upcoming_events_async,
         )
     except ImportError:
         logger.debug("Calendar tools not available (missing dependencies)")
         return
 
-    async def _get_today(**kw: Any) -> dict:
-        result = get_today_events(data_dir)
-        return result  # ToolRegistry handles JSON serialization
+    async def _get_today(**kw: Any) -> str:
+        result = await get_today_events_async(data_dir)
+        return _dumps(result)
 
-    async def _get_upcoming(days: int = 7, max_results: int = 20, **kw: Any) -> dict:
-        result = get_upcoming_events(data_dir, days=days, max_results=max_results)
-        return result  # ToolRegistry handles JSON serialization
+    async def _get_upcoming(days: int = 7, max_results: int = 20, **kw: Any) -> str:
+        result = await get_upcoming_events_async(data_dir, days=days, max_results=max_results)
+        return _dumps(result)
 
-    async def _meeting_brief(event_id: str, **kw: Any) -> dict:
-        result = generate_meeting_brief(data_dir, event_id=event_id, db=db)
-        return result  # ToolRegistry handles JSON serialization
+    async def _meeting_brief(event_id: str, **kw: Any) -> str:
+        result = await generate_meeting_brief_async(data_dir, event_id=event_id, db=db)
+        return _dumps(result)
 
     handlers = {
         "get_today_events": _get_today,
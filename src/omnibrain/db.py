@@ -35,6 +35,10 @@ from omnibrain.models import (
 
 logger = logging.getLogger("omnibrain.db")
 
+# Bound parameters per IN (...) query, under SQLite's default
+# SQLITE_MAX_VARIABLE_NUMBER (999 before 3.32)
+_MAX_SQL_VARS = 900
+
 # ═══════════════════════════════════════════════════════════════════════════
 # Schema
 # ═══════════════════════════════════════════════════════════════════════════
@@ -203,6 +207,24 @@ CREATE INDEX IF NOT EXISTS idx_chat_timestamp ON chat_messages(timestamp);
 """
 
 
+_INSERT_EVENT_SQL = """INSERT INTO events (source, event_type, title, content, metadata, priority, timestamp, external_id)
+   VALUES (?, ?, ?, ?, ?, ?, COALESCE(?, datetime('now')), ?)"""
+
+_UPSERT_CONTACT_SQL = """INSERT INTO contacts (email, name, relationship, organization,
+   last_interaction, interaction_count, avg_response_time_hours, notes, metadata)
+   VALUES (:email, :name, :relationship, :organization,
+   :last_interaction, :interaction_count, :avg_response_time_hours, :notes, :metadata)
+   ON CONFLICT(email) DO UPDATE SET
+   name = COALESCE(NULLIF(excluded.name, ''), contacts.name),
+   relationship = CASE WHEN excluded.relationship != 'unknown'
+                       THEN excluded.relationship ELSE contacts.relationship END,
+   organization = COALESCE(NULLIF(excluded.organization, ''), contacts.organization),
+   last_interaction = COALESCE(excluded.last_interaction, contacts.last_interaction),
+   interaction_count = contacts.interaction_count + 1,
+   notes = COALESCE(NULLIF(excluded.notes, ''), contacts.notes),
+   metadata = excluded.metadata"""
+
+
 # ═══════════════════════════════════════════════════════════════════════════
 # Database Manager
 # ═══════════════════════════════════════════════════════════════════════════
@@ -386,20 +408,33 @@ class OmniBrainDB:
     ) -> int:
         """Insert an event into the event stream. Returns the event ID."""
         with self._connect() as conn:
-            if timestamp:
-                cursor = conn.execute(
-                    """INSERT INTO events (source, event_type, title, content, metadata, priority, timestamp, external_id)
-                       VALUES (?, ?, ?, ?, ?, ?, ?, ?)""",
-                    (source, event_type, title, content, json.dumps(metadata or {}), priority, timestamp, external_id),
-                )
-            else:
-                cursor = conn.execute(
-                    """INSERT INTO events (source, event_type, title, content, metadata, priority, external_id)
-                       VALUES (?, ?, ?, ?, ?, ?, ?)""",
-                    (source, event_type, title, content, json.dumps(metadata or {}), priority, external_id),
-                )
+            cursor = conn.execute(
+                _INSERT_EVENT_SQL,
+                (source, event_type, title, content, json.dumps(metadata or {}),
+                 priority, timestamp or None, external_id),
+            )
             return cursor.lastrowid or 0
 
+    def insert_events_bulk(self, rows: list[dict[str, Any]]) -> int:
+        """Insert many events in one transaction; returns the count.
+
+        Each row holds ``insert_event``'s keyword arguments.  The batch is
+        atomic: on error nothing is written and the exception propagates.
+        """
+        if not rows:
+            return 0
+        params = [
+            (
+                r["source"], r["event_type"], r["title"], r.get("content", ""),
+                json.dumps(r.get("metadata") or {}), r.get("priority", 0),
+                r.get("timestamp") or None, r.get("external_id"),
+            )
+            for r in rows
+        ]
+        with self._connect() as conn:
+            conn.executemany(_INSERT_EVENT_SQL, params)
+        return len(params)
+
     def get_events(
         self,
         source: str | None = None,
@@ -549,24 +584,20 @@ class OmniBrainDB:
 
     def upsert_contact(self, contact: ContactInfo) -> None:
         """Insert or update a contact."""
-        data = contact.to_dict()
         with self._connect() as conn:
-            conn.execute(
-                """INSERT INTO contacts (email, name, relationship, organization,
-                   last_interaction, interaction_count, avg_response_time_hours, notes, metadata)
-                   VALUES (:email, :name, :relationship, :organization,
-                   :last_interaction, :interaction_count, :avg_response_time_hours, :notes, :metadata)
-                   ON CONFLICT(email) DO UPDATE SET
-                   name = COALESCE(NULLIF(excluded.name, ''), contacts.name),
-                   relationship = CASE WHEN excluded.relationship != 'unknown'
-                                       THEN excluded.relationship ELSE contacts.relationship END,
-                   organization = COALESCE(NULLIF(excluded.organization, ''), contacts.organization),
-                   last_interaction = COALESCE(excluded.last_interaction, contacts.last_interaction),
-                   interaction_count = contacts.interaction_count + 1,
-                   notes = COALESCE(NULLIF(excluded.notes, ''), contacts.notes),
-                   metadata = excluded.metadata""",
-                data,
-            )
+            conn.execute(_UPSERT_CONTACT_SQL, contact.to_dict())
+
+    def upsert_contacts_bulk(self, contacts: list[ContactInfo]) -> int:
+        """Upsert many contacts in one transaction; returns the count.
+
+        Same semantics as calling ``upsert_contact`` for each, in order.
+        The batch is atomic: on error nothing is written.
+        """
+        if not contacts:
+            return 0
+        with self._connect() as conn:
+            conn.executemany(_UPSERT_CONTACT_SQL, [c.to_dict() for c in contacts])
+        return len(contacts)
 
     def upsert_contact_by_name(
         self,
@@ -605,6 +636,23 @@ class OmniBrainDB:
                 return ContactInfo.from_dict(dict(row))
             return None
 
+    def get_contacts_by_email(self, emails: list[str]) -> dict[str, dict[str, Any]]:
+        """Look up many contacts at once → ``{email: row}`` (unknown emails omitted)."""
+        wanted = list(dict.fromkeys(emails))
+        found: dict[str, dict[str, Any]] = {}
+        if not wanted:
+            return found
+        with self._connect() as conn:
+            for i in range(0, len(wanted), _MAX_SQL_VARS):
+                chunk = wanted[i:i + _MAX_SQL_VARS]
+                rows = conn.execute(
+                    f"SELECT * FROM contacts WHERE email IN ({','.join('?' * len(chunk))})",
+                    chunk,
+                ).fetchall()
+                for row in rows:
+                    found[row["email"]] = dict(row)
+        return found
+
     def get_contacts(self, limit: int = 100) -> list[ContactInfo]:
         """Get all contacts ordered by interaction count."""
         with self._connect() as conn:
@@ -15,6 +15,7 @@ Architecture:
 from __future__ import annotations
 
 import logging
+import time
 from datetime import UTC, datetime, timedelta
 from pathlib import Path
 from typing import Any
@@ -25,6 +26,14 @@ from omnibrain.models import CalendarEvent
 
 logger = logging.getLogger("omnibrain.integrations.calendar")
 
+# authenticate() on a client that is already authenticated is a no-op for
+# this long; after that the token file is re-read (and refreshed) again.
+AUTH_TTL_S = 300.0
+
+# Partial responses: ask Calendar only for what _parse_event reads.
+_EVENT_FIELDS = "id,summary,description,location,start,end,attendees/email,recurringEventId"
+_LIST_FIELDS = f"items({_EVENT_FIELDS})"
+
 
 class CalendarAuthError(Exception):
     """Raised when Calendar authentication fails."""
@@ -48,14 +57,20 @@ class CalendarClient:
         self._token_path = data_dir / "google_token.json"
         self._service: Any = None
         self._creds: Any = None
+        self._authed_at: float | None = None
 
     # ── Authentication ──
 
     def authenticate(self) -> bool:
         """Load and validate credentials. Returns True if authenticated.
 
-        Uses the same token.json as GmailClient.
+        Uses the same token.json as GmailClient.  Within ``AUTH_TTL_S`` of
+        a successful call, and while the credentials are still valid, this
+        returns immediately; an auth error from the API ends that window.
         """
+        if self._fresh():
+            return True
+
         try:
             from google.auth.transport.requests import Request
             from google.oauth2.credentials import Credentials
@@ -91,6 +106,7 @@ class CalendarClient:
         try:
             from googleapiclient.discovery import build
             self._service = build("calendar", "v3", credentials=self._creds)
+            self._authed_at = time.monotonic()
             logger.info("Calendar client authenticated")
             return True
         except Exception as e:
@@ -101,6 +117,13 @@ class CalendarClient:
     def is_authenticated(self) -> bool:
         return self._service is not None and self._creds is not None and self._creds.valid
 
+    def _fresh(self) -> bool:
+        return (
+            self._authed_at is not None
+            and time.monotonic() - self._authed_at < AUTH_TTL_S
+            and self.is_authenticated
+        )
+
     # ── Fetch Events ──
 
     def get_today_events(self) -> list[CalendarEvent]:
@@ -158,6 +181,7 @@ class CalendarClient:
             event_data = self._service.events().get(
                 calendarId="primary",
                 eventId=event_id,
+                fields=_EVENT_FIELDS,
             ).execute()
             return _parse_event(event_data)
         except Exception as e:
@@ -198,6 +222,7 @@ class CalendarClient:
                 maxResults=max_results,
                 singleEvents=True,
                 orderBy="startTime",
+                fields=_LIST_FIELDS,
             ).execute()
 
             events_data = result.get("items", [])
@@ -352,6 +377,7 @@ class CalendarClient:
                 maxResults=max_results,
                 singleEvents=True,
                 orderBy="startTime",
+                fields=_LIST_FIELDS,
             ).execute()
 
             events_data = result.get("items", [])
@@ -370,6 +396,7 @@ class CalendarClient:
 
         except Exception as e:
             if _is_auth_error(e):
+                self._authed_at = None  # re-read the token on next authenticate()
                 raise CalendarAuthError(f"Auth error: {e}") from e
             logger.error(f"Failed to fetch events: {e}")
             raise
@@ -18,6 +18,7 @@ import base64
 import email.utils
 import logging
 import re
+import time
 from datetime import UTC, datetime, timedelta
 from pathlib import Path
 from typing import Any
@@ -31,6 +32,16 @@ logger = logging.getLogger("omnibrain.integrations.gmail")
 # Maximum batch size per API call
 MAX_BATCH_SIZE = 100
 
+# Partial responses: ask Gmail only for what _parse_message reads.
+# Message lists only need the ids; parts are kept whole because bodies
+# and attachments can nest arbitrarily deep.
+_LIST_FIELDS = "messages/id"
+_MESSAGE_FIELDS = "id,threadId,labelIds,payload(mimeType,headers(name,value),body/data,parts)"
+
+# authenticate() on a client that is already authenticated is a no-op for
+# this long; after that the token file is re-read (and refreshed) again.
+AUTH_TTL_S = 300.0
+
 
 class GmailAuthError(Exception):
     """Raised when Gmail authentication fails or token is invalid."""
@@ -57,6 +68,7 @@ class GmailClient:
         self._service: Any = None
         self._creds: Any = None
         self._user_email: str = ""
+        self._authed_at: float | None = None
 
     # ── Authentication ──
 
@@ -65,7 +77,13 @@ class GmailClient:
 
         Automatically refreshes expired tokens using the refresh_token.
         Does NOT open browser — use setup_google.py for initial auth.
+        Within ``AUTH_TTL_S`` of a successful call, and while the
+        credentials are still valid, this returns immediately; an auth
+        error from the API ends that window.
         """
+        if self._fresh():
+            return True
+
         try:
             from google.auth.transport.requests import Request
             from google.oauth2.credentials import Credentials
@@ -106,6 +124,7 @@ class GmailClient:
             from googleapiclient.discovery import build
 
             self._service = build("gmail", "v1", credentials=self._creds)
+            self._authed_at = time.monotonic()
             logger.info("Gmail client authenticated successfully")
             return True
         except Exception as e:
@@ -139,6 +158,13 @@ class GmailClient:
         """Check if client is ready for API calls."""
         return self._service is not None and self._creds is not None and self._creds.valid
 
+    def _fresh(self) -> bool:
+        return (
+            self._authed_at is not None
+            and time.monotonic() - self._authed_at < AUTH_TTL_S
+            and self.is_authenticated
+        )
+
     @property
     def user_email(self) -> str:
         """Get the authenticated user's email address."""
@@ -193,6 +219,7 @@ class GmailClient:
                 userId="me",
                 q=full_query,
                 maxResults=max_results,
+                fields=_LIST_FIELDS,
             ).execute()
 
             messages = result.get("messages", [])
@@ -218,6 +245,7 @@ class GmailClient:
 
         except Exception as e:
             if _is_auth_error(e):
+                self._authed_at = None  # re-read the token on next authenticate()
                 raise GmailAuthError(f"Authentication error: {e}") from e
             logger.error(f"Failed to fetch emails: {e}")
             raise
@@ -264,6 +292,7 @@ class GmailClient:
                 userId="me",
                 q=query,
                 maxResults=max_results,
+                fields=_LIST_FIELDS,
             ).execute()
 
             messages = result.get("messages", [])
@@ -284,6 +313,7 @@ class GmailClient:
 
         except Exception as e:
             if _is_auth_error(e):
+                self._authed_at = None  # re-read the token on next authenticate()
                 raise GmailAuthError(f"Authentication error: {e}") from e
             logger.error(f"Search failed for query '{query}': {e}")
             raise
@@ -305,6 +335,7 @@ class GmailClient:
                 userId="me",
                 id=thread_id,
                 format="full",
+                fields=f"messages({_MESSAGE_FIELDS})",
             ).execute()
 
             messages = result.get("messages", [])
@@ -453,6 +484,7 @@ class GmailClient:
                 userId="me",
                 id=message_id,
                 format="full",
+                fields=_MESSAGE_FIELDS,
             ).execute()
             return _parse_message(msg_data)
         except Exception as e:
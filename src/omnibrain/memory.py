@@ -12,6 +12,7 @@ Architecture:
     - store(text, metadata) → stores in both backends
     - search(query, ...) → queries best available backend
     - Falls back gracefully if ChromaDB isn't available
+    - Near-duplicate queries served from a SemanticResultCache
 
 Follows manifesto Section 14 (Storage & Memory Architecture):
     Event arrives → 1. Store in SQLite → 2. Embed in ChromaDB → 3. Extract entities
@@ -21,9 +22,11 @@ from __future__ import annotations
 
 import json
 import logging
+import math
 import sqlite3
 from abc import ABC, abstractmethod
-from collections.abc import Generator
+from collections import OrderedDict
+from collections.abc import Generator, Hashable, Sequence
 from contextlib import contextmanager
 from datetime import datetime, timedelta
 from pathlib import Path
@@ -143,6 +146,11 @@ END;
 """
 
 
+_INSERT_MEMORY_SQL = """INSERT INTO memory
+    (id, text, source, source_type, timestamp, contacts, metadata)
+    VALUES (?, ?, ?, ?, ?, ?, ?)"""
+
+
 class SQLiteMemoryStore(MemoryStore):
     """SQLite FTS5-based memory store.
 
@@ -181,25 +189,31 @@ class SQLiteMemoryStore(MemoryStore):
             with self._conn() as conn:
                 # Delete existing first (to keep FTS5 in sync via trigger)
                 conn.execute("DELETE FROM memory WHERE id = ?", (doc.id,))
-                conn.execute(
-                    """INSERT INTO memory
-                       (id, text, source, source_type, timestamp, contacts, metadata)
-                       VALUES (?, ?, ?, ?, ?, ?, ?)""",
-                    (
-                        doc.id,
-                        doc.text,
-                        doc.source,
-                        doc.source_type,
-                        doc.timestamp,
-                        json.dumps(doc.contacts),
-                        json.dumps(doc.metadata),
-                    ),
-                )
+                conn.execute(_INSERT_MEMORY_SQL, _doc_row(doc))
             return True
         except Exception as e:
             logger.warning(f"Failed to store memory document {doc.id}: {e}")
             return False
 
+    def store_many(self, docs: list[MemoryDocument]) -> int:
+        """Store documents in one transaction. Returns how many were stored.
+
+        If the transaction fails, each document is retried on its own so
+        one bad row doesn't lose the rest.
+        """
+        # Last one wins for repeated IDs, as with successive store() calls
+        docs = list({doc.id: doc for doc in docs}.values())
+        if not docs:
+            return 0
+        try:
+            with self._conn() as conn:
+                conn.executemany("DELETE FROM memory WHERE id = ?", [(doc.id,) for doc in docs])
+                conn.executemany(_INSERT_MEMORY_SQL, [_doc_row(doc) for doc in docs])
+            return len(docs)
+        except Exception as e:
+            logger.warning(f"Batch store of {len(docs)} memory documents failed ({e}), storing one by one")
+            return sum(self.store(doc) for doc in docs)
+
     def search(
         self,
         query: str,
@@ -300,6 +314,15 @@ class SQLiteMemoryStore(MemoryStore):
 # ═══════════════════════════════════════════════════════════════════════════
 
 
+# Documents per ChromaDB upsert. Each upsert embeds its documents in one
+# call to the embedding function; 100 is within every provider's limit.
+_CHROMA_BATCH_SIZE = 100
+
+# Query embeddings memoized per store. Repeated searches (pagination, the
+# same question asked again) skip the embedding model entirely.
+_QUERY_EMBEDDING_CACHE_SIZE = 512
+
+
 def _chromadb_available() -> bool:
     """Check if ChromaDB is importable and functional."""
     try:
@@ -320,16 +343,23 @@ class ChromaMemoryStore(MemoryStore):
         self._collection_name = collection_name
         self._client = None
         self._collection = None
+        self._embedding_fn = None
+        self._query_embeddings: OrderedDict[str, tuple[float, ...]] = OrderedDict()
         self._init_chroma()
 
     def _init_chroma(self) -> None:
         """Initialize ChromaDB client and collection."""
         try:
             import chromadb
+            from chromadb.utils import embedding_functions
             self._data_dir.mkdir(parents=True, exist_ok=True)
             self._client = chromadb.PersistentClient(path=str(self._data_dir))
+            # Chroma's default model, held here so queries can be embedded
+            # (and cached) outside the collection.
+            self._embedding_fn = embedding_functions.DefaultEmbeddingFunction()
             self._collection = self._client.get_or_create_collection(
                 name=self._collection_name,
+                embedding_function=self._embedding_fn,
                 metadata={"hnsw:space": "cosine"},
             )
             logger.info(f"ChromaDB initialized at {self._data_dir}")
@@ -337,11 +367,35 @@ class ChromaMemoryStore(MemoryStore):
             logger.warning(f"ChromaDB initialization failed: {e}")
             self._client = None
             self._collection = None
+            self._embedding_fn = None
 
     @property
     def is_available(self) -> bool:
         return self._collection is not None
 
+    def embed_query(self, query: str) -> tuple[tuple[float, ...] | None, bool]:
+        """Embed a search query through an LRU cache.
+
+        Returns ``(embedding, cache_hit)``; the embedding is None when there
+        is no embedding function to call (the collection then embeds itself).
+        """
+        if self._embedding_fn is None:
+            return None, False
+        key = " ".join(query.split())
+        cached = self._query_embeddings.get(key)
+        if cached is not None:
+            self._query_embeddings.move_to_end(key)
+            return cached, True
+        try:
+            embedding = tuple(float(x) for x in self._embedding_fn([key])[0])
+        except Exception as e:
+            logger.warning(f"Query embedding failed: {e}")
+            return None, False
+        self._query_embeddings[key] = embedding
+        if len(self._query_embeddings) > _QUERY_EMBEDDING_CACHE_SIZE:
+            self._query_embeddings.popitem(last=False)
+        return embedding, False
+
     def store(self, doc: MemoryDocument) -> bool:
         if not self.is_available:
             return False
@@ -349,24 +403,42 @@ class ChromaMemoryStore(MemoryStore):
             self._collection.upsert(
                 ids=[doc.id],
                 documents=[doc.text],
-                metadatas=[{
-                    "source": doc.source,
-                    "source_type": doc.source_type,
-                    "timestamp": doc.timestamp,
-                    "contacts": json.dumps(doc.contacts),
-                }],
+                metadatas=[_chroma_metadata(doc)],
             )
             return True
         except Exception as e:
             logger.warning(f"ChromaDB store failed for {doc.id}: {e}")
             return False
 
+    def store_many(self, docs: list[MemoryDocument]) -> int:
+        """Upsert documents in batches, so they are embedded a batch at a time
+        rather than one embedding call per document. Returns how many were stored.
+        """
+        if not self.is_available:
+            return 0
+        docs = list({doc.id: doc for doc in docs}.values())
+        stored = 0
+        for i in range(0, len(docs), _CHROMA_BATCH_SIZE):
+            chunk = docs[i:i + _CHROMA_BATCH_SIZE]
+            try:
+                self._collection.upsert(
+                    ids=[doc.id for doc in chunk],
+                    documents=[doc.text for doc in chunk],
+                    metadatas=[_chroma_metadata(doc) for doc in chunk],
+                )
+                stored += len(chunk)
+            except Exception as e:
+                logger.warning(f"ChromaDB batch store of {len(chunk)} documents failed ({e}), storing one by one")
+                stored += sum(self.store(doc) for doc in chunk)
+        return stored
+
     def search(
         self,
         query: str,
         max_results: int = 10,
         source_filter: str = "all",
         time_range_days: int = 90,
+        query_embedding: Sequence[float] | None = None,
     ) -> list[MemoryDocument]:
         if not self.is_available:
             return []
@@ -375,8 +447,14 @@ class ChromaMemoryStore(MemoryStore):
             if source_filter and source_filter != "all":
                 where["source_type"] = source_filter
 
+            if query_embedding is None:
+                query_embedding, _ = self.embed_query(query)
+            if query_embedding is not None:
+                query_args = {"query_embeddings": [list(query_embedding)]}
+            else:
+                query_args = {"query_texts": [query]}
             results = self._collection.query(
-                query_texts=[query],
+                **query_args,
                 n_results=max_results,
                 where=where if where else None,
             )
@@ -421,6 +499,124 @@ class ChromaMemoryStore(MemoryStore):
             return 0
 
 
+# ═══════════════════════════════════════════════════════════════════════════
+# Semantic Result Cache
+# ═══════════════════════════════════════════════════════════════════════════
+
+
+# Recent searches kept for near-duplicate lookups, and the cosine similarity
+# at which two queries count as the same question ("emails from Alice" vs
+# "what emails did I get from Alice?").
+_RESULT_CACHE_SIZE = 256
+_RESULT_CACHE_SIMILARITY = 0.95
+
+
+class SemanticResultCache:
+    """Search results keyed by query embedding.
+
+    A lookup hits when a cached query under the same ``key`` (the search
+    filters) has cosine similarity >= ``threshold``. Entries are evicted
+    oldest-first. Uses NumPy when installed (it ships with ChromaDB, the
+    only source of embeddings); pure Python otherwise.
+
+    With NumPy the unit-length query vectors live in one preallocated
+    float32 matrix used as a ring buffer, so a lookup is a single
+    matrix-vector product over the filled rows.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = _RESULT_CACHE_SIZE,
+        threshold: float = _RESULT_CACHE_SIMILARITY,
+    ):
+        self._max_entries = max_entries
+        self._threshold = threshold
+        self._np = _numpy()
+        self._entries: list[tuple[Hashable, Any]] = []  # by slot
+        self._rows: Any = None  # by slot: (max_entries, dim) float32 array, or tuples
+        self._dim = 0
+        self._next = 0  # oldest slot, overwritten by the next put once full
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, embedding: Sequence[float], key: Hashable) -> Any | None:
+        if not self._entries:
+            return None
+        query = self._unit(embedding)
+        if query is None or len(query) != self._dim:
+            return None
+        np = self._np
+        n = len(self._entries)
+        if np is not None:
+            sims = self._rows[:n] @ query
+            hits = np.flatnonzero(sims >= self._threshold)
+            ranked = hits[np.argsort(-sims[hits])].tolist()
+        else:
+            # No NumPy: rows are plain tuples, dot products in Python
+            sims = [sum(a * b for a, b in zip(row, query, strict=True)) for row in self._rows[:n]]
+            ranked = sorted(
+                (i for i, sim in enumerate(sims) if sim >= self._threshold),
+                key=sims.__getitem__, reverse=True,
+            )
+        for i in ranked:
+            entry_key, value = self._entries[i]
+            if entry_key == key:
+                return value
+        return None
+
+    def put(self, embedding: Sequence[float], key: Hashable, value: Any) -> None:
+        vector = self._unit(embedding)
+        if vector is None:
+            return
+        if self._entries and len(vector) != self._dim:
+            self.clear()  # embedding model changed
+        if not self._entries:
+            self._dim = len(vector)
+            if self._np is not None:
+                self._rows = self._np.zeros((self._max_entries, self._dim), dtype=self._np.float32)
+            else:
+                self._rows = [()] * self._max_entries
+        if len(self._entries) < self._max_entries:
+            slot = len(self._entries)
+            self._entries.append((key, value))
+        else:
+            slot = self._next
+            self._next = (slot + 1) % self._max_entries
+            self._entries[slot] = (key, value)
+        self._rows[slot] = vector
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self._rows = None
+        self._dim = 0
+        self._next = 0
+
+    def _unit(self, embedding: Sequence[float]) -> Any:
+        if self._np is None:
+            return _unit_vector(embedding)
+        vector = self._np.asarray(embedding, dtype=self._np.float32)
+        norm = float(self._np.linalg.norm(vector))
+        if not norm:
+            return None
+        return vector / norm
+
+
+def _numpy() -> Any:
+    try:
+        import numpy
+    except ImportError:
+        return None
+    return numpy
+
+
+def _unit_vector(embedding: Sequence[float]) -> tuple[float, ...] | None:
+    norm = math.sqrt(sum(x * x for x in embedding))
+    if not norm:
+        return None
+    return tuple(x / norm for x in embedding)
+
+
 # ═══════════════════════════════════════════════════════════════════════════
 # Memory Manager (Facade)
 # ═══════════════════════════════════════════════════════════════════════════
@@ -443,6 +639,7 @@ class MemoryManager:
         self._data_dir = data_dir
         self._sqlite = SQLiteMemoryStore(data_dir)
         self._chroma: ChromaMemoryStore | None = None
+        self._results = SemanticResultCache()
 
         if enable_chroma and _chromadb_available():
             try:
@@ -473,15 +670,19 @@ class MemoryManager:
 
         Stores in both SQLite (always) and ChromaDB (if available).
         """
-        doc_id = id or _generate_id(text, source)
         doc = MemoryDocument(
-            id=doc_id,
+            id=id or _generate_id(text, source),
             text=text,
             source=source,
             source_type=source_type,
             contacts=contacts,
             metadata=metadata,
         )
+        self._write(doc)
+        return doc.id
+
+    def _write(self, doc: MemoryDocument) -> None:
+        self._results.clear()
 
         # Always store in SQLite
         self._sqlite.store(doc)
@@ -490,7 +691,17 @@ class MemoryManager:
         if self._chroma:
             self._chroma.store(doc)
 
-        return doc_id
+    def store_documents(self, docs: list[MemoryDocument]) -> int:
+        """Store many documents at once: one SQLite transaction for all of
+        them, and batched upserts (so batched embedding) in ChromaDB.
+
+        Returns the number stored in SQLite (the authoritative store).
+        """
+        self._results.clear()
+        stored = self._sqlite.store_many(docs)
+        if self._chroma:
+            self._chroma.store_many(docs)
+        return stored
 
     def search(
         self,
@@ -498,15 +709,40 @@ class MemoryManager:
         max_results: int = 10,
         source_filter: str = "all",
         time_range_days: int = 90,
+        query_embedding: Sequence[float] | None = None,
     ) -> list[MemoryDocument]:
-        """Search memory. Uses ChromaDB if available, falls back to SQLite FTS5."""
-        if self._chroma:
-            results = self._chroma.search(query, max_results, source_filter, time_range_days)
-            if results:
-                return results
+        """Search memory. Uses ChromaDB if available, falls back to SQLite FTS5.
 
-        # Fallback to FTS5
-        return self._sqlite.search(query, max_results, source_filter, time_range_days)
+        ``query_embedding`` (from ``embed_query``) skips embedding the query again.
+        With embeddings, a near-duplicate of a recent query under the same
+        filters is answered from the semantic result cache.
+        """
+        if not self._chroma:
+            return self._sqlite.search(query, max_results, source_filter, time_range_days)
+
+        if query_embedding is None:
+            query_embedding, _ = self._chroma.embed_query(query)
+        key = (max_results, source_filter, time_range_days)
+        if query_embedding is not None:
+            cached = self._results.get(query_embedding, key)
+            if cached is not None:
+                return list(cached)
+
+        results = self._chroma.search(
+            query, max_results, source_filter, time_range_days, query_embedding,
+        )
+        if not results:
+            # Fallback to FTS5
+            results = self._sqlite.search(query, max_results, source_filter, time_range_days)
+        if query_embedding is not None:
+            self._results.put(query_embedding, key, list(results))
+        return results
+
+    def embed_query(self, query: str) -> tuple[tuple[float, ...] | None, bool]:
+        """Cached query embedding as ``(embedding, cache_hit)``; None without ChromaDB."""
+        if not self._chroma:
+            return None, False
+        return self._chroma.embed_query(query)
 
     def get_by_id(self, doc_id: str) -> MemoryDocument | None:
         """Get a specific document by ID."""
@@ -518,6 +754,7 @@ class MemoryManager:
 
     def delete(self, doc_id: str) -> bool:
         """Delete from both stores."""
+        self._results.clear()
         ok = self._sqlite.delete(doc_id)
         if self._chroma:
             self._chroma.delete(doc_id)
@@ -536,27 +773,15 @@ class MemoryManager:
         Returns:
             Document ID.
         """
-        subject = email_data.get("subject", "")
-        body = email_data.get("body_preview", "")
-        sender = email_data.get("sender", "")
-        sender_email = email_data.get("sender_email", "")
+        doc = _email_document(email_data)
+        self._write(doc)
+        return doc.id
 
-        text = f"Email from {sender}: {subject}\n\n{body}"
-        contacts = [sender_email] if sender_email else []
-
-        return self.store(
-            text=text,
-            id=f"email_{email_data.get('id', '')}",
-            source=sender,
-            source_type="email",
-            contacts=contacts,
-            metadata={
-                "email_id": email_data.get("id", ""),
-                "thread_id": email_data.get("thread_id", ""),
-                "date": email_data.get("date", ""),
-                "is_read": email_data.get("is_read", True),
-            },
-        )
+    def store_email_batch(self, emails: list[dict[str, Any]]) -> list[str]:
+        """Store many emails (see store_email) in one transaction. Returns their IDs."""
+        docs = [_email_document(email_data) for email_data in emails]
+        self.store_documents(docs)
+        return [doc.id for doc in docs]
 
     def store_calendar_event(self, event_data: dict[str, Any]) -> str:
         """Store a calendar event in memory.
@@ -567,31 +792,15 @@ class MemoryManager:
         Returns:
             Document ID.
         """
-        title = event_data.get("title", "")
-        description = event_data.get("description", "")
-        attendees = event_data.get("attendees", [])
-        location = event_data.get("location", "")
-
-        text = f"Calendar event: {title}"
-        if description:
-            text += f"\n{description}"
-        if location:
-            text += f"\nLocation: {location}"
-        if attendees:
-            text += f"\nAttendees: {', '.join(attendees)}"
-
-        return self.store(
-            text=text,
-            id=f"cal_{event_data.get('id', '')}",
-            source="calendar",
-            source_type="calendar",
-            contacts=attendees,
-            metadata={
-                "start_time": event_data.get("start_time", ""),
-                "end_time": event_data.get("end_time", ""),
-                "duration_minutes": event_data.get("duration_minutes", 0),
-            },
-        )
+        doc = _event_document(event_data)
+        self._write(doc)
+        return doc.id
+
+    def store_calendar_event_batch(self, events: list[dict[str, Any]]) -> list[str]:
+        """Store many calendar events (see store_calendar_event) in one transaction."""
+        docs = [_event_document(event_data) for event_data in events]
+        self.store_documents(docs)
+        return [doc.id for doc in docs]
 
 
 # ═══════════════════════════════════════════════════════════════════════════
@@ -599,6 +808,79 @@ class MemoryManager:
 # ═══════════════════════════════════════════════════════════════════════════
 
 
+def _email_document(email_data: dict[str, Any]) -> MemoryDocument:
+    """Build the memory document for an email agent-view dict."""
+    subject = email_data.get("subject", "")
+    body = email_data.get("body_preview", "")
+    sender = email_data.get("sender", "")
+    sender_email = email_data.get("sender_email", "")
+
+    return MemoryDocument(
+        id=f"email_{email_data.get('id', '')}",
+        text=f"Email from {sender}: {subject}\n\n{body}",
+        source=sender,
+        source_type="email",
+        contacts=[sender_email] if sender_email else [],
+        metadata={
+            "email_id": email_data.get("id", ""),
+            "thread_id": email_data.get("thread_id", ""),
+            "date": email_data.get("date", ""),
+            "is_read": email_data.get("is_read", True),
+        },
+    )
+
+
+def _event_document(event_data: dict[str, Any]) -> MemoryDocument:
+    """Build the memory document for a calendar agent-view dict."""
+    title = event_data.get("title", "")
+    description = event_data.get("description", "")
+    attendees = event_data.get("attendees", [])
+    location = event_data.get("location", "")
+
+    text = f"Calendar event: {title}"
+    if description:
+        text += f"\n{description}"
+    if location:
+        text += f"\nLocation: {location}"
+    if attendees:
+        text += f"\nAttendees: {', '.join(attendees)}"
+
+    return MemoryDocument(
+        id=f"cal_{event_data.get('id', '')}",
+        text=text,
+        source="calendar",
+        source_type="calendar",
+        contacts=attendees,
+        metadata={
+            "start_time": event_data.get("start_time", ""),
+            "end_time": event_data.get("end_time", ""),
+            "duration_minutes": event_data.get("duration_minutes", 0),
+        },
+    )
+
+
+def _chroma_metadata(doc: MemoryDocument) -> dict[str, Any]:
+    return {
+        "source": doc.source,
+        "source_type": doc.source_type,
+        "timestamp": doc.timestamp,
+        "contacts": json.dumps(doc.contacts),
+    }
+
+
+def _doc_row(doc: MemoryDocument) -> tuple[Any, ...]:
+    """Column values for _INSERT_MEMORY_SQL."""
+    return (
+        doc.id,
+        doc.text,
+        doc.source,
+        doc.source_type,
+        doc.timestamp,
+        json.dumps(doc.contacts),
+        json.dumps(doc.metadata),
+    )
+
+
 def _generate_id(text: str, source: str) -> str:
     """Generate a deterministic ID from text + source."""
     import hashlib
@@ -16,6 +16,13 @@ from datetime import datetime
 from enum import Enum
 from typing import Any
 
+# How much body text leaves a message: the agent sees a short excerpt and
+# the events table keeps at most 2KB.
+AGENT_BODY_CHARS = 500
+AGENT_DESCRIPTION_CHARS = 300
+STORED_BODY_CHARS = 2000
+
+
 # ═══════════════════════════════════════════════════════════════════════════
 # Enums
 # ═══════════════════════════════════════════════════════════════════════════
@@ -173,6 +180,16 @@ class CalendarEvent:
             return "solo"
         return f"{len(self.attendees)} people"
 
+    @property
+    def agent_description(self) -> str:
+        """Description capped for the agent view."""
+        return self.description[:AGENT_DESCRIPTION_CHARS]
+
+    @property
+    def stored_description(self) -> str:
+        """Description capped for the events table."""
+        return self.description[:STORED_BODY_CHARS]
+
     def to_dict(self) -> dict[str, Any]:
         return {
             "id": self.id,
@@ -236,6 +253,16 @@ class EmailMessage:
         """First 200 chars of body for classification."""
         return self.body[:200].strip() if self.body else ""
 
+    @property
+    def agent_body(self) -> str:
+        """Body capped for the agent view."""
+        return self.body[:AGENT_BODY_CHARS]
+
+    @property
+    def stored_body(self) -> str:
+        """Body capped for the events table."""
+        return self.body[:STORED_BODY_CHARS]
+
     def to_dict(self) -> dict[str, Any]:
         return {
             "id": self.id,
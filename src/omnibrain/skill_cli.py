@@ -227,10 +227,12 @@ class TestAskHandler:
 # Default Configurations
 # ═══════════════════════════════════════════════════════════════════════════
 
-CATEGORIES = [
+CATEGORIES = (
     "communication", "productivity", "analytics", "automation",
     "health", "finance", "development", "other",
-]
+)
+# Membership checks go here; CATEGORIES keeps the order for argparse help.
+_CATEGORIES_SET = frozenset(CATEGORIES)
 
 ICONS = {
     "communication": "💬",
@@ -273,6 +275,9 @@ def init_skill(
 
     Returns the created directory path.
     """
+    if category not in _CATEGORIES_SET:
+        raise ValueError(f"Unknown category: {category!r}")
+
     slug = _slugify(name)
     title = _title_from_slug(slug)
     base = (output_dir or Path.cwd()) / slug
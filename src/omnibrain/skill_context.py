@@ -10,10 +10,11 @@ declares ``permissions: [read_memory, notify]`` in its manifest
 can only call methods guarded by those two permissions.
 
 Design:
-    - Created per-invocation by SkillRuntime
+    - Pooled per Skill by SkillRuntime, ``reset()`` before each reuse;
+      never shared by overlapping invocations
     - Holds references to core services (DB, memory, approval, …)
     - Every public method checks ``_require(permission)`` first
-    - Lightweight — no long-lived state beyond the invocation
+    - Lightweight — only the log buffer is invocation-scoped
 """
 
 from __future__ import annotations
@@ -93,9 +94,13 @@ class SkillContext:
         # Invocation-local log buffer
         self._log_buffer: list[dict[str, str]] = []
 
-        # Integration client cache (per-invocation)
+        # Integration client cache (lives as long as the context)
         self._integration_cache: dict[str, Any] = {}
 
+    def reset(self) -> None:
+        """Clear invocation-local state before the context is reused."""
+        self._log_buffer.clear()
+
     # ──────────────────────────────────────────────────────────
     # Permission guard
     # ──────────────────────────────────────────────────────────
@@ -195,9 +200,7 @@ class SkillContext:
     async def notify(self, message: str, level: str = "fyi") -> None:
         """Send a notification to the user."""
         self._require("notify")
-        logger.info(
-            f"[{self.skill_name}] notify({level}): {message[:120]}"
-        )
+        logger.info("[%s] notify(%s): %.120s", self.skill_name, level, message)
         if self._event_bus is not None:
             await self._event_bus.emit(
                 "notification",
@@ -236,7 +239,7 @@ class SkillContext:
             priority=priority,
         )
         logger.info(
-            f"[{self.skill_name}] proposed action: {title} (id={proposal_id})"
+            "[%s] proposed action: %s (id=%s)", self.skill_name, title, proposal_id
         )
         return proposal_id
 
@@ -275,9 +278,11 @@ class SkillContext:
         ``"quick"`` → DeepSeek, ``"reasoning"`` → Claude, etc.
         """
         self._require("llm_access")
-        logger.info(f"[{self.skill_name}] llm_complete(task={task_type}, len={len(prompt)})")
+        logger.info(
+            "[%s] llm_complete(task=%s, len=%d)", self.skill_name, task_type, len(prompt)
+        )
         if not self._llm_router:
-            logger.warning(f"[{self.skill_name}] llm_complete: no router available")
+            logger.warning("[%s] llm_complete: no router available", self.skill_name)
             return ""
         try:
             messages = [{"role": "user", "content": prompt}]
@@ -292,7 +297,7 @@ class SkillContext:
                     break
             return full
         except Exception as e:
-            logger.error(f"[{self.skill_name}] llm_complete failed: {e}")
+            logger.error("[%s] llm_complete failed: %s", self.skill_name, e)
             return ""
 
     async def llm_stream(
@@ -303,7 +308,7 @@ class SkillContext:
         """Streaming LLM completion (async generator)."""
         self._require("llm_access")
         if not self._llm_router:
-            logger.warning(f"[{self.skill_name}] llm_stream: no router available")
+            logger.warning("[%s] llm_stream: no router available", self.skill_name)
             yield ""
             return
         try:
@@ -317,7 +322,7 @@ class SkillContext:
                 if chunk.done:
                     break
         except Exception as e:
-            logger.error(f"[{self.skill_name}] llm_stream failed: {e}")
+            logger.error("[%s] llm_stream failed: %s", self.skill_name, e)
             yield ""
 
     # ──────────────────────────────────────────────────────────
@@ -376,7 +381,7 @@ class SkillContext:
         try:
             self._db.delete_preference(f"skill:{self.skill_name}:{key}")
         except Exception as e:
-            logger.warning(f"[{self.skill_name}] delete_data failed: {e}")
+            logger.warning("[%s] delete_data failed: %s", self.skill_name, e)
 
     # ──────────────────────────────────────────────────────────
     # Integration Access  (google_gmail / read_calendar)
@@ -389,8 +394,6 @@ class SkillContext:
 
     def _get_data_dir(self) -> Path:
         """Resolve data_dir from config or fall back to ~/.omnibrain."""
-        from pathlib import Path
-
         if self._config:
             dd = getattr(self._config, "data_dir", None)
             if dd:
@@ -415,7 +418,7 @@ class SkillContext:
             )
         self._require(perm)
 
-        # Cache per-invocation to avoid re-authenticating
+        # Cache on the context to avoid re-authenticating
         cache_key = f"{self.skill_name}:{name}"
         if cache_key in self._integration_cache:
             return self._integration_cache[cache_key]
@@ -428,7 +431,7 @@ class SkillContext:
 
             client = GmailClient(data_dir=data_dir)
             if not client.authenticate():
-                logger.warning(f"[{self.skill_name}] Gmail authentication failed")
+                logger.warning("[%s] Gmail authentication failed", self.skill_name)
                 return None
 
         elif name == "calendar":
@@ -436,7 +439,7 @@ class SkillContext:
 
             client = CalendarClient(data_dir=data_dir)
             if not client.authenticate():
-                logger.warning(f"[{self.skill_name}] Calendar authentication failed")
+                logger.warning("[%s] Calendar authentication failed", self.skill_name)
                 return None
 
         if client is not None:
@@ -469,9 +472,7 @@ class SkillContext:
             "message": message,
         }
         self._log_buffer.append(entry)
-        getattr(logger, level, logger.info)(
-            f"[{self.skill_name}] {message}"
-        )
+        getattr(logger, level, logger.info)("[%s] %s", self.skill_name, message)
 
 
 # ─── Event Bus ────────────────────────────────────────────────────────────
@@ -481,23 +482,28 @@ class EventBus:
     """Simple async pub/sub for inter-Skill and core events.
 
     Listeners are ``async def callback(event_type, data)`` coroutines.
+    Listener lists are copy-on-write tuples: ``emit`` iterates a stable
+    snapshot even if a callback subscribes or unsubscribes mid-dispatch.
     """
 
     def __init__(self) -> None:
-        self._listeners: dict[str, list[Any]] = {}
+        self._listeners: dict[str, tuple[Any, ...]] = {}
+        self._count = 0
 
     def subscribe(self, event_type: str, callback: Any) -> None:
-        self._listeners.setdefault(event_type, []).append(callback)
+        self._listeners[event_type] = self._listeners.get(event_type, ()) + (callback,)
+        self._count += 1
 
     def unsubscribe(self, event_type: str, callback: Any) -> None:
         if event_type in self._listeners:
-            self._listeners[event_type] = [
-                cb for cb in self._listeners[event_type] if cb is not callback
-            ]
+            before = self._listeners[event_type]
+            after = tuple(cb for cb in before if cb is not callback)
+            self._listeners[event_type] = after
+            self._count -= len(before) - len(after)
 
     async def emit(self, event_type: str, data: dict[str, Any]) -> None:
         """Emit *event_type* to all registered listeners."""
-        for cb in self._listeners.get(event_type, []):
+        for cb in self._listeners.get(event_type, ()):
             try:
                 await cb(event_type, data)
             except Exception as e:
@@ -515,4 +521,4 @@ class EventBus:
 
     @property
     def listener_count(self) -> int:
-        return sum(len(v) for v in self._listeners.values())
+        return self._count
@@ -21,10 +21,17 @@ starts as a long-lived coroutine via ``runtime.run()``.
 
 from __future__ import annotations
 
+import asyncio
+import functools
+import heapq
 import importlib.util
+import itertools
 import json
 import logging
 import re
+import sys
+import time
+from collections import OrderedDict
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any
@@ -35,38 +42,87 @@ from omnibrain.skill_context import EventBus, SkillContext
 
 logger = logging.getLogger("omnibrain.skill_runtime")
 
+# libyaml-backed loader when PyYAML was built with it (much faster)
+_YamlLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+# run() sleep when no schedule trigger is queued (woken early by discover)
+_IDLE_SLEEP_S = 3600.0
+
+# match_ask memoisation: entries per cache, and how long a pure skill's
+# on_ask result for an identical message may be reused
+_ASK_CACHE_SIZE = 128
+_ASK_RESULT_TTL_S = 1.0
+
+# Idle SkillContexts kept per skill for reuse by later invocations
+_MAX_IDLE_CONTEXTS = 4
+
+
+@functools.lru_cache(maxsize=500)
+def _compile_pattern(pattern: str, flags: int) -> re.Pattern[str] | None:
+    """Compile *pattern*, sharing the result across identical triggers.
+
+    Returns ``None`` for an invalid pattern.  Bounded so plugins that
+    generate many one-off patterns cannot grow it without limit.
+    """
+    try:
+        return re.compile(pattern, flags)
+    except re.error:
+        return None
+
+
+def _lru_put(cache: OrderedDict[Any, Any], key: Any, value: Any) -> None:
+    """Insert *key* as most-recent, evicting the oldest beyond ``_ASK_CACHE_SIZE``."""
+    cache[key] = value
+    cache.move_to_end(key)
+    if len(cache) > _ASK_CACHE_SIZE:
+        cache.popitem(last=False)
+
 
 # ─── Data classes ─────────────────────────────────────────────────────────
 
+# Integer trigger-kind codes; dispatch paths compare these, not strings.
+KIND_SCHEDULE = 0
+KIND_ASK = 1
+KIND_EVENT = 2
+_KIND_NAMES = ("schedule", "on_ask", "on_event")  # indexed by code
+_KIND_CODES = {name: code for code, name in enumerate(_KIND_NAMES)}
+
 
-@dataclass
+@dataclass(slots=True)
 class SkillTrigger:
     """A single trigger from a Skill manifest."""
 
     kind: str  # "schedule" | "on_ask" | "on_event"
     value: str  # cron-like string | regex pattern | event type
-    _compiled_re: Any = field(default=None, repr=False, compare=False)
+    compiled: re.Pattern[str] | None = field(
+        default=None, init=False, repr=False, compare=False,
+    )
+    interval_s: int = field(default=0, init=False, repr=False, compare=False)
+    code: int = field(default=-1, init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        self.code = _KIND_CODES.get(self.kind, -1)
+        # on_ask patterns are compiled (and schedule specs parsed) once at
+        # construction so the dispatch paths never re-derive them.
+        if self.code == KIND_SCHEDULE:
+            self.interval_s = parse_schedule(self.value)
+        elif self.code == KIND_ASK:
+            self.compiled = _compile_pattern(self.value, re.IGNORECASE)
+            if self.compiled is None:
+                logger.warning(f"Invalid on_ask regex: {self.value}")
 
     def matches_ask(self, user_message: str) -> bool:
         """Return True if *user_message* matches this on_ask regex."""
-        if self.kind != "on_ask":
+        if self.compiled is None:
             return False
-        if self._compiled_re is None:
-            try:
-                self._compiled_re = re.compile(self.value, re.IGNORECASE)
-            except re.error:
-                logger.warning(f"Invalid on_ask regex: {self.value}")
-                return False
-        return bool(self._compiled_re.search(user_message))
+        return self.compiled.search(user_message) is not None
 
     def matches_event(self, event_type: str) -> bool:
         """Return True if *event_type* matches this on_event trigger."""
-        if self.kind != "on_event":
-            return False
-        return self.value == event_type
+        return self.code == KIND_EVENT and self.value == event_type
 
 
-@dataclass
+@dataclass(slots=True)
 class SkillManifest:
     """Parsed ``skill.yaml`` manifest."""
 
@@ -84,40 +140,61 @@ class SkillManifest:
     handlers: dict[str, str] = field(default_factory=dict)
     dependencies: list[str] = field(default_factory=list)
     requires_core: str = ""
+    pure: bool = False  # on_ask handler is side-effect free (results cacheable)
 
     path: Path = field(default_factory=lambda: Path("."))
     enabled: bool = True
 
-    # ── Helpers ──
-
-    @property
-    def schedule_triggers(self) -> list[SkillTrigger]:
-        return [t for t in self.triggers if t.kind == "schedule"]
+    # Per-kind views of ``triggers``, partitioned once at construction.
+    schedule_triggers: list[SkillTrigger] = field(
+        default_factory=list, init=False, repr=False, compare=False,
+    )
+    ask_triggers: list[SkillTrigger] = field(
+        default_factory=list, init=False, repr=False, compare=False,
+    )
+    event_triggers: list[SkillTrigger] = field(
+        default_factory=list, init=False, repr=False, compare=False,
+    )
+    _dict_cache: dict[str, Any] | None = field(
+        default=None, init=False, repr=False, compare=False,
+    )
 
-    @property
-    def ask_triggers(self) -> list[SkillTrigger]:
-        return [t for t in self.triggers if t.kind == "on_ask"]
+    def __post_init__(self) -> None:
+        self.name = sys.intern(self.name)
+        by_code = (self.schedule_triggers, self.ask_triggers, self.event_triggers)
+        for t in self.triggers:
+            if t.code >= 0:
+                by_code[t.code].append(t)
 
-    @property
-    def event_triggers(self) -> list[SkillTrigger]:
-        return [t for t in self.triggers if t.kind == "on_event"]
+    # ── Helpers ──
 
     def to_dict(self) -> dict[str, Any]:
-        return {
-            "name": self.name,
-            "version": self.version,
-            "description": self.description,
-            "author": self.author,
-            "category": self.category,
-            "icon": self.icon,
-            "permissions": self.permissions,
-            "triggers": [
-                {"kind": t.kind, "value": t.value} for t in self.triggers
-            ],
-            "handlers": self.handlers,
-            "enabled": self.enabled,
-            "path": str(self.path),
-        }
+        """Serialise the manifest.
+
+        Manifests are immutable after discovery apart from ``enabled``, so
+        the dict is built once and reused; callers must treat it as
+        read-only.
+        """
+        d = self._dict_cache
+        if d is None:
+            d = self._dict_cache = {
+                "name": self.name,
+                "version": self.version,
+                "description": self.description,
+                "author": self.author,
+                "category": self.category,
+                "icon": self.icon,
+                "permissions": self.permissions,
+                "triggers": [
+                    {"kind": t.kind, "value": t.value} for t in self.triggers
+                ],
+                "handlers": self.handlers,
+                "enabled": self.enabled,
+                "path": str(self.path),
+            }
+        elif d["enabled"] is not self.enabled:
+            d["enabled"] = self.enabled
+        return d
 
 
 # ─── Manifest parser ─────────────────────────────────────────────────────
@@ -129,7 +206,7 @@ def parse_manifest(yaml_path: Path) -> SkillManifest | None:
     Returns ``None`` on validation failure (logs a warning).
     """
     try:
-        raw = yaml.safe_load(yaml_path.read_text())
+        raw = yaml.load(yaml_path.read_text(), Loader=_YamlLoader)  # noqa: S506
     except Exception as e:
         logger.warning(f"Cannot read {yaml_path}: {e}")
         return None
@@ -147,9 +224,12 @@ def parse_manifest(yaml_path: Path) -> SkillManifest | None:
     triggers: list[SkillTrigger] = []
     for t in raw.get("triggers", []):
         if isinstance(t, dict):
-            for kind in ("schedule", "on_ask", "on_event"):
+            for kind in _KIND_NAMES:
                 if kind in t:
-                    triggers.append(SkillTrigger(kind=kind, value=str(t[kind])))
+                    trigger = SkillTrigger(kind=kind, value=str(t[kind]))
+                    if trigger.code == KIND_ASK and trigger.compiled is None:
+                        continue  # invalid regex — already logged, drop it
+                    triggers.append(trigger)
 
     # ── Handlers ──
     handlers: dict[str, str] = {}
@@ -172,13 +252,65 @@ def parse_manifest(yaml_path: Path) -> SkillManifest | None:
         handlers=handlers,
         dependencies=list(raw.get("dependencies", [])),
         requires_core=str(raw.get("requires_core", "")),
+        pure=bool(raw.get("pure", False)),
         path=yaml_path.parent,
         enabled=True,
     )
 
 
+# ─── on_ask pattern merging ───────────────────────────────────────────────
+
+_LEADING_FLAGS_RE = re.compile(r"^\(\?([aiLmsu]+)\)")
+# Constructs whose meaning changes once a pattern is spliced into a larger
+# alternation: group references, named groups and inline/verbose flags.
+_UNMERGEABLE_RE = re.compile(r"\\[1-9]|\(\?P|\(\?[aiLmsux-]*\)|\(\?[aiLmsu-]*x")
+
+
+def _mergeable_piece(pattern: str) -> str | None:
+    """Return *pattern* rewritten for use inside an alternation, or ``None``.
+
+    A leading global flag group such as ``(?i)`` is turned into the scoped
+    form ``(?i:...)`` so it stays valid mid-expression.
+    """
+    m = _LEADING_FLAGS_RE.match(pattern)
+    body = pattern[m.end():] if m else pattern
+    if _UNMERGEABLE_RE.search(body):
+        return None
+    piece = f"(?{m.group(1)}:{body})" if m else f"(?:{body})"
+    if _compile_pattern(piece, re.IGNORECASE) is None:
+        return None
+    return piece
+
+
+def _build_ask_master(
+    triggers: list[SkillTrigger],
+) -> tuple[re.Pattern[str] | None, set[int]]:
+    """Combine on_ask patterns into a single alternation.
+
+    Returns ``(master, merged_ids)`` where *merged_ids* holds ``id()`` of
+    each trigger covered by *master*.  If the master misses a message, no
+    merged trigger can match it either, so one search rules them all out.
+    """
+    pieces: list[str] = []
+    merged: set[int] = set()
+    for t in triggers:
+        piece = _mergeable_piece(t.value)
+        if piece is not None:
+            pieces.append(piece)
+            merged.add(id(t))
+    if not pieces:
+        return None, set()
+    try:
+        return re.compile("|".join(pieces), re.IGNORECASE), merged
+    except re.error:
+        return None, set()
+
+
 # ─── Schedule parsing ─────────────────────────────────────────────────────
 
+_EVERY_M_RE = re.compile(r"every\s+(\d+)\s*m(?:in(?:ute)?s?)?$")
+_EVERY_H_RE = re.compile(r"every\s+(\d+)\s*h(?:ours?)?$")
+
 
 def parse_schedule(spec: str) -> int:
     """Convert a schedule spec like ``"every 5m"`` to seconds.
@@ -194,48 +326,75 @@ def parse_schedule(spec: str) -> int:
     """
     spec = spec.strip().lower()
 
-    # "every Nm" / "every Nh"
-    m = re.match(r"every\s+(\d+)\s*m(?:in(?:ute)?s?)?$", spec)
+    # "daily HH:MM" → treat as once per day
+    if spec.startswith(("daily", "cron")):
+        return 86400
+
+    if not spec.startswith("every"):
+        return 0
+
+    # Fast path for the canonical "every 5m" / "every 1h" form
+    rest = spec[6:].lstrip() if spec[5:6] == " " else ""
+    num, unit = rest[:-1], rest[-1:]
+    if num.isascii() and num.isdigit():
+        if unit == "m":
+            return int(num) * 60
+        if unit == "h":
+            return int(num) * 3600
+
+    # Spelled-out units: "every 10 minutes", "every 2 hours"
+    m = _EVERY_M_RE.match(spec)
     if m:
         return int(m.group(1)) * 60
 
-    m = re.match(r"every\s+(\d+)\s*h(?:ours?)?$", spec)
+    m = _EVERY_H_RE.match(spec)
     if m:
         return int(m.group(1)) * 3600
 
-    # "daily HH:MM" → treat as once per day
-    if spec.startswith("daily") or spec.startswith("cron"):
-        return 86400
-
     return 0
 
 
 # ─── Handler loader ───────────────────────────────────────────────────────
 
 
+# Imported handler modules keyed by resolved path → (st_mtime_ns, module).
+# Handler keys that share a file import it once; an edited file is reloaded.
+_MODULE_CACHE: dict[Path, tuple[int, Any]] = {}
+
+
 def _load_handler(skill_path: Path, handler_relpath: str) -> Any:
     """Import a handler module and return its ``handle`` function.
 
     Returns ``None`` on failure.
     """
     handler_file = skill_path / handler_relpath
-    if not handler_file.exists():
+    try:
+        abs_path = handler_file.resolve()
+        mtime = abs_path.stat().st_mtime_ns
+    except OSError:
         logger.warning(f"Handler not found: {handler_file}")
         return None
 
-    module_name = f"skill_handler_{skill_path.name}_{handler_file.stem}"
-    try:
-        spec = importlib.util.spec_from_file_location(module_name, handler_file)
-        if spec and spec.loader:
+    cached = _MODULE_CACHE.get(abs_path)
+    if cached is not None and cached[0] == mtime:
+        module = cached[1]
+    else:
+        module_name = f"skill_handler_{skill_path.name}_{handler_file.stem}"
+        try:
+            spec = importlib.util.spec_from_file_location(module_name, abs_path)
+            if not (spec and spec.loader):
+                return None
             module = importlib.util.module_from_spec(spec)
             spec.loader.exec_module(module)
-            handle_fn = getattr(module, "handle", None)
-            if handle_fn is None:
-                logger.warning(f"Handler {handler_file} has no 'handle' function")
-            return handle_fn
-    except Exception as e:
-        logger.error(f"Failed to load handler {handler_file}: {e}")
-    return None
+        except Exception as e:
+            logger.error(f"Failed to load handler {handler_file}: {e}")
+            return None
+        _MODULE_CACHE[abs_path] = (mtime, module)
+
+    handle_fn = getattr(module, "handle", None)
+    if handle_fn is None:
+        logger.warning(f"Handler {handler_file} has no 'handle' function")
+    return handle_fn
 
 
 # ─── Skill Runtime ────────────────────────────────────────────────────────
@@ -276,14 +435,36 @@ class SkillRuntime:
         self._sandbox_timeout = sandbox_timeout
 
         self._skills: dict[str, SkillManifest] = {}  # name → manifest
-        self._handlers_cache: dict[str, Any] = {}  # "name:handler_key" → fn
+        self._handlers_cache: dict[tuple[str, str], Any] = {}  # (name, handler_key) → fn
+        self._context_cache: dict[str, list[SkillContext]] = {}  # name → idle ctxs
         self._running = False
 
-        # Schedule tracking: skill_name → {trigger_value: last_run_ts}
-        self._schedule_last_run: dict[str, dict[str, float]] = {}
+        # Dispatch indexes over *enabled* skills (see ``_rebuild_indexes``)
+        self._ask_skills: list[tuple[SkillManifest, list[SkillTrigger]]] = []
+        self._ask_master_re: re.Pattern[str] | None = None
+        # Skills with on_ask triggers the master regex cannot cover
+        self._ask_fallback_skills: list[tuple[SkillManifest, list[SkillTrigger]]] = []
+        # event type → immutable subscriber snapshot (replaced, never mutated)
+        self._event_skills: dict[str, tuple[tuple[SkillManifest, SkillTrigger], ...]] = {}
+
+        # match_ask memoisation (see ``_ASK_CACHE_SIZE``)
+        self._ask_match_cache: OrderedDict[str, tuple[SkillManifest, ...]] = OrderedDict()
+        self._ask_result_cache: OrderedDict[tuple[str, str], tuple[float, Any]] = OrderedDict()
+
+        # Schedule min-heap of (next_due_monotonic, seq, skill_name, trigger);
+        # seq breaks ties so triggers themselves are never compared.
+        self._schedule_heap: list[tuple[float, int, str, SkillTrigger]] = []
+        self._schedule_seq = itertools.count()
+        # Set to cut run()'s sleep short (new triggers queued, stop requested)
+        self._wake_event = asyncio.Event()
+
+        # Parsed manifests keyed by path, reused while st_mtime_ns is unchanged
+        self._manifest_cache: dict[Path, tuple[int, SkillManifest]] = {}
 
         # Per-skill Python executable (venv-aware)
         self._skill_python: dict[str, str] = {}  # skill_name → python path
+        # Venvs still being built in the background, awaited before launch
+        self._venv_tasks: dict[str, asyncio.Task] = {}
 
     # ──────────────────────────────────────────────────────────
     # Discovery
@@ -301,7 +482,7 @@ class SkillRuntime:
             for child in sorted(d.iterdir()):
                 yaml_path = child / "skill.yaml"
                 if yaml_path.is_file():
-                    manifest = parse_manifest(yaml_path)
+                    manifest = self._load_manifest(yaml_path)
                     if manifest and manifest.name not in self._skills:
                         self._skills[manifest.name] = manifest
                         found.append(manifest)
@@ -313,6 +494,20 @@ class SkillRuntime:
                         if manifest.dependencies:
                             self._ensure_skill_venv(manifest)
 
+        # Queue schedule triggers — first run is due immediately
+        now = time.monotonic()
+        for manifest in found:
+            seen: set[str] = set()
+            for trigger in manifest.schedule_triggers:
+                if trigger.interval_s <= 0 or trigger.value in seen:
+                    continue
+                seen.add(trigger.value)
+                heapq.heappush(
+                    self._schedule_heap,
+                    (now, next(self._schedule_seq), manifest.name, trigger),
+                )
+                self._wake_event.set()
+
         # Wire on_event triggers to the event bus
         for manifest in found:
             for trigger in manifest.event_triggers:
@@ -321,8 +516,64 @@ class SkillRuntime:
                     self._make_event_callback(manifest, trigger),
                 )
 
+        # Import in-process handlers now so the first trigger match (notably
+        # the user-facing match_ask) does not pay module import latency.
+        # Sandboxed handlers must never be imported into the core process.
+        if not self._sandbox_enabled:
+            for manifest in found:
+                for handler_key in manifest.handlers:
+                    self._resolve_handler(manifest, handler_key)
+
+        if found:
+            self._rebuild_indexes()
         return found
 
+    def _load_manifest(self, yaml_path: Path) -> SkillManifest | None:
+        """Parse *yaml_path*, reusing the cached manifest if the file is unchanged."""
+        try:
+            mtime = yaml_path.stat().st_mtime_ns
+        except OSError:
+            return None
+        cached = self._manifest_cache.get(yaml_path)
+        if cached is not None and cached[0] == mtime:
+            return cached[1]
+        manifest = parse_manifest(yaml_path)
+        if manifest is not None:
+            self._manifest_cache[yaml_path] = (mtime, manifest)
+        return manifest
+
+    def _rebuild_indexes(self) -> None:
+        """Rebuild the on_ask / on_event dispatch indexes from enabled skills."""
+        ask_skills: list[tuple[SkillManifest, list[SkillTrigger]]] = []
+        event_skills: dict[str, tuple[tuple[SkillManifest, SkillTrigger], ...]] = {}
+        for manifest in self._skills.values():
+            if not manifest.enabled:
+                continue
+            if manifest.ask_triggers:
+                ask_skills.append((manifest, manifest.ask_triggers))
+            for trigger in manifest.event_triggers:
+                subs = event_skills.get(trigger.value, ())
+                # One dispatch per skill per event type
+                if not subs or subs[-1][0] is not manifest:
+                    event_skills[trigger.value] = subs + ((manifest, trigger),)
+        # Swap in whole new containers so an in-flight dispatch keeps
+        # iterating the snapshot it started with — no locking needed.
+        self._ask_skills = ask_skills
+        self._event_skills = event_skills
+
+        master, merged = _build_ask_master(
+            [t for _m, triggers in ask_skills for t in triggers]
+        )
+        self._ask_master_re = master
+        fallback: list[tuple[SkillManifest, list[SkillTrigger]]] = []
+        for manifest, triggers in ask_skills:
+            rest = [t for t in triggers if id(t) not in merged]
+            if rest:
+                fallback.append((manifest, rest))
+        self._ask_fallback_skills = fallback
+        self._ask_match_cache.clear()
+        self._ask_result_cache.clear()
+
     @property
     def skills(self) -> dict[str, SkillManifest]:
         """All registered Skills keyed by name."""
@@ -333,7 +584,10 @@ class SkillRuntime:
         manifest = self._skills.get(name)
         if manifest is None:
             return False
-        manifest.enabled = enabled
+        if manifest.enabled != enabled:
+            manifest.enabled = enabled
+            self._context_cache.pop(name, None)
+            self._rebuild_indexes()
         return True
 
     def has_skill(self, name: str) -> bool:
@@ -349,10 +603,21 @@ class SkillRuntime:
     # ──────────────────────────────────────────────────────────
 
     def _make_context(self, manifest: SkillManifest) -> SkillContext:
-        """Create a SkillContext for *manifest* with its declared permissions."""
+        """Return an idle SkillContext for *manifest*, or a new one.
+
+        Core service references never change over the runtime's lifetime,
+        so contexts handed back via ``_release_context`` are reused;
+        ``reset()`` drops the state left over from the previous invocation.
+        A context is never shared by invocations that overlap.
+        """
+        idle = self._context_cache.get(manifest.name)
+        if idle:
+            ctx = idle.pop()
+            ctx.reset()
+            return ctx
         return SkillContext(
             skill_name=manifest.name,
-            permissions=set(manifest.permissions),
+            permissions=frozenset(manifest.permissions),
             db=self._db,
             memory=self._memory,
             knowledge_graph=self._kg,
@@ -362,6 +627,12 @@ class SkillRuntime:
             llm_router=self._llm_router,
         )
 
+    def _release_context(self, manifest: SkillManifest, ctx: SkillContext) -> None:
+        """Hand *ctx* back for reuse once its invocation has finished."""
+        idle = self._context_cache.setdefault(manifest.name, [])
+        if len(idle) < _MAX_IDLE_CONTEXTS:
+            idle.append(ctx)
+
     # ──────────────────────────────────────────────────────────
     # Handler resolution + invocation
     # ──────────────────────────────────────────────────────────
@@ -371,9 +642,10 @@ class SkillRuntime:
 
         *handler_key* is one of ``"schedule"``, ``"on_ask"``, ``"on_event"``.
         """
-        cache_key = f"{manifest.name}:{handler_key}"
-        if cache_key in self._handlers_cache:
-            return self._handlers_cache[cache_key]
+        cache_key = (manifest.name, handler_key)
+        fn = self._handlers_cache.get(cache_key)
+        if fn is not None:
+            return fn
 
         relpath = manifest.handlers.get(handler_key)
         if not relpath:
@@ -422,6 +694,8 @@ class SkillRuntime:
                 f"Skill '{manifest.name}' handler '{handler_key}' failed: {e}"
             )
             return None
+        finally:
+            self._release_context(manifest, ctx)
 
     async def _invoke_handler_sandboxed(
         self,
@@ -437,6 +711,9 @@ class SkillRuntime:
         if not handler_relpath:
             return None
 
+        venv_task = self._venv_tasks.get(manifest.name)
+        if venv_task is not None:
+            self._skill_python[manifest.name] = await asyncio.shield(venv_task)
         python_exec = self._skill_python.get(manifest.name)
 
         try:
@@ -475,11 +752,31 @@ class SkillRuntime:
     # ──────────────────────────────────────────────────────────
 
     def _ensure_skill_venv(self, manifest: SkillManifest) -> None:
-        """Create a per-skill venv if the skill declares dependencies."""
+        """Create a per-skill venv if the skill declares dependencies.
+
+        Inside a running loop the (possibly minutes-long) pip install runs
+        as a background task instead of stalling discovery.
+        """
         from omnibrain.skill_sandbox import ensure_skill_venv
 
-        python_path = ensure_skill_venv(manifest.path, manifest.dependencies)
-        self._skill_python[manifest.name] = python_path
+        setup = ensure_skill_venv(manifest.path, manifest.dependencies)
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            self._skill_python[manifest.name] = asyncio.run(setup)
+            return
+
+        name = manifest.name
+        task = loop.create_task(setup)
+        self._venv_tasks[name] = task
+
+        def _done(t: asyncio.Task) -> None:
+            if self._venv_tasks.get(name) is t:
+                del self._venv_tasks[name]
+            if not t.cancelled() and t.exception() is None:
+                self._skill_python[name] = t.result()
+
+        task.add_done_callback(_done)
 
     # ──────────────────────────────────────────────────────────
     # Public trigger APIs
@@ -489,75 +786,114 @@ class SkillRuntime:
         """Match *user_message* against all on_ask triggers.
 
         Returns list of ``{"skill": name, "result": handler_return}``.
-        Invokes every matching Skill's ``on_ask`` handler.
+        Invokes every matching Skill's ``on_ask`` handler concurrently.
+
+        Which skills match a message is memoised (bounded LRU), so a
+        repeated message skips the regex pass.  Handlers always re-run,
+        except for skills declaring ``pure: true`` whose result for the
+        same message is reused for ``_ASK_RESULT_TTL_S`` seconds.
         """
-        results: list[dict[str, Any]] = []
-        for manifest in self._skills.values():
+        if not self._ask_skills:
+            return []
+
+        matched = self._match_ask_skills(user_message)
+        if not matched:
+            return []
+
+        now = time.monotonic()
+        results: dict[str, Any] = {}
+        pending: list[SkillManifest] = []
+        for manifest in matched:
+            hit = self._ask_result_cache.get((manifest.name, user_message)) if manifest.pure else None
+            if hit is not None and now - hit[0] < _ASK_RESULT_TTL_S:
+                results[manifest.name] = hit[1]
+            else:
+                pending.append(manifest)
+
+        outcomes = await asyncio.gather(
+            *(self._invoke_handler(m, "on_ask", user_message) for m in pending),
+            return_exceptions=True,
+        )
+        for manifest, result in zip(pending, outcomes, strict=True):
+            if isinstance(result, BaseException):
+                result = None
+            elif manifest.pure:
+                _lru_put(self._ask_result_cache, (manifest.name, user_message), (now, result))
+            results[manifest.name] = result
+
+        return [{"skill": m.name, "result": results[m.name]} for m in matched]
+
+    def _match_ask_skills(self, user_message: str) -> list[SkillManifest]:
+        """Return the enabled skills with an on_ask trigger matching *user_message*."""
+        cached = self._ask_match_cache.get(user_message)
+        if cached is not None:
+            self._ask_match_cache.move_to_end(user_message)
+            return [m for m in cached if m.enabled]
+
+        candidates = self._ask_skills
+        master = self._ask_master_re
+        if master is not None and master.search(user_message) is None:
+            # One pass ruled out every merged pattern
+            candidates = self._ask_fallback_skills
+
+        matched: list[SkillManifest] = []
+        for manifest, ask_triggers in candidates:
             if not manifest.enabled:
                 continue
-            for trigger in manifest.ask_triggers:
+            for trigger in ask_triggers:
                 if trigger.matches_ask(user_message):
-                    result = await self._invoke_handler(
-                        manifest, "on_ask", user_message
-                    )
-                    results.append({
-                        "skill": manifest.name,
-                        "result": result,
-                    })
+                    matched.append(manifest)
                     break  # one match per Skill is enough
-        return results
+        _lru_put(self._ask_match_cache, user_message, tuple(matched))
+        return matched
 
     async def handle_event(self, event_type: str, data: dict[str, Any]) -> int:
         """Dispatch *event_type* to matching on_event handlers.
 
-        Returns the number of Skills that handled the event.
+        Handlers run concurrently.  Returns the number of Skills that
+        handled the event.
         """
-        count = 0
-        for manifest in self._skills.values():
-            if not manifest.enabled:
-                continue
-            for trigger in manifest.event_triggers:
-                if trigger.matches_event(event_type):
-                    await self._invoke_handler(
-                        manifest, "on_event", data
-                    )
-                    count += 1
-                    break
-        return count
+        subs = self._event_skills.get(event_type)
+        if not subs:
+            return 0
+        targets = [manifest for manifest, _trigger in subs if manifest.enabled]
+        await asyncio.gather(
+            *(self._invoke_handler(m, "on_event", data) for m in targets),
+            return_exceptions=True,
+        )
+        return len(targets)
 
     async def tick(self) -> int:
-        """Check all schedule triggers and invoke due handlers.
+        """Invoke handlers for every schedule trigger that is due.
 
-        Returns the number of handlers invoked.
+        Only due entries are popped from the schedule heap; each is pushed
+        back with its next due time.  Returns the number of handlers invoked.
         """
-        import time
-
-        now = time.time()
+        now = time.monotonic()
         invoked = 0
+        heap = self._schedule_heap
 
-        for manifest in self._skills.values():
+        while heap and heap[0][0] <= now:
+            _due, _seq, name, trigger = heapq.heappop(heap)
+            manifest = self._skills.get(name)
+            if manifest is None:
+                continue
+            heapq.heappush(
+                heap, (now + trigger.interval_s, next(self._schedule_seq), name, trigger),
+            )
             if not manifest.enabled:
                 continue
-
-            skill_schedule = self._schedule_last_run.setdefault(manifest.name, {})
-
-            for trigger in manifest.schedule_triggers:
-                interval = parse_schedule(trigger.value)
-                if interval <= 0:
-                    continue
-
-                last = skill_schedule.get(trigger.value, 0.0)
-                if now - last >= interval:
-                    await self._invoke_handler(manifest, "schedule")
-                    skill_schedule[trigger.value] = now
-                    invoked += 1
+            await self._invoke_handler(manifest, "schedule")
+            invoked += 1
 
         return invoked
 
     async def run(self) -> None:
-        """Long-lived loop: call ``tick()`` every 30 seconds."""
-        import asyncio
+        """Long-lived loop: run due triggers, then sleep until the next one.
 
+        The loop wakes early when ``discover()`` queues new schedule
+        triggers or ``stop()`` is called.
+        """
         self._running = True
         logger.info(
             f"SkillRuntime started — {len(self._skills)} skills loaded"
@@ -566,7 +902,7 @@ class SkillRuntime:
         while self._running:
             try:
                 await self.tick()
-                await asyncio.sleep(30)
+                await self._wait_for_next_due()
             except asyncio.CancelledError:
                 break
             except Exception as e:
@@ -575,8 +911,22 @@ class SkillRuntime:
 
         logger.info("SkillRuntime stopped")
 
+    async def _wait_for_next_due(self) -> None:
+        """Sleep until the earliest schedule trigger is due, or until woken."""
+        if self._schedule_heap:
+            timeout = max(0.0, self._schedule_heap[0][0] - time.monotonic())
+        else:
+            timeout = _IDLE_SLEEP_S
+        if self._running:
+            try:
+                await asyncio.wait_for(self._wake_event.wait(), timeout=timeout)
+            except TimeoutError:
+                pass
+        self._wake_event.clear()
+
     async def stop(self) -> None:
         self._running = False
+        self._wake_event.set()
 
     # ──────────────────────────────────────────────────────────
     # Internal: event bus callback factory
@@ -10,16 +10,20 @@ Architecture::
     Main Process (daemon)
     │
     ├── SkillRuntime._invoke_handler_sandboxed()
-    │   ├── subprocess.Popen(["python", "-m", "omnibrain.skill_sandbox", ...])
+    │   ├── SandboxPool → warm ["python", "-m", "omnibrain.skill_sandbox"] worker
+    │   ├── {"invoke": ...} frame → worker runs one handler call
     │   ├── stdin → JSON-RPC requests from subprocess (memory_search, notify, etc.)
-    │   └── stdout → JSON-RPC responses from main process
+    │   ├── stdout → JSON-RPC responses from main process
+    │   └── result pipe (OMNIBRAIN_RESULT_FD) → the handler's final result
     │
     Subprocess (this module)
     │
     ├── SkillContextProxy (implements SkillContext interface)
     │   └── Every method → JSON-RPC call to parent via stdin/stdout
+    │       (4-byte big-endian length prefix + JSON payload per message)
+    ├── _RpcChannel reader thread → responses matched to callers by id
     ├── Import handler module
-    └── Call handle(ctx_proxy, *args, **kwargs)
+    └── Call handle(ctx_proxy, *args, **kwargs), then wait for the next invoke
 
 Security boundaries:
     - Subprocess has no direct access to DB, memory, or LLM router
@@ -31,17 +35,43 @@ Security boundaries:
 from __future__ import annotations
 
 import asyncio
+import contextlib
+import hashlib
 import importlib.util
 import json
 import logging
 import os
+import queue
+import struct
 import subprocess
 import sys
+import threading
+import time
+from collections.abc import AsyncIterator, Awaitable, Callable
 from pathlib import Path
 from typing import Any
 
 logger = logging.getLogger("omnibrain.skill_sandbox")
 
+# orjson (optional, ``pip install omnibrain[fast]``) encodes straight to
+# bytes and is several times faster than the stdlib codec on the bridge.
+try:
+    import orjson
+
+    def _dumps(obj: Any) -> bytes:
+        try:
+            return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS)
+        except TypeError:
+            # e.g. ints beyond 64 bits — let the stdlib codec decide
+            return json.dumps(obj).encode()
+
+    _loads = orjson.loads
+except ImportError:
+    def _dumps(obj: Any) -> bytes:
+        return json.dumps(obj).encode()
+
+    _loads = json.loads
+
 
 # ═══════════════════════════════════════════════════════════════════════════
 # JSON-RPC Protocol Constants
@@ -65,6 +95,139 @@ ALLOWED_METHODS = {
     RPC_GET_PREFERENCE, RPC_LOG, RPC_EMIT_EVENT,
 }
 
+# Methods the proxy sends as JSON-RPC notifications (no ``id``, no reply).
+# They are queued and flushed together with the next round trip.
+FIRE_AND_FORGET_METHODS = frozenset({RPC_LOG, RPC_NOTIFY, RPC_EMIT_EVENT})
+
+# Maximum entries accepted in one JSON-RPC batch array
+MAX_BATCH_SIZE = 50
+
+
+_RATE_LIMITED = {"code": -32000, "message": "Rate limit exceeded"}
+_BATCH_LIMITED = {"code": -32600, "message": "Batch limit exceeded"}
+
+# (request id, result, error) — what the bridge decided for one request,
+# before it is shaped into a response dict or encoded for the pipe
+_Outcome = tuple[Any, Any, dict[str, Any] | None]
+
+
+def _response_dict(req_id: Any, result: Any, error: dict[str, Any] | None) -> dict[str, Any]:
+    if error is not None:
+        return {"id": req_id, "error": error}
+    return {"id": req_id, "result": result}
+
+
+def _response_bytes(req_id: Any, result: Any, error: dict[str, Any] | None) -> bytes:
+    """Encode a response around the result, with no wrapper dict."""
+    if type(req_id) is int:
+        head = b'{"id":%d,' % req_id
+    else:
+        head = b'{"id":' + _dumps(req_id) + b","
+    if error is not None:
+        return head + b'"error":' + _dumps(error) + b"}"
+    return head + b'"result":' + _dumps(result) + b"}"
+
+
+def _error_payload(msg: Any, error: dict[str, Any]) -> bytes | None:
+    """Encoded error response(s) for every entry in *msg* that carries an id."""
+    if isinstance(msg, list):
+        errors = [_response_bytes(r["id"], None, error) for r in msg if isinstance(r, dict) and "id" in r]
+        return b"[" + b",".join(errors) + b"]" if errors else None
+    if isinstance(msg, dict) and "id" in msg:
+        return _response_bytes(msg["id"], None, error)
+    return None
+
+
+def _rpc_head(method: str, *, with_id: bool) -> bytes:
+    """Encoded request prefix up to ``"params":`` (``%d`` marks the id)."""
+    name = json.dumps(method).encode()
+    if not with_id:
+        return b'{"jsonrpc":"2.0","method":' + name + b',"params":'
+    return b'{"jsonrpc":"2.0","id":%d,"method":' + name.replace(b"%", b"%%") + b',"params":'
+
+
+# Pre-encoded prefixes, so the proxy only serializes each call's params
+_RPC_REQUEST_HEADS = {m: _rpc_head(m, with_id=True) for m in ALLOWED_METHODS}
+_RPC_NOTIFICATION_HEADS = {m: _rpc_head(m, with_id=False) for m in FIRE_AND_FORGET_METHODS}
+
+
+# ═══════════════════════════════════════════════════════════════════════════
+# Framing
+# ═══════════════════════════════════════════════════════════════════════════
+
+# Every message on the pipes is a 4-byte big-endian length + JSON payload,
+# so readers pull whole messages with one exact-size read instead of
+# scanning for newlines.
+_FRAME_HEADER = struct.Struct(">I")
+
+# Bytes requested per read on the main-process side
+_READ_CHUNK = 65536
+
+# Linux pipes default to 64 KB; large LLM payloads move in fewer syscalls
+# with a 1 MB pipe.
+_PIPE_SIZE = 1 << 20
+
+
+def _write_frame(f: Any, payload: bytes) -> None:
+    """Write one length-prefixed frame to a binary stream or StreamWriter."""
+    f.write(_FRAME_HEADER.pack(len(payload)) + payload)
+
+
+async def _iter_frames(reader: asyncio.StreamReader) -> AsyncIterator[bytes]:
+    """Yield frames from *reader* until EOF.
+
+    Pulls up to ``_READ_CHUNK`` bytes per await and splits every complete
+    frame out of the buffer, so a burst of small messages costs one read
+    rather than two ``readexactly`` awaits each.
+    """
+    header = _FRAME_HEADER.size
+    buf = bytearray()
+    while True:
+        chunk = await reader.read(_READ_CHUNK)
+        if not chunk:
+            return
+        buf += chunk
+        pos = 0
+        while len(buf) - pos >= header:
+            end = pos + header + _FRAME_HEADER.unpack_from(buf, pos)[0]
+            if len(buf) < end:
+                break
+            yield bytes(buf[pos + header:end])
+            pos = end
+        if pos:
+            del buf[:pos]
+
+
+async def _read_frame(reader: asyncio.StreamReader) -> bytes:
+    """Read exactly one frame; IncompleteReadError at EOF."""
+    header = await reader.readexactly(_FRAME_HEADER.size)
+    return await reader.readexactly(_FRAME_HEADER.unpack(header)[0])
+
+
+def _read_frame_sync(f: Any) -> bytes | None:
+    """Read one frame from a blocking binary stream; None at EOF."""
+    header = f.read(_FRAME_HEADER.size)
+    if len(header) < _FRAME_HEADER.size:
+        return None
+    size = _FRAME_HEADER.unpack(header)[0]
+    payload = f.read(size)
+    if len(payload) < size:
+        return None
+    return payload
+
+
+def _grow_pipe(fd: int) -> None:
+    """Enlarge a pipe's kernel buffer (Linux only, best-effort)."""
+    try:
+        import fcntl
+    except ImportError:
+        return
+    if hasattr(fcntl, "F_SETPIPE_SZ"):
+        try:
+            fcntl.fcntl(fd, fcntl.F_SETPIPE_SZ, _PIPE_SIZE)
+        except OSError:
+            pass  # Over /proc/sys/fs/pipe-max-size or not a pipe
+
 
 # ═══════════════════════════════════════════════════════════════════════════
 # Sandbox Bridge (Main Process Side)
@@ -116,149 +279,568 @@ class SkillSandboxBridge:
         self._config = config
         self._event_bus = event_bus
         self._llm_router = llm_router
-        self._call_count = 0
         self._max_calls_per_invocation = 100
+        # Calls left in this invocation's budget; batches reserve their
+        # share up front so gathered entries don't touch the counter.
+        self._remaining = self._max_calls_per_invocation
+
+        # Permission decisions are fixed for the bridge's lifetime, so
+        # resolve them once: allowed methods, and a ready-made error for
+        # every denied one.
+        self._allowed: frozenset[str] = frozenset(
+            method for method, required in self.PERMISSION_MAP.items()
+            if required is None or required in permissions
+        )
+        self._denied: dict[str, dict[str, Any]] = {
+            method: {
+                "code": -32001,
+                "message": f"Permission denied: {method} requires {required}",
+            }
+            for method, required in self.PERMISSION_MAP.items()
+            if method not in self._allowed
+        }
+        self._handlers = self._build_handlers()
 
     def check_permission(self, method: str) -> bool:
         """Check if the skill has permission for this RPC method."""
-        required = self.PERMISSION_MAP.get(method)
-        if required is None:
-            return True  # No permission required (e.g., log)
-        return required in self.permissions
+        if method in self._allowed:
+            return True
+        # Unknown methods have no mapping and were always let through
+        return method not in self.PERMISSION_MAP
 
-    async def handle_rpc(self, request: dict[str, Any]) -> dict[str, Any]:
+    async def handle_rpc(
+        self,
+        request: dict[str, Any],
+        send: Callable[[dict[str, Any]], Awaitable[None]] | None = None,
+    ) -> dict[str, Any]:
         """Process a single JSON-RPC request from the subprocess.
 
-        Returns a JSON-RPC response dict.
+        Returns a JSON-RPC response dict.  When *send* is given, an
+        ``llm_complete`` request with ``"stream": true`` is answered with
+        ``{"id", "partial"}`` messages as chunks arrive, and the returned
+        response closes the stream with ``"result": None``.
         """
+        return _response_dict(*await self._process(request, send))
+
+    async def handle_rpc_raw(
+        self,
+        request: dict[str, Any],
+        send: Callable[[dict[str, Any]], Awaitable[None]] | None = None,
+    ) -> bytes:
+        """Like ``handle_rpc`` but returns the encoded response, ready for
+        the pipe, without building an intermediate response dict."""
+        return _response_bytes(*await self._process(request, send))
+
+    async def handle_batch(self, requests: list[dict[str, Any]]) -> list[dict[str, Any]]:
+        """Process a JSON-RPC batch array concurrently.
+
+        Returns responses for entries carrying an ``id``; notifications
+        get none.  Entries beyond ``MAX_BATCH_SIZE`` are rejected.
+        """
+        return [_response_dict(*o) for o in await self._process_batch(requests)]
+
+    async def handle_batch_raw(self, requests: list[dict[str, Any]]) -> bytes | None:
+        """Encoded counterpart of ``handle_batch``; None if nothing to send."""
+        outcomes = await self._process_batch(requests)
+        if not outcomes:
+            return None
+        return b"[" + b",".join(_response_bytes(*o) for o in outcomes) + b"]"
+
+    async def _process(
+        self,
+        request: dict[str, Any],
+        send: Callable[[dict[str, Any]], Awaitable[None]] | None = None,
+    ) -> _Outcome:
+        # Rate limit
+        if self._remaining <= 0:
+            return request.get("id", 0), None, _RATE_LIMITED
+        self._remaining -= 1
+        return await self._process_reserved(request, send)
+
+    async def _process_reserved(
+        self,
+        request: dict[str, Any],
+        send: Callable[[dict[str, Any]], Awaitable[None]] | None = None,
+    ) -> _Outcome:
+        """Handle a request whose rate-limit slot is already taken."""
         method = request.get("method", "")
         params = request.get("params", {})
         req_id = request.get("id", 0)
 
-        # Rate limit
-        self._call_count += 1
-        if self._call_count > self._max_calls_per_invocation:
-            return {
-                "id": req_id,
-                "error": {"code": -32000, "message": "Rate limit exceeded"},
-            }
-
         # Permission check
-        if not self.check_permission(method):
-            return {
-                "id": req_id,
-                "error": {
-                    "code": -32001,
-                    "message": f"Permission denied: {method} requires "
-                               f"{self.PERMISSION_MAP.get(method, 'unknown')}",
-                },
-            }
+        denied = self._denied.get(method)
+        if denied is not None:
+            return req_id, None, denied
 
         try:
-            result = await self._dispatch(method, params)
-            return {"id": req_id, "result": result}
+            if (
+                send is not None
+                and method == RPC_LLM_COMPLETE
+                and params.get("stream")
+                and RPC_LLM_COMPLETE in self._handlers
+            ):
+                async for chunk in self._llm_router.stream(params.get("messages", [])):
+                    if chunk.content:
+                        await send({"id": req_id, "partial": chunk.content})
+                return req_id, None, None
+            return req_id, await self._dispatch(method, params), None
         except Exception as e:
-            return {
-                "id": req_id,
-                "error": {"code": -32603, "message": str(e)[:500]},
-            }
+            return req_id, None, {"code": -32603, "message": str(e)[:500]}
+
+    async def _process_batch(self, requests: list[dict[str, Any]]) -> list[_Outcome]:
+        requests = [r for r in requests if isinstance(r, dict)]
+        accepted = requests[:MAX_BATCH_SIZE]
+
+        # Reserve the batch's rate-limit slots in one step; entries past
+        # the remaining budget are refused without being dispatched.
+        granted = min(len(accepted), max(self._remaining, 0))
+        self._remaining -= granted
+        outcomes = await asyncio.gather(
+            *[self._process_reserved(r) for r in accepted[:granted]]
+        )
+        outcomes += [(r.get("id", 0), None, _RATE_LIMITED) for r in accepted[granted:]]
+
+        out = [o for req, o in zip(accepted, outcomes, strict=True) if "id" in req]
+        out += [
+            (req["id"], None, _BATCH_LIMITED)
+            for req in requests[MAX_BATCH_SIZE:] if "id" in req
+        ]
+        return out
 
     async def _dispatch(self, method: str, params: dict[str, Any]) -> Any:
         """Dispatch an RPC call to the appropriate core service."""
-        if method == RPC_MEMORY_SEARCH:
-            if self._memory:
-                results = self._memory.search(
-                    params.get("query", ""),
-                    max_results=params.get("max_results", 10),
-                )
-                return [{"text": r.text, "source": r.source, "score": r.score} for r in results]
-            return []
+        handler = self._handlers.get(method)
+        if handler is not None:
+            return await handler(params)
+        # Allowed method whose backing service isn't wired
+        fallback = self._NO_BACKEND.get(method)
+        return fallback() if fallback is not None else None
+
+    def _build_handlers(self) -> dict[str, Any]:
+        """Map each RPC method to a bound handler, for live services only."""
+        handlers: dict[str, Any] = {RPC_LOG: self._do_log}
+        if self._memory:
+            handlers[RPC_MEMORY_SEARCH] = self._do_memory_search
+            handlers[RPC_MEMORY_STORE] = self._do_memory_store
+        if self._event_bus:
+            handlers[RPC_NOTIFY] = self._do_notify
+            handlers[RPC_EMIT_EVENT] = self._do_emit_event
+        if self._db:
+            handlers[RPC_PROPOSE] = self._do_propose
+            handlers[RPC_GET_EVENTS] = self._do_get_events
+            handlers[RPC_GET_CONTACTS] = self._do_get_contacts
+            handlers[RPC_GET_PREFERENCE] = self._do_get_preference
+        if self._llm_router:
+            handlers[RPC_LLM_COMPLETE] = self._do_llm_complete
+        return handlers
+
+    # Result when the service behind a method isn't wired (factories, so
+    # callers never share a mutable default).  Missing → None.
+    _NO_BACKEND = {
+        RPC_MEMORY_SEARCH: list,
+        RPC_MEMORY_STORE: bool,
+        RPC_NOTIFY: lambda: True,
+        RPC_PROPOSE: bool,
+        RPC_LLM_COMPLETE: str,
+        RPC_GET_EVENTS: list,
+        RPC_GET_CONTACTS: list,
+        RPC_EMIT_EVENT: lambda: True,
+    }
 
-        elif method == RPC_MEMORY_STORE:
-            if self._memory:
-                self._memory.store(
-                    text=params.get("text", ""),
-                    source=f"skill:{self.skill_name}",
-                    source_type=params.get("source_type", "skill_data"),
-                )
-                return True
-            return False
-
-        elif method == RPC_NOTIFY:
-            # Notifications go through event bus to reach frontend
-            if self._event_bus:
-                self._event_bus.publish("notification", {
-                    "skill": self.skill_name,
-                    "level": params.get("level", "fyi"),
-                    "title": params.get("title", ""),
-                    "message": params.get("message", ""),
-                })
-            return True
+    async def _do_memory_search(self, params: dict[str, Any]) -> Any:
+        results = self._memory.search(
+            params.get("query", ""),
+            max_results=params.get("max_results", 10),
+        )
+        return [{"text": r.text, "source": r.source, "score": r.score} for r in results]
 
-        elif method == RPC_PROPOSE:
-            if self._db:
-                self._db.create_proposal(
-                    type=params.get("type", "skill_action"),
-                    title=params.get("title", ""),
-                    description=params.get("description", ""),
-                    action_data=json.dumps(params.get("action_data", {})),
-                    priority=params.get("priority", 2),
-                )
-                return True
-            return False
-
-        elif method == RPC_LLM_COMPLETE:
-            if self._llm_router:
-                messages = params.get("messages", [])
-                result_parts = []
-                async for chunk in self._llm_router.stream(messages):
-                    if chunk.content:
-                        result_parts.append(chunk.content)
-                return "".join(result_parts)
-            return ""
-
-        elif method == RPC_GET_EVENTS:
-            if self._db:
-                events = self._db.get_events(
-                    limit=params.get("limit", 50),
-                    source=params.get("source", ""),
-                )
-                return events
-            return []
+    async def _do_memory_store(self, params: dict[str, Any]) -> Any:
+        self._memory.store(
+            text=params.get("text", ""),
+            source=f"skill:{self.skill_name}",
+            source_type=params.get("source_type", "skill_data"),
+        )
+        return True
+
+    async def _do_notify(self, params: dict[str, Any]) -> Any:
+        # Notifications go through event bus to reach frontend
+        self._event_bus.publish("notification", {
+            "skill": self.skill_name,
+            "level": params.get("level", "fyi"),
+            "title": params.get("title", ""),
+            "message": params.get("message", ""),
+        })
+        return True
+
+    async def _do_propose(self, params: dict[str, Any]) -> Any:
+        self._db.create_proposal(
+            type=params.get("type", "skill_action"),
+            title=params.get("title", ""),
+            description=params.get("description", ""),
+            action_data=json.dumps(params.get("action_data", {})),
+            priority=params.get("priority", 2),
+        )
+        return True
+
+    async def _do_llm_complete(self, params: dict[str, Any]) -> Any:
+        messages = params.get("messages", [])
+        result_parts = []
+        async for chunk in self._llm_router.stream(messages):
+            if chunk.content:
+                result_parts.append(chunk.content)
+        return "".join(result_parts)
+
+    async def _do_get_events(self, params: dict[str, Any]) -> Any:
+        return self._db.get_events(
+            limit=params.get("limit", 50),
+            source=params.get("source", ""),
+        )
 
-        elif method == RPC_GET_CONTACTS:
-            if self._db:
-                contacts = self._db.get_contacts(limit=params.get("limit", 50))
-                return [c.__dict__ if hasattr(c, "__dict__") else c for c in contacts]
-            return []
+    async def _do_get_contacts(self, params: dict[str, Any]) -> Any:
+        contacts = self._db.get_contacts(limit=params.get("limit", 50))
+        # Rows are homogeneous — decide the projection once, not per row
+        if contacts and hasattr(contacts[0], "__dict__"):
+            return [c.__dict__ for c in contacts]
+        return list(contacts)
+
+    async def _do_get_preference(self, params: dict[str, Any]) -> Any:
+        return self._db.get_preference(params.get("key", ""))
+
+    async def _do_log(self, params: dict[str, Any]) -> Any:
+        level = params.get("level", "info")
+        message = params.get("message", "")
+        logger.log(
+            getattr(logging, level.upper(), logging.INFO),
+            f"[skill:{self.skill_name}] {message}",
+        )
+        return True
 
-        elif method == RPC_GET_PREFERENCE:
-            if self._db:
-                return self._db.get_preference(params.get("key", ""))
-            return None
+    async def _do_emit_event(self, params: dict[str, Any]) -> Any:
+        self._event_bus.publish(
+            params.get("event_type", "skill_event"),
+            params.get("data", {}),
+        )
+        return True
 
-        elif method == RPC_LOG:
-            level = params.get("level", "info")
-            message = params.get("message", "")
-            logger.log(
-                getattr(logging, level.upper(), logging.INFO),
-                f"[skill:{self.skill_name}] {message}",
-            )
-            return True
 
-        elif method == RPC_EMIT_EVENT:
-            if self._event_bus:
-                self._event_bus.publish(
-                    params.get("event_type", "skill_event"),
-                    params.get("data", {}),
-                )
-            return True
+# ═══════════════════════════════════════════════════════════════════════════
+# Worker Pool (Main Process — keeps sandbox subprocesses warm)
+# ═══════════════════════════════════════════════════════════════════════════
+
+# Bytecode cache for skills whose directory isn't writable
+_PYCACHE_PREFIX = os.path.join(os.path.expanduser("~"), ".omnibrain", "pycache")
+
+# CPU budget, soft and hard alike.  Skill code cannot raise a hard limit,
+# so this caps everything a worker ever runs, threads left going between
+# calls included.
+_CPU_LIMIT_S = 30
+# A worker is reused only while it has spent less CPU than this, so each
+# call it serves still has nearly the whole _CPU_LIMIT_S
+_WORKER_CPU_REUSE_S = 2.0
+# Workers are retired after this many invocations
+_WORKER_MAX_USES = 100
+_MEMORY_LIMIT = 256 * 1024 * 1024
+
+# (resource name, soft, hard) applied to every worker at launch
+_SANDBOX_RLIMITS = (
+    ("RLIMIT_AS", _MEMORY_LIMIT, _MEMORY_LIMIT),
+    ("RLIMIT_CPU", _CPU_LIMIT_S, _CPU_LIMIT_S),
+    ("RLIMIT_NOFILE", 64, 64),
+)
+
+
+def _apply_sandbox_rlimits(pid: int = 0) -> None:
+    """Apply ``_SANDBOX_RLIMITS`` to *pid*, or to this process when 0.
+
+    Best-effort: platforms without ``resource`` (or ``prlimit``, for
+    another process) are left unlimited.
+    """
+    try:
+        import resource
+
+        for name, soft, hard in _SANDBOX_RLIMITS:
+            if pid:
+                resource.prlimit(pid, getattr(resource, name), (soft, hard))
+            else:
+                resource.setrlimit(getattr(resource, name), (soft, hard))
+    except (ImportError, AttributeError, ValueError, OSError):
+        pass
+
+
+def _can_limit_from_parent() -> bool:
+    try:
+        import resource
+    except ImportError:
+        return False
+    return hasattr(resource, "prlimit")
 
+
+def _process_cpu_seconds(pid: int) -> float | None:
+    """CPU time *pid* has used so far, or None where /proc can't tell."""
+    try:
+        with open(f"/proc/{pid}/stat", "rb") as f:
+            stat = f.read()
+        # Fields after the parenthesised command name; utime and stime
+        # are fields 14 and 15 of the whole line
+        fields = stat[stat.rindex(b")") + 2:].split()
+        ticks = int(fields[11]) + int(fields[12])
+        return ticks / os.sysconf("SC_CLK_TCK")
+    except (OSError, ValueError, IndexError):
         return None
 
 
+# Serialises worker launches: each child must inherit only its own
+# result pipe, never one another launch made inheritable meanwhile.
+_SPAWN_LOCK = threading.Lock()
+
+
+def _spawn_worker(argv: list[str], env: dict[str, str]) -> tuple[subprocess.Popen, int]:
+    """Launch a worker and bind its resource limits straight away.
+
+    Returns the process and the read end of its result pipe.
+
+    Popen takes the posix_spawn path only without cwd/close_fds/pass_fds/
+    preexec_fn, so the worker chdirs into OMNIBRAIN_SKILL_DIR itself, finds
+    its result pipe through OMNIBRAIN_RESULT_FD (an inheritable fd rather
+    than pass_fds), and the limits are set from here with prlimit — before
+    the child gets past interpreter startup.  Our other fds are
+    non-inheritable (PEP 446), so close_fds=False leaks nothing.
+    """
+    with _SPAWN_LOCK:
+        result_r, result_w = os.pipe()
+        os.set_inheritable(result_w, True)
+        try:
+            popen = subprocess.Popen(
+                argv,
+                stdin=subprocess.PIPE,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.PIPE,
+                env={**env, "OMNIBRAIN_RESULT_FD": str(result_w)},
+                close_fds=False,
+            )
+        except BaseException:
+            os.close(result_r)
+            raise
+        finally:
+            os.close(result_w)
+    _grow_pipe(result_r)
+    if _can_limit_from_parent():
+        _apply_sandbox_rlimits(popen.pid)
+    return popen, result_r
+
+
+class _SandboxWorker:
+    """A live sandbox subprocess plus its bookkeeping.
+
+    The process is a plain ``subprocess.Popen`` (so CPython can launch it
+    with ``posix_spawn`` instead of forking the large daemon); its pipes
+    are wrapped in asyncio streams bound to the launching loop.  Besides
+    stdio there is a result pipe that carries only final results.
+    """
+
+    __slots__ = (
+        "popen", "reader", "writer", "results", "loop", "uses", "last_used",
+        "_result_file", "_transports", "_stderr_task",
+    )
+
+    def __init__(self, popen: subprocess.Popen, result_fd: int) -> None:
+        self.popen = popen
+        self.loop = asyncio.get_running_loop()
+        self.uses = 0
+        self.last_used = time.monotonic()
+        self.reader: asyncio.StreamReader | None = None
+        self.writer: asyncio.StreamWriter | None = None
+        self.results: asyncio.StreamReader | None = None
+        # Owns result_fd for the worker's lifetime; closed in kill()
+        self._result_file = os.fdopen(result_fd, "rb", buffering=0)  # noqa: SIM115
+        self._transports: list[asyncio.BaseTransport] = []
+        self._stderr_task: asyncio.Future | None = None
+
+    async def connect(self, skill_name: str) -> None:
+        """Attach asyncio streams to the process pipes."""
+        loop = self.loop
+        self.reader = asyncio.StreamReader(limit=_PIPE_SIZE)
+        transport, _ = await loop.connect_read_pipe(
+            lambda: asyncio.StreamReaderProtocol(self.reader), self.popen.stdout,
+        )
+        self._transports.append(transport)
+
+        transport, protocol = await loop.connect_write_pipe(
+            asyncio.streams.FlowControlMixin, self.popen.stdin,
+        )
+        self._transports.append(transport)
+        self.writer = asyncio.StreamWriter(transport, protocol, None, loop)
+
+        self.results = asyncio.StreamReader(limit=_PIPE_SIZE)
+        transport, _ = await loop.connect_read_pipe(
+            lambda: asyncio.StreamReaderProtocol(self.results), self._result_file,
+        )
+        self._transports.append(transport)
+
+        stderr = asyncio.StreamReader()
+        transport, _ = await loop.connect_read_pipe(
+            lambda: asyncio.StreamReaderProtocol(stderr), self.popen.stderr,
+        )
+        self._transports.append(transport)
+        # A long-lived worker never hits EOF on stderr, so drain it
+        # continuously or a chatty skill would block on a full pipe.
+        self._stderr_task = asyncio.ensure_future(_drain_stderr(stderr, skill_name))
+
+    @property
+    def alive(self) -> bool:
+        return self.popen.poll() is None
+
+    @property
+    def spent(self) -> bool:
+        """Whether too little of the CPU budget is left to serve another call."""
+        cpu = _process_cpu_seconds(self.popen.pid)
+        return cpu is not None and cpu >= _WORKER_CPU_REUSE_S
+
+    def kill(self) -> None:
+        """Kill without waiting (for workers outside the running loop)."""
+        if self.alive:
+            try:
+                self.popen.kill()
+            except ProcessLookupError:
+                pass
+        for transport in self._transports:
+            try:
+                transport.close()
+            except RuntimeError:
+                pass  # Event loop already closed
+        self._result_file.close()
+        if self._stderr_task is not None:
+            try:
+                self._stderr_task.cancel()
+            except RuntimeError:
+                pass
+
+    async def stop(self) -> None:
+        """Kill and reap the worker."""
+        self.kill()
+        try:
+            await self.loop.run_in_executor(None, self.popen.wait, 5)
+        except subprocess.TimeoutExpired:
+            pass
+
+
+async def _drain_stderr(stderr: asyncio.StreamReader, skill_name: str) -> None:
+    while True:
+        line = await stderr.readline()
+        if not line:
+            return
+        text = line.decode(errors="replace").rstrip()
+        if text:
+            logger.debug(f"[skill:{skill_name}] stderr: {text}")
+
+
+class SandboxPool:
+    """Warm sandbox subprocesses keyed by ``(python_executable, skill_name)``.
+
+    Interpreter startup and imports dominate a small handler's runtime, so
+    workers serve successive invocations over their stdio channel.  A
+    worker that times out or errors is killed instead of being returned;
+    idle workers expire after ``idle_timeout`` seconds.
+    """
+
+    def __init__(self, *, max_idle_per_key: int = 2, idle_timeout: float = 300.0) -> None:
+        self._max_idle_per_key = max_idle_per_key
+        self._idle_timeout = idle_timeout
+        self._idle: dict[tuple[str, str], list[_SandboxWorker]] = {}
+
+    async def acquire(
+        self,
+        key: tuple[str, str],
+        *,
+        skill_path: Path,
+        env: dict[str, str],
+    ) -> _SandboxWorker:
+        """Return an idle worker for *key*, or launch a new one."""
+        await self._expire()
+        loop = asyncio.get_running_loop()
+        idle = self._idle.get(key)
+        while idle:
+            worker = idle.pop()
+            # Pipe transports are bound to the loop that created them
+            if worker.alive and worker.loop is loop and not worker.spent:
+                return worker
+            worker.kill()
+
+        popen, result_fd = await loop.run_in_executor(
+            None,
+            _spawn_worker,
+            [key[0], "-m", "omnibrain.skill_sandbox"],
+            {**env, "OMNIBRAIN_SKILL_DIR": str(skill_path)},
+        )
+        _grow_pipe(popen.stdin.fileno())
+        worker = _SandboxWorker(popen, result_fd)
+        try:
+            await worker.connect(key[1])
+        except Exception:
+            await worker.stop()
+            raise
+        return worker
+
+    async def release(self, key: tuple[str, str], worker: _SandboxWorker) -> None:
+        """Return a healthy worker to the pool (or retire it)."""
+        worker.uses += 1
+        worker.last_used = time.monotonic()
+        idle = self._idle.setdefault(key, [])
+        if (
+            not worker.alive
+            or worker.uses >= _WORKER_MAX_USES
+            or worker.spent
+            or len(idle) >= self._max_idle_per_key
+        ):
+            await worker.stop()
+            return
+        idle.append(worker)
+
+    async def close(self) -> None:
+        """Stop every idle worker."""
+        loop = asyncio.get_running_loop()
+        workers = [w for idle in self._idle.values() for w in idle]
+        self._idle.clear()
+        for worker in workers:
+            if worker.loop is loop:
+                await worker.stop()
+            else:
+                worker.kill()
+
+    async def _expire(self) -> None:
+        cutoff = time.monotonic() - self._idle_timeout
+        expired: list[_SandboxWorker] = []
+        for idle in self._idle.values():
+            if idle and idle[0].last_used < cutoff:
+                expired.extend(w for w in idle if w.last_used < cutoff)
+                idle[:] = [w for w in idle if w.last_used >= cutoff]
+        loop = asyncio.get_running_loop()
+        for worker in expired:
+            if worker.loop is loop:
+                await worker.stop()
+            else:
+                worker.kill()
+
+
+_DEFAULT_POOL = SandboxPool()
+
+# skill_path → interpreter for skills launched without an explicit one,
+# so the venv probe (a stat) runs once per skill, not once per call
+_SANDBOX_PYTHON: dict[str, str] = {}
+
+
+def _sandbox_python(skill_path: Path) -> str:
+    key = str(skill_path)
+    python = _SANDBOX_PYTHON.get(key)
+    if python is None:
+        venv_python = skill_path / ".venv" / "bin" / "python"
+        python = str(venv_python) if venv_python.exists() else sys.executable
+        _SANDBOX_PYTHON[key] = python
+    return python
+
+
 # ═══════════════════════════════════════════════════════════════════════════
-# Sandbox Executor (Main Process — launches subprocess)
+# Sandbox Executor (Main Process — drives a pooled subprocess)
 # ═══════════════════════════════════════════════════════════════════════════
 
 
@@ -280,14 +862,18 @@ async def run_handler_sandboxed(
     config: Any = None,
     event_bus: Any = None,
     llm_router: Any = None,
+    pool: SandboxPool | None = None,
 ) -> Any:
-    """Launch a skill handler in an isolated subprocess.
+    """Run a skill handler in an isolated (pooled) subprocess.
 
-    Communication protocol:
-    - Subprocess writes JSON-RPC requests to stdout (one per line)
+    Communication protocol (length-prefixed JSON frames):
+    - Main process sends ``{"invoke": {...}}`` on stdin
+    - Subprocess writes JSON-RPC requests to stdout; a frame may be a
+      batch array, and notifications (no ``id``) get no response
     - Main process responds via stdin
-    - Last line from subprocess is the return value (JSON)
-    - Subprocess exits with code 0 on success
+    - The invocation ends with a ``{"result": ...}`` or ``{"error": ...}``
+      frame on the separate result pipe, carrying the number of stdout
+      frames the invocation wrote; the worker then waits for the next invoke
     """
     bridge = SkillSandboxBridge(
         skill_name=skill_name,
@@ -300,91 +886,129 @@ async def run_handler_sandboxed(
         event_bus=event_bus,
         llm_router=llm_router,
     )
+    pool = pool or _DEFAULT_POOL
 
     # Determine Python executable (use skill venv if available)
     if python_executable is None:
-        venv_python = skill_path / ".venv" / "bin" / "python"
-        if venv_python.exists():
-            python_executable = str(venv_python)
-        else:
-            python_executable = sys.executable
-
-    handler_file = str(skill_path / handler_relpath)
+        python_executable = _sandbox_python(skill_path)
 
-    # Launch subprocess
+    try:
+        args = _loads(args_json)
+        kwargs = _loads(kwargs_json)
+    except json.JSONDecodeError:
+        args, kwargs = [], {}
+
+    invoke = _dumps({"invoke": {
+        "handler_key": handler_key,
+        "handler_file": str(skill_path / handler_relpath),
+        "args": args,
+        "kwargs": kwargs,
+        "log_level": logger.getEffectiveLevel(),
+    }})
     env = {
         **os.environ,
         "OMNIBRAIN_SKILL_NAME": skill_name,
-        "OMNIBRAIN_SKILL_HANDLER_KEY": handler_key,
-        "OMNIBRAIN_SKILL_HANDLER_FILE": handler_file,
-        "OMNIBRAIN_SKILL_ARGS": args_json,
-        "OMNIBRAIN_SKILL_KWARGS": kwargs_json,
+        "OMNIBRAIN_SKILL_LOG_LEVEL": str(logger.getEffectiveLevel()),
     }
+    key = (python_executable, skill_name)
 
-    try:
-        proc = await asyncio.create_subprocess_exec(
-            python_executable, "-m", "omnibrain.skill_sandbox",
-            stdin=asyncio.subprocess.PIPE,
-            stdout=asyncio.subprocess.PIPE,
-            stderr=asyncio.subprocess.PIPE,
-            env=env,
-            cwd=str(skill_path),
-        )
-    except Exception as e:
-        logger.error(f"Failed to launch sandbox for {skill_name}: {e}")
-        return None
-
+    worker: _SandboxWorker | None = None
+    inflight: set[asyncio.Task] = set()
     result = None
+    done = False
     try:
-        # Process JSON-RPC communication with timeout
         async with asyncio.timeout(timeout):
-            while True:
-                line = await proc.stdout.readline()
-                if not line:
-                    break
-
-                line_str = line.decode().strip()
-                if not line_str:
-                    continue
-
+            try:
+                worker = await pool.acquire(key, skill_path=skill_path, env=env)
+            except Exception as e:
+                logger.error(f"Failed to launch sandbox for {skill_name}: {e}")
+                return None
+            writer = worker.writer
+            _write_frame(writer, invoke)
+            await writer.drain()
+
+            async def send(message: Any) -> None:
+                _write_frame(writer, _dumps(message))
+                await writer.drain()
+
+            async def respond(msg: Any) -> None:
                 try:
-                    msg = json.loads(line_str)
-                except json.JSONDecodeError:
-                    continue
-
-                # Check if it's a final result or an RPC request
-                if "method" in msg:
-                    # RPC request — handle and respond
-                    response = await bridge.handle_rpc(msg)
-                    response_line = json.dumps(response) + "\n"
-                    proc.stdin.write(response_line.encode())
-                    await proc.stdin.drain()
-                elif "result" in msg:
-                    # Final result from handler
-                    result = msg["result"]
+                    if isinstance(msg, list):
+                        # Batch — one response array for all entries with an id
+                        payload = await bridge.handle_batch_raw(msg)
+                    else:
+                        # RPC request — respond (notifications get none)
+                        payload = await bridge.handle_rpc_raw(msg, send)
+                        if "id" not in msg:
+                            payload = None
+                except Exception as e:
+                    # E.g. an unserializable result. Answer every id with an
+                    # error so the child fails fast instead of waiting out
+                    # its RPC timeout.
+                    logger.error(f"[skill:{skill_name}] RPC response failed: {e}")
+                    payload = _error_payload(msg, {"code": -32603, "message": str(e)[:500]})
+                if payload is not None:
+                    _write_frame(writer, payload)
+                    await writer.drain()
+
+            # stdout carries only JSON-RPC traffic; each request runs as its
+            # own task, so calls the handler has in flight concurrently are
+            # served concurrently too.
+            seen = 0
+            expected: int | None = None
+            caught_up = asyncio.Event()
+
+            async def pump() -> None:
+                nonlocal seen
+                try:
+                    async with contextlib.aclosing(_iter_frames(worker.reader)) as frames:
+                        async for frame in frames:
+                            seen += 1
+                            try:
+                                msg = _loads(frame)
+                            except json.JSONDecodeError:
+                                msg = None
+                            if isinstance(msg, (list, dict)):
+                                task = asyncio.ensure_future(respond(msg))
+                                inflight.add(task)
+                                task.add_done_callback(inflight.discard)
+                            if expected is not None and seen >= expected:
+                                caught_up.set()
+                finally:
+                    caught_up.set()
+
+            pumping = asyncio.ensure_future(pump())
+            try:
+                # The final result arrives once, on the result pipe; it
+                # says how many stdout frames preceded it so none are lost.
+                reply = _loads(await _read_frame(worker.results))
+                expected = reply.get("frames", 0)
+                if seen < expected and not pumping.done():
+                    await caught_up.wait()
+            finally:
+                pumping.cancel()
+                await asyncio.wait([pumping])
+
+            if "error" in reply:
+                logger.warning(f"[skill:{skill_name}] {reply['error']}")
+            else:
+                result = reply.get("result")
+            done = True
+            if inflight:
+                await asyncio.gather(*inflight)
 
     except TimeoutError:
         logger.warning(f"Skill {skill_name} handler timed out after {timeout}s")
-        proc.kill()
     except Exception as e:
         logger.error(f"Sandbox communication error for {skill_name}: {e}")
     finally:
-        try:
-            proc.stdin.close()
-        except Exception:
-            pass
-        try:
-            await asyncio.wait_for(proc.wait(), timeout=5)
-        except TimeoutError:
-            proc.kill()
-
-    # Log stderr for debugging
-    if proc.stderr:
-        stderr_bytes = await proc.stderr.read()
-        if stderr_bytes:
-            stderr_text = stderr_bytes.decode(errors="replace").strip()
-            if stderr_text:
-                logger.debug(f"[skill:{skill_name}] stderr: {stderr_text}")
+        for task in inflight:
+            task.cancel()
+        if worker is not None:
+            if done:
+                await pool.release(key, worker)
+            else:
+                await worker.stop()
 
     return result
 
@@ -394,7 +1018,34 @@ async def run_handler_sandboxed(
 # ═══════════════════════════════════════════════════════════════════════════
 
 
-def ensure_skill_venv(skill_path: Path, dependencies: list[str]) -> str:
+# (skill_path, sorted deps) → venv python, filled once a venv is verified
+# or created, so later launches skip the stat + marker read + hash.
+_VENV_CACHE: dict[tuple[str, tuple[str, ...]], str] = {}
+
+
+async def _run_quiet(argv: list[str], timeout: float) -> None:
+    """Run *argv* discarding stdout; raise CalledProcessError on failure.
+
+    Only stderr is piped (pip's stdout can be large), and it is decoded
+    only if the command fails.
+    """
+    proc = await asyncio.create_subprocess_exec(
+        *argv,
+        stdout=asyncio.subprocess.DEVNULL,
+        stderr=asyncio.subprocess.PIPE,
+    )
+    try:
+        async with asyncio.timeout(timeout):
+            _, stderr = await proc.communicate()
+    except TimeoutError:
+        proc.kill()
+        await proc.wait()
+        raise
+    if proc.returncode:
+        raise subprocess.CalledProcessError(proc.returncode, argv, stderr=stderr)
+
+
+async def ensure_skill_venv(skill_path: Path, dependencies: list[str]) -> str:
     """Create and populate a per-skill venv if it has dependencies.
 
     Returns the path to the Python executable in the venv.
@@ -403,6 +1054,11 @@ def ensure_skill_venv(skill_path: Path, dependencies: list[str]) -> str:
     if not dependencies:
         return sys.executable
 
+    key = (str(skill_path), tuple(sorted(dependencies)))
+    cached = _VENV_CACHE.get(key)
+    if cached is not None:
+        return cached
+
     venv_path = skill_path / ".venv"
     venv_python = venv_path / "bin" / "python"
 
@@ -412,23 +1068,17 @@ def ensure_skill_venv(skill_path: Path, dependencies: list[str]) -> str:
         marker = venv_path / ".deps_installed"
         deps_hash = _hash_deps(dependencies)
         if marker.exists() and marker.read_text().strip() == deps_hash:
+            _VENV_CACHE[key] = str(venv_python)
             return str(venv_python)
 
     logger.info(f"Creating venv for skill at {skill_path}")
     try:
         # Create venv
-        subprocess.run(
-            [sys.executable, "-m", "venv", str(venv_path)],
-            check=True,
-            capture_output=True,
-            timeout=60,
-        )
+        await _run_quiet([sys.executable, "-m", "venv", str(venv_path)], timeout=60)
 
         # Install dependencies
-        subprocess.run(
+        await _run_quiet(
             [str(venv_python), "-m", "pip", "install", "--quiet", *dependencies],
-            check=True,
-            capture_output=True,
             timeout=300,
         )
 
@@ -437,6 +1087,8 @@ def ensure_skill_venv(skill_path: Path, dependencies: list[str]) -> str:
         (venv_path / ".deps_installed").write_text(deps_hash)
 
         logger.info(f"Skill venv created with {len(dependencies)} deps")
+        _VENV_CACHE[key] = str(venv_python)
+        _SANDBOX_PYTHON[key[0]] = str(venv_python)
         return str(venv_python)
 
     except subprocess.CalledProcessError as e:
@@ -449,9 +1101,7 @@ def ensure_skill_venv(skill_path: Path, dependencies: list[str]) -> str:
 
 def _hash_deps(deps: list[str]) -> str:
     """Hash dep list for venv cache invalidation."""
-    import hashlib
-
-    return hashlib.md5("|".join(sorted(deps)).encode()).hexdigest()
+    return hashlib.blake2b("|".join(sorted(deps)).encode(), digest_size=16).hexdigest()
 
 
 # ═══════════════════════════════════════════════════════════════════════════
@@ -459,39 +1109,206 @@ def _hash_deps(deps: list[str]) -> str:
 # ═══════════════════════════════════════════════════════════════════════════
 
 
+class _RpcChannel:
+    """The subprocess end of the framed protocol.
+
+    A daemon thread reads stdin and demultiplexes frames: invoke frames go
+    to ``invokes`` for the worker's main loop, responses resolve the future
+    (or stream queue) registered under their ``id`` on the event loop.  Any
+    number of requests can therefore be in flight at once.
+    """
+
+    def __init__(self, reader: Any = None, writer: Any = None, results: Any = None) -> None:
+        # Binary streams carrying the framed protocol (stdin/stdout by default)
+        self._reader = reader
+        self._writer = writer
+        # Final results go to their own stream when the launcher gave one
+        self._results = results
+        self.frames_written = 0
+        self._next_id = 0
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._thread: threading.Thread | None = None
+        self._closed = False
+        self._waiters: dict[int, asyncio.Future] = {}
+        self._streams: dict[int, asyncio.Queue] = {}
+        # Responses that arrived before anyone asked for them
+        self._unclaimed: dict[int, dict[str, Any]] = {}
+        self.invokes: queue.SimpleQueue = queue.SimpleQueue()
+
+    def start(self, loop: asyncio.AbstractEventLoop) -> None:
+        """Start the reader thread, delivering responses on ``loop``."""
+        if self._thread is not None:
+            return
+        self._loop = loop
+        self._thread = threading.Thread(
+            target=self._read_loop, name="skill-rpc-reader", daemon=True,
+        )
+        self._thread.start()
+
+    def next_id(self) -> int:
+        self._next_id += 1
+        return self._next_id
+
+    def write(self, payload: bytes) -> None:
+        writer = self._writer or sys.stdout.buffer
+        _write_frame(writer, payload)
+        writer.flush()
+        self.frames_written += 1
+
+    def write_result(self, payload: bytes) -> None:
+        if self._results is None:
+            self.write(payload)
+            return
+        _write_frame(self._results, payload)
+        self._results.flush()
+
+    def expect(self, req_id: int) -> asyncio.Future:
+        """Future resolved with the response to ``req_id`` (None on EOF)."""
+        fut = self._loop.create_future()
+        if req_id in self._unclaimed:
+            fut.set_result(self._unclaimed.pop(req_id))
+        elif self._closed:
+            fut.set_result(None)
+        else:
+            self._waiters[req_id] = fut
+        return fut
+
+    def open_stream(self, req_id: int) -> asyncio.Queue:
+        """Queue receiving every frame for ``req_id`` up to the final one."""
+        frames: asyncio.Queue = asyncio.Queue()
+        if req_id in self._unclaimed:
+            frames.put_nowait(self._unclaimed.pop(req_id))
+        elif self._closed:
+            frames.put_nowait(None)
+        else:
+            self._streams[req_id] = frames
+        return frames
+
+    def _read_loop(self) -> None:
+        reader = self._reader or sys.stdin.buffer
+        while True:
+            frame = _read_frame_sync(reader)
+            if frame is None:
+                break
+            try:
+                msg = _loads(frame)
+            except json.JSONDecodeError:
+                continue
+            if isinstance(msg, dict) and "invoke" in msg:
+                if isinstance(msg["invoke"], dict):
+                    self.invokes.put(msg["invoke"])
+                continue
+            try:
+                self._loop.call_soon_threadsafe(self._route, msg)
+            except RuntimeError:
+                break  # Loop closed — the worker is shutting down
+        self.invokes.put(None)
+        with contextlib.suppress(RuntimeError):
+            self._loop.call_soon_threadsafe(self._close)
+
+    def _route(self, msg: Any) -> None:
+        for response in msg if isinstance(msg, list) else [msg]:
+            if not isinstance(response, dict):
+                continue
+            req_id = response.get("id")
+            frames = self._streams.get(req_id)
+            if frames is not None:
+                if "partial" not in response:
+                    del self._streams[req_id]
+                frames.put_nowait(response)
+                continue
+            fut = self._waiters.pop(req_id, None)
+            if fut is not None:
+                if not fut.done():
+                    fut.set_result(response)
+            elif isinstance(req_id, int):
+                self._unclaimed[req_id] = response
+
+    def _close(self) -> None:
+        self._closed = True
+        waiters, self._waiters = self._waiters, {}
+        for fut in waiters.values():
+            if not fut.done():
+                fut.set_result(None)
+        streams, self._streams = self._streams, {}
+        for frames in streams.values():
+            frames.put_nowait(None)
+
+
 class SkillContextProxy:
     """A proxy that implements the same async interface as SkillContext,
     but communicates with the main process via stdin/stdout JSON-RPC.
 
     This runs INSIDE the sandboxed subprocess.
+
+    Fire-and-forget calls (log, notify, emit_event) are queued as
+    JSON-RPC notifications and ride along with the next round trip,
+    so a chatty handler pays one pipe exchange instead of N.  Requests
+    never block the event loop: responses are matched back by ``id``, so
+    gathered calls are all in flight together.
     """
 
-    def __init__(self, skill_name: str) -> None:
+    def __init__(
+        self,
+        skill_name: str,
+        *,
+        reader: Any = None,
+        writer: Any = None,
+        min_log_level: int | None = None,
+        channel: _RpcChannel | None = None,
+    ) -> None:
         self.skill_name = skill_name
         self._request_id = 0
+        # The main logger's effective level — lower records are dropped
+        # here instead of costing a message to be filtered there
+        if min_log_level is None:
+            min_log_level = int(os.environ.get("OMNIBRAIN_SKILL_LOG_LEVEL", logging.INFO))
+        self._min_log_level = min_log_level
+        self._pending: list[bytes] = []
+        # A pooled worker shares one channel across invocations, so ids
+        # stay unique for its whole life
+        self._channel = channel or _RpcChannel(reader, writer)
+
+    def _write_message(self, payload: bytes) -> None:
+        self._channel.write(payload)
+
+    def _write_batch(self, parts: list[bytes]) -> None:
+        self._write_message(parts[0] if len(parts) == 1 else b"[" + b",".join(parts) + b"]")
+
+    def _make_request(self, method: str, params: dict[str, Any] | None) -> tuple[int, bytes]:
+        """Allocate an id and encode a request; returns ``(id, payload)``."""
+        self._request_id = self._channel.next_id()
+        head = _RPC_REQUEST_HEADS.get(method) or _rpc_head(method, with_id=True)
+        return self._request_id, head % self._request_id + _dumps(params or {}) + b"}"
+
+    def _post(self, method: str, params: dict[str, Any] | None = None) -> None:
+        """Queue a notification; it is sent with the next round trip."""
+        head = _RPC_NOTIFICATION_HEADS.get(method) or _rpc_head(method, with_id=False)
+        self._pending.append(head + _dumps(params or {}) + b"}")
+        if len(self._pending) >= MAX_BATCH_SIZE - 1:
+            self.flush()
+
+    def flush(self) -> None:
+        """Send queued notifications now (no response is expected)."""
+        if not self._pending:
+            return
+        pending, self._pending = self._pending, []
+        self._write_batch(pending)
+
+    async def _send_rpc(self, method: str, params: dict[str, Any] = None) -> Any:
+        """Send a JSON-RPC request and await its response.
+
+        Queued notifications are flushed in the same write as a batch.
+        """
+        self._channel.start(asyncio.get_running_loop())
+        req_id, request = self._make_request(method, params)
+        response = self._channel.expect(req_id)
 
-    def _send_rpc(self, method: str, params: dict[str, Any] = None) -> Any:
-        """Send a JSON-RPC request and wait for response (blocking)."""
-        self._request_id += 1
-        request = {
-            "jsonrpc": "2.0",
-            "id": self._request_id,
-            "method": method,
-            "params": params or {},
-        }
-
-        # Write to stdout (main process reads this)
-        sys.stdout.write(json.dumps(request) + "\n")
-        sys.stdout.flush()
-
-        # Read response from stdin (main process writes this)
-        line = sys.stdin.readline()
-        if not line:
-            return None
+        batch, self._pending = self._pending + [request], []
+        self._write_batch(batch)
 
-        try:
-            response = json.loads(line.strip())
-        except json.JSONDecodeError:
+        response = await response
+        if response is None:
             return None
 
         if "error" in response:
@@ -499,18 +1316,46 @@ class SkillContextProxy:
 
         return response.get("result")
 
+    async def batch(self, calls: list[tuple[str, dict[str, Any]]]) -> list[Any]:
+        """Issue several result-bearing calls in a single round trip.
+
+        ``calls`` is a list of ``(method, params)``.  Results come back in
+        the same order; an error in any entry raises RuntimeError.
+        """
+        if not calls:
+            return []
+        if len(calls) > MAX_BATCH_SIZE:
+            raise ValueError(f"Batch exceeds {MAX_BATCH_SIZE} calls")
+        if len(calls) + len(self._pending) > MAX_BATCH_SIZE:
+            self.flush()
+
+        self._channel.start(asyncio.get_running_loop())
+        requests = [self._make_request(method, params) for method, params in calls]
+        waiting = [self._channel.expect(req_id) for req_id, _ in requests]
+        pending, self._pending = self._pending, []
+        self._write_batch(pending + [payload for _, payload in requests])
+
+        results = []
+        for resp in await asyncio.gather(*waiting):
+            resp = resp or {}
+            if "error" in resp:
+                raise RuntimeError(resp["error"].get("message", "RPC error"))
+            results.append(resp.get("result"))
+        return results
+
     # ── Memory ──
 
     async def memory_search(self, query: str, max_results: int = 10) -> list[dict]:
-        return self._send_rpc(RPC_MEMORY_SEARCH, {"query": query, "max_results": max_results})
+        return await self._send_rpc(RPC_MEMORY_SEARCH, {"query": query, "max_results": max_results})
 
     async def memory_store(self, text: str, source_type: str = "skill_data") -> bool:
-        return self._send_rpc(RPC_MEMORY_STORE, {"text": text, "source_type": source_type})
+        return await self._send_rpc(RPC_MEMORY_STORE, {"text": text, "source_type": source_type})
 
     # ── Notifications ──
 
     async def notify(self, message: str, level: str = "fyi", title: str = "") -> bool:
-        return self._send_rpc(RPC_NOTIFY, {"title": title, "message": message, "level": level})
+        self._post(RPC_NOTIFY, {"title": title, "message": message, "level": level})
+        return True
 
     # ── Proposals ──
 
@@ -522,7 +1367,7 @@ class SkillContextProxy:
         priority: int = 2,
         action_data: dict = None,
     ) -> bool:
-        return self._send_rpc(RPC_PROPOSE, {
+        return await self._send_rpc(RPC_PROPOSE, {
             "title": title,
             "description": description,
             "type": type,
@@ -533,28 +1378,54 @@ class SkillContextProxy:
     # ── LLM ──
 
     async def llm_complete(self, messages: list[dict]) -> str:
-        return self._send_rpc(RPC_LLM_COMPLETE, {"messages": messages})
+        parts = [chunk async for chunk in self.llm_stream(messages)]
+        return "".join(parts)
+
+    async def llm_stream(self, messages: list[dict]) -> AsyncIterator[str]:
+        """Yield completion chunks as the main process relays them."""
+        self.flush()  # A stream must not ride inside a batch
+        self._channel.start(asyncio.get_running_loop())
+        req_id, request = self._make_request(
+            RPC_LLM_COMPLETE, {"messages": messages, "stream": True},
+        )
+        frames = self._channel.open_stream(req_id)
+        self._write_message(request)
+        while True:
+            response = await frames.get()
+            if response is None:
+                return
+            if "partial" in response:
+                yield response["partial"]
+                continue
+            if "error" in response:
+                raise RuntimeError(response["error"].get("message", "RPC error"))
+            # Without a live router the bridge answers with a plain result
+            if response.get("result"):
+                yield response["result"]
+            return
 
     # ── Data access ──
 
     async def get_events(self, limit: int = 50, source: str = "") -> list[dict]:
-        return self._send_rpc(RPC_GET_EVENTS, {"limit": limit, "source": source})
+        return await self._send_rpc(RPC_GET_EVENTS, {"limit": limit, "source": source})
 
     async def get_contacts(self, limit: int = 50) -> list[dict]:
-        return self._send_rpc(RPC_GET_CONTACTS, {"limit": limit})
+        return await self._send_rpc(RPC_GET_CONTACTS, {"limit": limit})
 
     async def get_preference(self, key: str) -> Any:
-        return self._send_rpc(RPC_GET_PREFERENCE, {"key": key})
+        return await self._send_rpc(RPC_GET_PREFERENCE, {"key": key})
 
     # ── Logging ──
 
     async def log(self, message: str, level: str = "info") -> None:
-        self._send_rpc(RPC_LOG, {"message": message, "level": level})
+        if getattr(logging, level.upper(), logging.INFO) < self._min_log_level:
+            return
+        self._post(RPC_LOG, {"message": message, "level": level})
 
     # ── Events ──
 
     async def emit_event(self, event_type: str, data: dict = None) -> None:
-        self._send_rpc(RPC_EMIT_EVENT, {"event_type": event_type, "data": data or {}})
+        self._post(RPC_EMIT_EVENT, {"event_type": event_type, "data": data or {}})
 
 
 # ═══════════════════════════════════════════════════════════════════════════
@@ -562,75 +1433,135 @@ class SkillContextProxy:
 # ═══════════════════════════════════════════════════════════════════════════
 
 
-def _run_in_subprocess() -> None:
-    """Entry point when run as ``python -m omnibrain.skill_sandbox``.
+def _load_handle_fn(handler_file: str) -> Any:
+    """Import a handler file and return its ``handle`` function."""
+    if not handler_file or not os.path.exists(handler_file):
+        raise FileNotFoundError(f"Handler file not found: {handler_file}")
 
-    Reads handler info from environment variables, loads the handler,
-    creates a SkillContextProxy, and executes the handler.
-    """
-    skill_name = os.environ.get("OMNIBRAIN_SKILL_NAME", "unknown")
-    handler_file = os.environ.get("OMNIBRAIN_SKILL_HANDLER_FILE", "")
-    _handler_key = os.environ.get("OMNIBRAIN_SKILL_HANDLER_KEY", "")
-    args_json = os.environ.get("OMNIBRAIN_SKILL_ARGS", "[]")
-    kwargs_json = os.environ.get("OMNIBRAIN_SKILL_KWARGS", "{}")
+    module_name = f"skill_handler_{Path(handler_file).stem}"
+    spec = importlib.util.spec_from_file_location(module_name, handler_file)
+    if spec is None or spec.loader is None:
+        raise ImportError(f"Cannot load handler spec: {handler_file}")
 
-    if not handler_file or not os.path.exists(handler_file):
-        sys.stderr.write(f"Handler file not found: {handler_file}\n")
-        sys.exit(1)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
 
-    # Apply resource limits (best-effort, Linux only)
-    try:
-        import resource
+    handle_fn = getattr(module, "handle", None)
+    if handle_fn is None:
+        raise AttributeError(f"Handler {handler_file} has no 'handle' function")
+    return handle_fn
 
-        # 256 MB max memory
-        resource.setrlimit(resource.RLIMIT_AS, (256 * 1024 * 1024, 256 * 1024 * 1024))
-        # 30 seconds CPU time
-        resource.setrlimit(resource.RLIMIT_CPU, (30, 30))
-        # 64 open file descriptors
-        resource.setrlimit(resource.RLIMIT_NOFILE, (64, 64))
-    except (ImportError, ValueError, OSError):
-        pass  # Not available on all platforms
 
-    # Load handler module
-    try:
-        module_name = f"skill_handler_{Path(handler_file).stem}"
-        spec = importlib.util.spec_from_file_location(module_name, handler_file)
-        if spec is None or spec.loader is None:
-            sys.stderr.write(f"Cannot load handler spec: {handler_file}\n")
-            sys.exit(1)
-
-        module = importlib.util.module_from_spec(spec)
-        spec.loader.exec_module(module)
-
-        handle_fn = getattr(module, "handle", None)
-        if handle_fn is None:
-            sys.stderr.write(f"Handler {handler_file} has no 'handle' function\n")
-            sys.exit(1)
-    except Exception as e:
-        sys.stderr.write(f"Failed to load handler: {e}\n")
-        sys.exit(1)
+def _cancel_leftover_tasks(loop: asyncio.AbstractEventLoop) -> None:
+    """Cancel tasks a handler left running so they can't outlive its call."""
+    tasks = asyncio.all_tasks(loop)
+    if not tasks:
+        return
+    for task in tasks:
+        task.cancel()
+    loop.run_until_complete(asyncio.gather(*tasks, return_exceptions=True))
 
-    # Create context proxy
-    ctx = SkillContextProxy(skill_name)
 
-    # Parse args
-    try:
-        args = json.loads(args_json)
-        kwargs = json.loads(kwargs_json)
-    except json.JSONDecodeError:
-        args = []
-        kwargs = {}
+def _run_in_subprocess() -> None:
+    """Entry point when run as ``python -m omnibrain.skill_sandbox``.
 
-    # Run handler
-    try:
-        result = asyncio.run(handle_fn(ctx, *args, **kwargs))
-        # Write final result to stdout
-        sys.stdout.write(json.dumps({"result": result}) + "\n")
-        sys.stdout.flush()
-    except Exception as e:
-        sys.stderr.write(f"Handler execution failed: {e}\n")
-        sys.exit(1)
+    Runs as a pooled worker: reads ``{"invoke": ...}`` frames from stdin,
+    loads the handler, executes it with a SkillContextProxy, writes the
+    result frame, and waits for the next invocation until stdin closes.
+    """
+    skill_name = os.environ.get("OMNIBRAIN_SKILL_NAME", "unknown")
 
+    # The launcher normally binds our resource limits; limit ourselves
+    # where it can't (no prlimit on this platform)
+    if not _can_limit_from_parent():
+        _apply_sandbox_rlimits()
+
+    # Run from the skill directory, with it importable (what cwd= gave)
+    skill_dir = os.environ.get("OMNIBRAIN_SKILL_DIR")
+    if skill_dir:
+        os.chdir(skill_dir)
+        sys.path.insert(0, skill_dir)
+
+    # Keep handler bytecode cached across workers.  A read-only skill
+    # directory can't hold __pycache__, which would mean recompiling in
+    # every worker — send bytecode to a per-user prefix instead.
+    sys.dont_write_bytecode = False
+    if skill_dir and not os.access(skill_dir, os.W_OK):
+        sys.pycache_prefix = _PYCACHE_PREFIX
+
+    # Keep the protocol on a private copy of fd 1 and point fd 1 (and
+    # sys.stdout) at stderr, so stray prints in skill code cannot corrupt
+    # the framing.
+    proto_in = sys.stdin.buffer
+    proto_out = os.fdopen(os.dup(1), "wb")
+    os.dup2(2, 1)
+    sys.stdout = sys.stderr
+    _grow_pipe(proto_out.fileno())
+
+    # Final results travel on the result pipe the launcher handed down
+    result_out = None
+    result_fd = os.environ.pop("OMNIBRAIN_RESULT_FD", None)
+    if result_fd is not None:
+        os.set_inheritable(int(result_fd), False)
+        result_out = os.fdopen(int(result_fd), "wb")
+
+    # Handler modules (and their imports) and the event loop live for the
+    # worker's lifetime; a module is reloaded only when its file changes.
+    # Modules are keyed by real path so symlinked handlers share one.
+    modules: dict[str, tuple[int, Any]] = {}
+    real_paths: dict[str, str] = {}
+    loop = asyncio.new_event_loop()
+    asyncio.set_event_loop(loop)
+    channel = _RpcChannel(proto_in, proto_out, result_out)
+    channel.start(loop)
+
+    while True:
+        invoke = channel.invokes.get()
+        if invoke is None:
+            loop.close()
+            return  # Parent closed the channel
+
+        frames_before = channel.frames_written
+        ctx = SkillContextProxy(
+            skill_name,
+            min_log_level=invoke.get("log_level"),
+            channel=channel,
+        )
+        try:
+            handler_file = invoke.get("handler_file", "")
+            real = real_paths.get(handler_file)
+            if real is None:
+                real = real_paths[handler_file] = os.path.realpath(handler_file)
+            mtime = os.stat(real).st_mtime_ns if handler_file else 0
+            cached = modules.get(real)
+            if cached is not None and cached[0] == mtime:
+                handle_fn = cached[1]
+            else:
+                handle_fn = _load_handle_fn(handler_file)
+                modules[real] = (mtime, handle_fn)
+            try:
+                result = loop.run_until_complete(
+                    handle_fn(ctx, *invoke.get("args", []), **invoke.get("kwargs", {}))
+                )
+            finally:
+                _cancel_leftover_tasks(loop)
+                ctx.flush()
+            reply = {"result": result}
+        except Exception as e:
+            sys.stderr.write(f"Handler execution failed: {e}\n")
+            reply = {"error": f"Handler execution failed: {e}"[:500]}
+
+        # Write the final result to the result pipe, with the number of
+        # stdout frames the parent must drain before it is complete
+        frames = channel.frames_written - frames_before
+        try:
+            payload = _dumps({**reply, "frames": frames})
+        except TypeError as e:
+            payload = _dumps({
+                "error": f"Handler result not JSON-serializable: {e}",
+                "frames": frames,
+            })
+        channel.write_result(payload)
 
 if __name__ == "__main__":
     _run_in_subprocess()
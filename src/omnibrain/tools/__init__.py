@@ -13,8 +13,12 @@ from omnibrain.tools.calendar_tools import (
     GET_TODAY_EVENTS_SCHEMA,
     GET_UPCOMING_EVENTS_SCHEMA,
     generate_meeting_brief,
+    generate_meeting_brief_async,
     get_today_events,
+    get_today_events_async,
     get_upcoming_events,
+    get_upcoming_events_async,
+    invalidate_calendar_cache,
     store_events_in_db,
 )
 from omnibrain.tools.email_tools import (
@@ -24,7 +28,10 @@ from omnibrain.tools.email_tools import (
     SEARCH_EMAILS_SCHEMA,
     classify_email,
     fetch_emails,
+    fetch_emails_async,
+    invalidate_email_cache,
     search_emails,
+    search_emails_async,
     store_emails_in_db,
 )
 from omnibrain.tools.memory_tools import (
@@ -44,18 +51,25 @@ __all__ = [
     "SEARCH_EMAILS_SCHEMA",
     "CLASSIFY_EMAIL_SCHEMA",
     "fetch_emails",
+    "fetch_emails_async",
     "search_emails",
+    "search_emails_async",
     "classify_email",
     "store_emails_in_db",
+    "invalidate_email_cache",
     # Calendar tools
     "CALENDAR_TOOL_SCHEMAS",
     "GET_TODAY_EVENTS_SCHEMA",
     "GET_UPCOMING_EVENTS_SCHEMA",
     "GENERATE_MEETING_BRIEF_SCHEMA",
     "get_today_events",
+    "get_today_events_async",
     "get_upcoming_events",
+    "get_upcoming_events_async",
     "generate_meeting_brief",
+    "generate_meeting_brief_async",
     "store_events_in_db",
+    "invalidate_calendar_cache",
     # Memory tools
     "MEMORY_TOOL_SCHEMAS",
     "SEARCH_MEMORY_SCHEMA",
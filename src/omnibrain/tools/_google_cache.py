@@ -0,0 +1,98 @@
+"""
+OmniBrain — Shared Google API Client State
+
+Helpers shared by the Gmail and Calendar tool modules:
+    _get_shared_client — one API client per (client class, data directory)
+    _locked_call       — call into a shared client under its class's API lock
+    _cached_fetch      — short-lived cache of fetch results, one per tool module
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from collections.abc import Callable, Iterable
+from pathlib import Path
+from typing import Any, TypeVar
+
+_C = TypeVar("_C")
+_T = TypeVar("_T")
+
+# Clients are kept per data directory so repeat tool calls reuse the
+# loaded credentials and built API service instead of redoing both. The
+# bound covers a few data directories for each of Gmail and Calendar.
+_MAX_CLIENTS = 8
+_clients: dict[tuple[type, str], Any] = {}
+_clients_lock = threading.Lock()
+# The Google API client is not thread-safe. Sync and async entry points may
+# run on different threads at once, so every call on a shared client goes
+# through _locked_call and never two calls on the same API overlap.
+_api_locks: dict[type, threading.Lock] = {}
+
+# Fetch results are reused for a short while: within one agent session the
+# same query is often asked several times in a row.
+_FETCH_TTL_S = 45.0
+_FETCH_CACHE_SIZE = 128
+
+
+def _get_shared_client(cls: type[_C], data_dir: Path) -> _C:
+    """Return the shared *cls* client for *data_dir*, creating it on first use."""
+    key = (cls, str(Path(data_dir).resolve()))
+    client = _clients.get(key)
+    if client is None:
+        with _clients_lock:
+            client = _clients.get(key)
+            if client is None:
+                if len(_clients) >= _MAX_CLIENTS:
+                    _clients.pop(next(iter(_clients)))
+                client = _clients[key] = cls(data_dir)
+    return client
+
+
+def _api_lock(cls: type) -> threading.Lock:
+    """Return the lock serialising calls on *cls* clients."""
+    lock = _api_locks.get(cls)
+    if lock is None:
+        with _clients_lock:
+            lock = _api_locks.setdefault(cls, threading.Lock())
+    return lock
+
+
+def _locked_call(cls: type, fn: Any, *args: Any, **kwargs: Any) -> Any:
+    with _api_lock(cls):
+        return fn(*args, **kwargs)
+
+
+class _FetchCache:
+    """Fetch results by key, with the time each was fetched."""
+
+    def __init__(self) -> None:
+        self.entries: dict[tuple[Any, ...], tuple[float, tuple[Any, ...]]] = {}
+        self.lock = threading.Lock()
+
+    def clear(self) -> None:
+        with self.lock:
+            self.entries.clear()
+
+
+def _cached_fetch(
+    cache: _FetchCache, key: tuple[Any, ...], fetch: Callable[[], Iterable[_T]], no_cache: bool,
+) -> tuple[_T, ...]:
+    """Return the result cached in *cache* under *key*, or call *fetch* and cache it.
+
+    Results are returned as tuples, so no caller can change what the next
+    one is served.
+    """
+    now = time.monotonic()
+    if not no_cache:
+        with cache.lock:
+            hit = cache.entries.get(key)
+        if hit is not None and now - hit[0] < _FETCH_TTL_S:
+            return hit[1]
+    result = tuple(fetch())
+    with cache.lock:
+        cache.entries.pop(key, None)
+        if len(cache.entries) >= _FETCH_CACHE_SIZE:
+            cache.entries.pop(next(iter(cache.entries)))
+        cache.entries[key] = (now, result)
+    return result
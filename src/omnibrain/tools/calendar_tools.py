@@ -16,16 +16,34 @@ Architecture:
 
 from __future__ import annotations
 
+import asyncio
 import logging
-from datetime import datetime
+from collections.abc import Sequence
+from dataclasses import dataclass
+from datetime import date
+from itertools import groupby
+from operator import attrgetter
 from pathlib import Path
 from typing import Any
 
 from omnibrain.integrations.calendar import CalendarAuthError, CalendarClient
 from omnibrain.models import CalendarEvent, EventSource
+from omnibrain.tools._google_cache import (
+    _cached_fetch,
+    _FetchCache,
+    _get_shared_client,
+    _locked_call,
+)
 
 logger = logging.getLogger("omnibrain.tools.calendar")
 
+_fetch_cache = _FetchCache()
+
+
+def invalidate_calendar_cache() -> None:
+    """Forget cached Calendar results, e.g. after a change made through the API."""
+    _fetch_cache.clear()
+
 
 # ═══════════════════════════════════════════════════════════════════════════
 # Tool: get_today_events
@@ -41,15 +59,18 @@ GET_TODAY_EVENTS_SCHEMA = {
 }
 
 
-def get_today_events(data_dir: Path) -> dict[str, Any]:
+def get_today_events(data_dir: Path, no_cache: bool = False) -> dict[str, Any]:
     """Fetch today's calendar events.
 
+    Repeat calls within ``_FETCH_TTL_S`` are answered from cache unless
+    *no_cache* is set.
+
     Returns:
         Dict with 'events' list and metadata, suitable for agent consumption.
     """
-    client = CalendarClient(data_dir)
+    client = _get_shared_client(CalendarClient, data_dir)
 
-    if not client.authenticate():
+    if not _locked_call(CalendarClient, client.authenticate):
         return {
             "error": "Calendar not authenticated. Run 'omnibrain setup-google' first.",
             "events": [],
@@ -57,14 +78,20 @@ def get_today_events(data_dir: Path) -> dict[str, Any]:
         }
 
     try:
-        events = client.get_today_events()
-        event_dicts = [_event_to_agent_view(e) for e in events]
+        today = date.today()
+        views = _event_views(_cached_fetch(
+            _fetch_cache,
+            ("today", str(data_dir), today),
+            lambda: _locked_call(CalendarClient, client.get_today_events),
+            no_cache,
+        ))
+        event_dicts = [_event_to_agent_view(v) for v in views]
 
         return {
             "events": event_dicts,
             "count": len(event_dicts),
-            "date": datetime.now().strftime("%Y-%m-%d"),
-            "summary": _make_day_summary(events),
+            "date": today.isoformat(),
+            "summary": _make_day_summary(views),
         }
 
     except CalendarAuthError as e:
@@ -111,15 +138,16 @@ def get_upcoming_events(
     data_dir: Path,
     days: int = 7,
     max_results: int = 20,
+    no_cache: bool = False,
 ) -> dict[str, Any]:
-    """Fetch upcoming calendar events for next N days.
+    """Fetch upcoming calendar events for next N days (cached like get_today_events).
 
     Returns:
         Dict with 'events' list and metadata.
     """
-    client = CalendarClient(data_dir)
+    client = _get_shared_client(CalendarClient, data_dir)
 
-    if not client.authenticate():
+    if not _locked_call(CalendarClient, client.authenticate):
         return {
             "error": "Calendar not authenticated. Run 'omnibrain setup-google' first.",
             "events": [],
@@ -127,14 +155,19 @@ def get_upcoming_events(
         }
 
     try:
-        events = client.get_upcoming_events(days=days, max_results=max_results)
-        event_dicts = [_event_to_agent_view(e) for e in events]
+        views = _event_views(_cached_fetch(
+            _fetch_cache,
+            ("upcoming", str(data_dir), days, max_results),
+            lambda: _locked_call(CalendarClient, client.get_upcoming_events, days=days, max_results=max_results),
+            no_cache,
+        ))
+        event_dicts = [_event_to_agent_view(v) for v in views]
 
         return {
             "events": event_dicts,
             "count": len(event_dicts),
             "days_ahead": days,
-            "summary": _make_week_summary(events, days),
+            "summary": _make_week_summary(views, days),
         }
 
     except CalendarAuthError as e:
@@ -189,20 +222,26 @@ def generate_meeting_brief(
     Returns:
         Dict with meeting brief details.
     """
-    client = CalendarClient(data_dir)
+    client = _get_shared_client(CalendarClient, data_dir)
 
-    if not client.authenticate():
+    if not _locked_call(CalendarClient, client.authenticate):
         return {"error": "Calendar not authenticated."}
 
-    event = client.get_event(event_id)
+    event = _locked_call(CalendarClient, client.get_event, event_id)
     if not event:
         return {"error": f"Event {event_id} not found."}
 
-    # Build attendee context from DB
+    view = _EventView.of(event)
+    attendees = view.attendees
+
+    # Build attendee context from DB; the lowercased forms are looked up
+    # too, so a contact matches whatever case the invite used.
     attendee_context = []
     if db:
-        for email in event.attendees:
-            contact = db.get_contact(email)
+        lowered = [email.lower() for email in attendees]
+        contacts = db.get_contacts_by_email(list(dict.fromkeys(attendees + lowered)))
+        for email, low in zip(attendees, lowered, strict=True):
+            contact = contacts.get(email) or contacts.get(low)
             if contact:
                 attendee_context.append({
                     "email": email,
@@ -221,10 +260,10 @@ def generate_meeting_brief(
                 })
 
     return {
-        "event": _event_to_agent_view(event),
+        "event": _event_to_agent_view(view),
         "attendee_context": attendee_context,
-        "attendee_count": len(event.attendees),
-        "duration_minutes": event.duration_minutes,
+        "attendee_count": len(attendees),
+        "duration_minutes": view.duration_minutes,
         "has_description": bool(event.description),
         "is_recurring": event.is_recurring,
         "preparation_notes": _generate_prep_notes(event, attendee_context),
@@ -237,7 +276,7 @@ def generate_meeting_brief(
 
 
 def store_events_in_db(
-    events: list[CalendarEvent],
+    events: list[CalendarEvent] | list[_EventView],
     db: Any,
 ) -> int:
     """Store fetched calendar events as events in the DB.
@@ -245,33 +284,41 @@ def store_events_in_db(
     Returns:
         Number of events stored.
     """
-    events_stored = 0
-
-    for event in events:
-        try:
-            metadata = {
-                "calendar_id": event.id,
-                "attendees": event.attendees,
-                "location": event.location,
-                "is_recurring": event.is_recurring,
-                "duration_minutes": event.duration_minutes,
-                "start_time": event.start_time.isoformat(),
-                "end_time": event.end_time.isoformat(),
-            }
-
-            db.insert_event(
-                source=EventSource.CALENDAR.value,
-                event_type="calendar_event",
-                title=event.title,
-                content=event.description[:2000] if event.description else "",
-                metadata=metadata,
-                priority=0,
-                timestamp=event.start_time.isoformat(),
-                external_id=event.id,
-            )
-            events_stored += 1
-        except Exception as e:
-            logger.warning(f"Failed to store calendar event {event.id}: {e}")
+    rows = [
+        {
+            "source": EventSource.CALENDAR.value,
+            "event_type": "calendar_event",
+            "title": v.event.title,
+            "content": v.event.stored_description if v.event.description else "",
+            "metadata": {
+                "calendar_id": v.event.id,
+                "attendees": v.attendees,
+                "location": v.event.location,
+                "is_recurring": v.event.is_recurring,
+                "duration_minutes": v.duration_minutes,
+                "start_time": v.start_iso,
+                "end_time": v.end_iso,
+            },
+            "priority": 0,
+            "timestamp": v.start_iso,
+            "external_id": v.event.id,
+        }
+        for v in _event_views(events)
+    ]
+
+    # One transaction for the whole fetch; if any row fails, fall back to
+    # row-by-row so the good ones are still stored.
+    try:
+        events_stored = db.insert_events_bulk(rows)
+    except Exception as e:
+        logger.warning(f"Bulk insert of {len(rows)} calendar events failed ({e}), storing one by one")
+        events_stored = 0
+        for row in rows:
+            try:
+                db.insert_event(**row)
+                events_stored += 1
+            except Exception as e:
+                logger.warning(f"Failed to store calendar event {row['external_id']}: {e}")
 
     if events_stored:
         logger.info(f"Stored {events_stored} calendar events in DB")
@@ -283,56 +330,111 @@ def store_events_in_db(
 # ═══════════════════════════════════════════════════════════════════════════
 
 
-def _event_to_agent_view(event: CalendarEvent) -> dict[str, Any]:
+@dataclass(slots=True, frozen=True)
+class _EventView:
+    """A CalendarEvent with its formatted times and attendee list computed once.
+
+    The agent view, the day/week summaries and storage all need the same
+    strings; building them here keeps it to one strftime/isoformat each.
+    """
+
+    event: CalendarEvent
+    start_iso: str
+    end_iso: str
+    hhmm: str
+    date_key: str
+    duration_minutes: int
+    attendees: list[str]
+
+    @classmethod
+    def of(cls, event: CalendarEvent) -> _EventView:
+        start = event.start_time
+        return cls(
+            event=event,
+            start_iso=start.isoformat(),
+            end_iso=event.end_time.isoformat(),
+            hhmm=start.strftime("%H:%M"),
+            date_key=start.strftime("%Y-%m-%d (%A)"),
+            duration_minutes=event.duration_minutes,
+            attendees=_unique_attendees(event.attendees),
+        )
+
+    @property
+    def attendees_summary(self) -> str:
+        """CalendarEvent.attendees_summary, over the de-duplicated list."""
+        return f"{len(self.attendees)} people" if self.attendees else "solo"
+
+
+def _unique_attendees(attendees: list[str]) -> list[str]:
+    """Strip and de-duplicate attendee emails case-insensitively, in order.
+
+    The first spelling seen is kept: contacts are stored under the address
+    as Gmail reported it, so lowercasing here could miss them.
+    """
+    seen: dict[str, str] = {}
+    for email in attendees:
+        email = email.strip()
+        if email:
+            seen.setdefault(email.lower(), email)
+    return list(seen.values())
+
+
+def _event_views(events: Sequence[CalendarEvent] | Sequence[_EventView]) -> list[_EventView]:
+    return [e if isinstance(e, _EventView) else _EventView.of(e) for e in events]
+
+
+def _event_to_agent_view(event: CalendarEvent | _EventView) -> dict[str, Any]:
     """Convert CalendarEvent to a dict optimized for LLM agent consumption."""
+    view = event if isinstance(event, _EventView) else _EventView.of(event)
+    event = view.event
     return {
         "id": event.id,
         "title": event.title,
-        "start_time": event.start_time.isoformat(),
-        "end_time": event.end_time.isoformat(),
-        "duration_minutes": event.duration_minutes,
-        "attendees": event.attendees,
-        "attendees_summary": event.attendees_summary,
+        "start_time": view.start_iso,
+        "end_time": view.end_iso,
+        "duration_minutes": view.duration_minutes,
+        "attendees": view.attendees,
+        "attendees_summary": view.attendees_summary,
         "location": event.location,
-        "description": event.description[:300] if event.description else "",
+        "description": event.agent_description if event.description else "",
         "is_recurring": event.is_recurring,
     }
 
 
-def _make_day_summary(events: list[CalendarEvent]) -> str:
+def _make_day_summary(events: list[CalendarEvent] | list[_EventView]) -> str:
     """Generate a human-readable summary of today's events."""
     if not events:
         return "No events today."
 
-    total_minutes = sum(e.duration_minutes for e in events)
+    views = _event_views(events)
+    total_minutes = sum(v.duration_minutes for v in views)
     hours = total_minutes // 60
     minutes = total_minutes % 60
 
-    lines = [f"{len(events)} events today ({hours}h {minutes}m total):"]
-    for e in events:
-        time_str = e.start_time.strftime("%H:%M")
-        lines.append(f"  • {time_str} — {e.title} ({e.duration_minutes}min, {e.attendees_summary})")
+    lines = [f"{len(views)} events today ({hours}h {minutes}m total):"]
+    for v in views:
+        lines.append(
+            f"  • {v.hhmm} — {v.event.title} ({v.duration_minutes}min, {v.attendees_summary})"
+        )
 
     return "\n".join(lines)
 
 
-def _make_week_summary(events: list[CalendarEvent], days: int) -> str:
+def _make_week_summary(events: list[CalendarEvent] | list[_EventView], days: int) -> str:
     """Generate a summary of upcoming events."""
     if not events:
         return f"No events in the next {days} days."
 
-    # Group by date
-    by_date: dict[str, list[CalendarEvent]] = {}
-    for e in events:
-        date_key = e.start_time.strftime("%Y-%m-%d (%A)")
-        by_date.setdefault(date_key, []).append(e)
+    # Group by date. Sort on the date key first: all-day events sit at UTC
+    # midnight, so start_time order alone can interleave days when timed
+    # events carry a negative UTC offset.
+    views = sorted(_event_views(events), key=lambda v: (v.date_key, v.event.start_time))
 
     lines = [f"{len(events)} events in next {days} days:"]
-    for date, day_events in by_date.items():
-        lines.append(f"\n  {date}:")
-        for e in day_events:
-            time_str = e.start_time.strftime("%H:%M")
-            lines.append(f"    • {time_str} — {e.title} ({e.duration_minutes}min)")
+    for day, day_events in groupby(views, key=attrgetter("date_key")):
+        lines.append(f"\n  {day}:")
+        for v in day_events:
+            lines.append(f"    • {v.hhmm} — {v.event.title} ({v.duration_minutes}min)")
 
     return "\n".join(lines)
 
@@ -350,26 +452,64 @@ def _generate_prep_notes(
     if event.location:
         notes.append(f"Location: {event.location}")
 
-    # Attendee insights
-    known = [a for a in attendee_context if a.get("interaction_count", 0) > 0]
-    unknown = [a for a in attendee_context if a.get("interaction_count", 0) == 0]
+    # Attendee insights — one pass, formatting each line as it is sorted
+    known: list[str] = []
+    unknown: list[str] = []
+    for a in attendee_context:
+        count = a.get("interaction_count", 0)
+        if count > 0:
+            name = a.get("name") or a["email"]
+            rel = a.get("relationship", "unknown")
+            known.append(f"  • {name} — {rel}, {count} interactions")
+        elif count == 0:
+            unknown.append(f"  • {a['email']}")
 
     if known:
         notes.append(f"\nKnown attendees ({len(known)}):")
-        for a in known:
-            name = a.get("name") or a["email"]
-            rel = a.get("relationship", "unknown")
-            count = a.get("interaction_count", 0)
-            notes.append(f"  • {name} — {rel}, {count} interactions")
+        notes.extend(known)
 
     if unknown:
         notes.append(f"\nNew/unknown attendees ({len(unknown)}):")
-        for a in unknown:
-            notes.append(f"  • {a['email']}")
+        notes.extend(unknown)
 
     return "\n".join(notes)
 
 
+# ═══════════════════════════════════════════════════════════════════════════
+# Async entry points
+# ═══════════════════════════════════════════════════════════════════════════
+
+
+async def get_today_events_async(data_dir: Path, no_cache: bool = False) -> dict[str, Any]:
+    """get_today_events in a worker thread, so the event loop keeps serving
+    other tool calls (e.g. email) while Calendar answers."""
+    return await asyncio.to_thread(get_today_events, data_dir, no_cache=no_cache)
+
+
+async def get_upcoming_events_async(
+    data_dir: Path,
+    days: int = 7,
+    max_results: int = 20,
+    no_cache: bool = False,
+) -> dict[str, Any]:
+    """get_upcoming_events in a worker thread (see get_today_events_async)."""
+    return await asyncio.to_thread(
+        get_upcoming_events, data_dir,
+        days=days, max_results=max_results, no_cache=no_cache,
+    )
+
+
+async def generate_meeting_brief_async(
+    data_dir: Path,
+    event_id: str,
+    db: Any = None,
+) -> dict[str, Any]:
+    """generate_meeting_brief in a worker thread (see get_today_events_async)."""
+    return await asyncio.to_thread(
+        generate_meeting_brief, data_dir, event_id=event_id, db=db,
+    )
+
+
 # ═══════════════════════════════════════════════════════════════════════════
 # All tool schemas (for registry)
 # ═══════════════════════════════════════════════════════════════════════════
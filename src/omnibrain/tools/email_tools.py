@@ -17,15 +17,31 @@ Architecture:
 
 from __future__ import annotations
 
+import asyncio
+import functools
 import logging
+import re
 from pathlib import Path
 from typing import Any
 
 from omnibrain.integrations.gmail import GmailAuthError, GmailClient
 from omnibrain.models import ContactInfo, EmailMessage, EventSource
+from omnibrain.tools._google_cache import (
+    _cached_fetch,
+    _FetchCache,
+    _get_shared_client,
+    _locked_call,
+)
 
 logger = logging.getLogger("omnibrain.tools.email")
 
+_fetch_cache = _FetchCache()
+
+
+def invalidate_email_cache() -> None:
+    """Forget cached Gmail results, e.g. after a change made through the API."""
+    _fetch_cache.clear()
+
 
 # ═══════════════════════════════════════════════════════════════════════════
 # Tool: fetch_emails
@@ -62,15 +78,19 @@ def fetch_emails(
     max_results: int = 20,
     query: str = "",
     since_hours: int = 24,
+    no_cache: bool = False,
 ) -> dict[str, Any]:
     """Fetch recent emails from Gmail.
 
+    The same query within ``_FETCH_TTL_S`` is answered from cache unless
+    *no_cache* is set.
+
     Returns:
         Dict with 'emails' list and metadata, suitable for agent consumption.
     """
-    client = GmailClient(data_dir)
+    client = _get_shared_client(GmailClient, data_dir)
 
-    if not client.authenticate():
+    if not _locked_call(GmailClient, client.authenticate):
         return {
             "error": "Gmail not authenticated. Run 'omnibrain setup-google' first.",
             "emails": [],
@@ -78,10 +98,17 @@ def fetch_emails(
         }
 
     try:
-        emails = client.fetch_recent(
-            max_results=max_results,
-            query=query,
-            since_hours=since_hours,
+        emails = _cached_fetch(
+            _fetch_cache,
+            ("fetch", str(data_dir), query, max_results, since_hours),
+            lambda: _locked_call(
+                GmailClient,
+                client.fetch_recent,
+                max_results=max_results,
+                query=query,
+                since_hours=since_hours,
+            ),
+            no_cache,
         )
 
         # Convert to serializable format for agent
@@ -139,15 +166,21 @@ def search_emails(
     data_dir: Path,
     query: str,
     max_results: int = 20,
+    no_cache: bool = False,
 ) -> dict[str, Any]:
-    """Search Gmail with full search syntax."""
-    client = GmailClient(data_dir)
+    """Search Gmail with full search syntax (cached like fetch_emails)."""
+    client = _get_shared_client(GmailClient, data_dir)
 
-    if not client.authenticate():
+    if not _locked_call(GmailClient, client.authenticate):
         return {"error": "Gmail not authenticated.", "emails": [], "count": 0}
 
     try:
-        emails = client.search(query=query, max_results=max_results)
+        emails = _cached_fetch(
+            _fetch_cache,
+            ("search", str(data_dir), query, max_results),
+            lambda: _locked_call(GmailClient, client.search, query=query, max_results=max_results),
+            no_cache,
+        )
         email_dicts = [_email_to_agent_view(e) for e in emails]
         return {
             "emails": email_dicts,
@@ -190,41 +223,13 @@ def classify_email(
 ) -> dict[str, Any]:
     """Classify email urgency via keyword heuristics.
 
+    An automated sender (no-reply, notifications) counts as a notification
+    keyword hit; the subject/preview can still raise it to a higher rule.
+
     Returns structured classification with urgency, category, action, and
     whether a draft reply is recommended.
     """
-    urgency = "medium"
-    category = "fyi"
-    action = "archive"
-    draft_needed = False
-
-    subject_lower = subject.lower()
-    body_lower = body_preview.lower()
-    combined = f"{subject_lower} {body_lower}"
-
-    # Heuristic urgency detection
-    if any(w in combined for w in ["urgent", "asap", "emergency", "critical", "deadline today"]):
-        urgency = "high"
-        category = "action_required"
-        action = "respond"
-        draft_needed = True
-    elif any(w in combined for w in ["action required", "please respond", "waiting for", "follow up"]):
-        urgency = "medium"
-        category = "action_required"
-        action = "respond"
-        draft_needed = True
-    elif any(w in combined for w in ["unsubscribe", "newsletter", "digest", "weekly update"]):
-        urgency = "low"
-        category = "newsletter"
-        action = "archive"
-    elif any(w in combined for w in ["no-reply", "noreply", "notification", "automated"]):
-        urgency = "low"
-        category = "notification"
-        action = "archive"
-    elif any(w in combined for w in ["invoice", "payment", "receipt", "order confirmation"]):
-        urgency = "medium"
-        category = "transactional"
-        action = "archive"
+    urgency, category, action, draft_needed = _classify(subject, body_preview, sender)
 
     return {
         "email_id": email_id,
@@ -240,6 +245,63 @@ def classify_email(
 # Helpers
 # ═══════════════════════════════════════════════════════════════════════════
 
+# Keyword rules in priority order: the first rule with any keyword in the
+# subject/preview decides (urgency, category, action, draft_needed).
+_EMAIL_RULES: tuple[tuple[tuple[str, ...], tuple[str, str, str, bool]], ...] = (
+    (("urgent", "asap", "emergency", "critical", "deadline today"),
+     ("high", "action_required", "respond", True)),
+    (("action required", "please respond", "waiting for", "follow up"),
+     ("medium", "action_required", "respond", True)),
+    (("unsubscribe", "newsletter", "digest", "weekly update"),
+     ("low", "newsletter", "archive", False)),
+    (("no-reply", "noreply", "notification", "automated"),
+     ("low", "notification", "archive", False)),
+    (("invoice", "payment", "receipt", "order confirmation"),
+     ("medium", "transactional", "archive", False)),
+)
+_EMAIL_DEFAULT = ("medium", "fyi", "archive", False)
+_KEYWORD_RANK = {kw: rank for rank, (kws, _) in enumerate(_EMAIL_RULES) for kw in kws}
+_NOTIFICATION_RANK = next(i for i, (_, out) in enumerate(_EMAIL_RULES) if out[1] == "notification")
+
+
+def _keywords_re(ceiling: int) -> re.Pattern[str]:
+    """One pattern for every keyword ranked above *ceiling*.  The lookahead
+    makes every position a candidate, so overlapping keywords are all seen."""
+    kws = (re.escape(kw) for kw, rank in _KEYWORD_RANK.items() if rank < ceiling)
+    return re.compile("(?=(" + "|".join(kws) + "))")
+
+
+_EMAIL_KEYWORDS_RE = _keywords_re(len(_EMAIL_RULES))
+# Most mail comes from automated senders, which settle on "notification"
+# up front; their text is only scanned for the fewer rules that outrank it.
+_ABOVE_NOTIFICATION_RE = _keywords_re(_NOTIFICATION_RANK)
+
+
+@functools.lru_cache(maxsize=4096)
+def _classify(subject: str, body_preview: str, sender: str = "") -> tuple[str, str, str, bool]:
+    """Keyword triage of one email → (urgency, category, action, draft_needed).
+
+    Pure and memoised: newsletters, notifications and thread replies
+    repeat the same inputs constantly.  One regex pass finds every
+    keyword; the highest-priority rule hit wins.
+    """
+    sender = sender.lower()
+    if any(kw in sender for kw in _EMAIL_RULES[_NOTIFICATION_RANK][0]):
+        best, pattern = _NOTIFICATION_RANK, _ABOVE_NOTIFICATION_RE
+    else:
+        best, pattern = len(_EMAIL_RULES), _EMAIL_KEYWORDS_RE
+    # One lower() over the joined text.  Kept as str: an ASCII-only bytes
+    # view would drop accented letters and splice words into false hits.
+    combined = (subject + " " + body_preview).lower()
+    for match in pattern.finditer(combined):
+        rank = _KEYWORD_RANK[match.group(1)]
+        if rank < best:
+            best = rank
+            if rank == 0:
+                break
+    return _EMAIL_RULES[best][1] if best < len(_EMAIL_RULES) else _EMAIL_DEFAULT
+
+
 
 def _email_to_agent_view(email: EmailMessage) -> dict[str, Any]:
     """Convert EmailMessage to a dict optimized for LLM agent consumption.
@@ -255,7 +317,7 @@ def _email_to_agent_view(email: EmailMessage) -> dict[str, Any]:
         "sender_name": email.sender_name,
         "recipients": email.recipients,
         "subject": email.subject,
-        "body_preview": email.body[:500] if email.body else "",
+        "body_preview": email.agent_body if email.body else "",
         "date": email.date.isoformat(),
         "is_read": email.is_read,
         "has_attachments": email.has_attachments,
@@ -275,13 +337,13 @@ def store_emails_in_db(
     This is the "extractor" from manifesto Section 9 — takes raw emails
     and stores structured data in events table + updates contacts table.
     """
-    events_stored = 0
-    contacts_updated = 0
-
-    for email in emails:
-        # Store as event
-        try:
-            metadata = {
+    rows = [
+        {
+            "source": EventSource.GMAIL.value,
+            "event_type": "email",
+            "title": f"Email from {email.sender_name or email.sender_email}: {email.subject}",
+            "content": email.stored_body if email.body else "",  # Cap body at 2KB
+            "metadata": {
                 "gmail_id": email.id,
                 "thread_id": email.thread_id,
                 "sender": email.sender,
@@ -290,38 +352,86 @@ def store_emails_in_db(
                 "is_read": email.is_read,
                 "has_attachments": email.has_attachments,
                 "labels": email.labels,
-            }
-
-            db.insert_event(
-                source=EventSource.GMAIL.value,
-                event_type="email",
-                title=f"Email from {email.sender_name or email.sender_email}: {email.subject}",
-                content=email.body[:2000] if email.body else "",  # Cap body at 2KB
-                metadata=metadata,
-                priority=0,
-                timestamp=email.date.isoformat() if email.date else None,
-                external_id=email.id,
-            )
-            events_stored += 1
-        except Exception as e:
-            logger.warning(f"Failed to store email event {email.id}: {e}")
-
-        # Upsert contact from sender
-        try:
-            contact = ContactInfo(
-                email=email.sender_email,
-                name=email.sender_name,
-                last_interaction=email.date,
-            )
-            db.upsert_contact(contact)
-            contacts_updated += 1
-        except Exception as e:
-            logger.warning(f"Failed to upsert contact {email.sender_email}: {e}")
+            },
+            "priority": 0,
+            "timestamp": email.date.isoformat() if email.date else None,
+            "external_id": email.id,
+        }
+        for email in emails
+    ]
+    # Contacts from senders
+    contacts = [
+        ContactInfo(
+            email=email.sender_email,
+            name=email.sender_name,
+            last_interaction=email.date,
+        )
+        for email in emails
+    ]
+
+    # One transaction per table; if any row fails, fall back to row-by-row
+    # so the good ones are still stored.
+    try:
+        events_stored = db.insert_events_bulk(rows)
+    except Exception as e:
+        logger.warning(f"Bulk insert of {len(rows)} email events failed ({e}), storing one by one")
+        events_stored = 0
+        for row in rows:
+            try:
+                db.insert_event(**row)
+                events_stored += 1
+            except Exception as e:
+                logger.warning(f"Failed to store email event {row['external_id']}: {e}")
+
+    try:
+        contacts_updated = db.upsert_contacts_bulk(contacts)
+    except Exception as e:
+        logger.warning(f"Bulk upsert of {len(contacts)} contacts failed ({e}), upserting one by one")
+        contacts_updated = 0
+        for contact in contacts:
+            try:
+                db.upsert_contact(contact)
+                contacts_updated += 1
+            except Exception as e:
+                logger.warning(f"Failed to upsert contact {contact.email}: {e}")
 
     logger.info(f"Stored {events_stored} email events, updated {contacts_updated} contacts")
     return events_stored, contacts_updated
 
 
+# ═══════════════════════════════════════════════════════════════════════════
+# Async entry points
+# ═══════════════════════════════════════════════════════════════════════════
+
+
+async def fetch_emails_async(
+    data_dir: Path,
+    max_results: int = 20,
+    query: str = "",
+    since_hours: int = 24,
+    no_cache: bool = False,
+) -> dict[str, Any]:
+    """fetch_emails in a worker thread, so the event loop keeps serving
+    other tool calls (e.g. calendar) while Gmail answers."""
+    return await asyncio.to_thread(
+        fetch_emails, data_dir,
+        max_results=max_results, query=query, since_hours=since_hours, no_cache=no_cache,
+    )
+
+
+async def search_emails_async(
+    data_dir: Path,
+    query: str,
+    max_results: int = 20,
+    no_cache: bool = False,
+) -> dict[str, Any]:
+    """search_emails in a worker thread (see fetch_emails_async)."""
+    return await asyncio.to_thread(
+        search_emails, data_dir,
+        query=query, max_results=max_results, no_cache=no_cache,
+    )
+
+
 # ═══════════════════════════════════════════════════════════════════════════
 # All tool schemas (for registry)
 # ═══════════════════════════════════════════════════════════════════════════
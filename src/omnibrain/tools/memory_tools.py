@@ -114,11 +114,17 @@ def search_memory(
         f"max={max_results}, days={time_range_days}"
     )
 
+    embedding = None
+    if memory_manager.has_chroma:
+        embedding, cache_hit = memory_manager.embed_query(query)
+        logger.debug(f"Query embedding cache {'hit' if cache_hit else 'miss'}")
+
     docs = memory_manager.search(
         query=query,
         max_results=max_results,
         source_filter=source_filter,
         time_range_days=time_range_days,
+        query_embedding=embedding,
     )
 
     results = []
@@ -220,13 +226,19 @@ def ingest_emails_to_memory(
     stored = 0
     failed = 0
 
-    for email_data in emails:
-        try:
-            memory_manager.store_email(email_data)
-            stored += 1
-        except Exception as e:
-            logger.warning(f"Failed to ingest email: {e}")
-            failed += 1
+    # One transaction for the whole batch; if it can't be built (e.g. a
+    # malformed entry), fall back to one email at a time.
+    try:
+        stored = len(memory_manager.store_email_batch(emails))
+    except Exception as e:
+        logger.warning(f"Batch ingest of {len(emails)} emails failed ({e}), ingesting one by one")
+        for email_data in emails:
+            try:
+                memory_manager.store_email(email_data)
+                stored += 1
+            except Exception as e:
+                logger.warning(f"Failed to ingest email: {e}")
+                failed += 1
 
     logger.info(f"Ingested {stored}/{len(emails)} emails to memory")
     return {"stored": stored, "failed": failed, "total": len(emails)}
@@ -251,13 +263,17 @@ def ingest_events_to_memory(
     stored = 0
     failed = 0
 
-    for event_data in events:
-        try:
-            memory_manager.store_calendar_event(event_data)
-            stored += 1
-        except Exception as e:
-            logger.warning(f"Failed to ingest event: {e}")
-            failed += 1
+    try:
+        stored = len(memory_manager.store_calendar_event_batch(events))
+    except Exception as e:
+        logger.warning(f"Batch ingest of {len(events)} events failed ({e}), ingesting one by one")
+        for event_data in events:
+            try:
+                memory_manager.store_calendar_event(event_data)
+                stored += 1
+            except Exception as e:
+                logger.warning(f"Failed to ingest event: {e}")
+                failed += 1
 
     logger.info(f"Ingested {stored}/{len(events)} events to memory")
     return {"stored": stored, "failed": failed, "total": len(events)}
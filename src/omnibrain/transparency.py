@@ -16,11 +16,15 @@ machine is accounted for here.
 
 from __future__ import annotations
 
+import atexit
+import functools
 import hashlib
 import logging
+import queue
 import sqlite3
+import threading
 import time
-from collections.abc import AsyncGenerator, Generator
+from collections.abc import AsyncGenerator, Generator, Sequence
 from contextlib import contextmanager
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta
@@ -52,7 +56,8 @@ CREATE TABLE IF NOT EXISTS llm_calls (
     source TEXT DEFAULT '',
     duration_ms INTEGER DEFAULT 0,
     success BOOLEAN DEFAULT 1,
-    error_message TEXT
+    error_message TEXT,
+    ts_epoch INTEGER
 );
 
 CREATE INDEX IF NOT EXISTS idx_llm_calls_timestamp ON llm_calls(timestamp);
@@ -60,13 +65,112 @@ CREATE INDEX IF NOT EXISTS idx_llm_calls_provider ON llm_calls(provider);
 CREATE INDEX IF NOT EXISTS idx_llm_calls_source ON llm_calls(source);
 """
 
+# ``timestamp`` stays the display text; range filters use ``ts_epoch`` (unix
+# seconds). Applied after the ts_epoch migration so older databases have
+# the column. Inserts that omit ts_epoch get it from timestamp.
+_EPOCH_SCHEMA = """
+CREATE INDEX IF NOT EXISTS idx_llm_calls_ts_provider_cost
+    ON llm_calls(ts_epoch, provider, cost_estimate);
+CREATE INDEX IF NOT EXISTS idx_llm_calls_ts_source ON llm_calls(ts_epoch, source);
+
+CREATE TRIGGER IF NOT EXISTS llm_calls_ts_epoch AFTER INSERT ON llm_calls
+WHEN NEW.ts_epoch IS NULL BEGIN
+    UPDATE llm_calls SET ts_epoch = COALESCE(CAST(strftime('%s', NEW.timestamp) AS INTEGER), 0)
+    WHERE id = NEW.id;
+END;
+"""
+
+# The schema is complete once the ts_epoch trigger, the last object the
+# schema scripts create, exists (dropping llm_calls drops it too). Checked
+# instead of PRAGMA user_version because omnibrain.db is shared with
+# OmniBrainDB and the version number is not ours to claim.
+_SCHEMA_CURRENT_SQL = (
+    "SELECT 1 FROM sqlite_master WHERE type = 'trigger' AND name = 'llm_calls_ts_epoch'"
+)
+
+_INSERT_CALL_SQL = """INSERT INTO llm_calls
+    (provider, model, prompt_preview, prompt_hash,
+     prompt_size_bytes, response_size_bytes,
+     input_tokens, output_tokens,
+     cache_read_tokens, cache_creation_tokens,
+     cost_estimate, source, duration_ms, success, error_message, ts_epoch)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?,
+            CAST(strftime('%s', 'now') AS INTEGER))"""
+
+# Every get_stats figure from a single scan: one row per (provider, source),
+# with the stats window (:since), today and this month as aggregate filters.
+# Rows only inside this month but outside the window have calls = 0. The
+# day and month boundaries (local midnight, as epoch seconds) are computed
+# by SQLite once per query.
+_STATS_SQL = """WITH bounds AS (SELECT
+    CAST(strftime('%s', 'now', 'localtime', 'start of day', 'utc') AS INTEGER) AS today,
+    CAST(strftime('%s', 'now', 'localtime', 'start of month', 'utc') AS INTEGER) AS month)
+SELECT provider, source,
+    COUNT(*) FILTER (WHERE ts_epoch >= :since) AS calls,
+    COALESCE(SUM(input_tokens) FILTER (WHERE ts_epoch >= :since), 0) AS input_tokens,
+    COALESCE(SUM(output_tokens) FILTER (WHERE ts_epoch >= :since), 0) AS output_tokens,
+    COALESCE(SUM(cost_estimate) FILTER (WHERE ts_epoch >= :since), 0) AS cost,
+    COALESCE(SUM(duration_ms) FILTER (WHERE ts_epoch >= :since), 0) AS duration_ms,
+    COUNT(duration_ms) FILTER (WHERE ts_epoch >= :since) AS timed_calls,
+    COALESCE(SUM(prompt_size_bytes) FILTER (WHERE ts_epoch >= :since), 0) AS bytes_sent,
+    COUNT(*) FILTER (WHERE ts_epoch >= bounds.today) AS calls_today,
+    COALESCE(SUM(cost_estimate) FILTER (WHERE ts_epoch >= bounds.today), 0) AS cost_today,
+    COALESCE(SUM(cost_estimate) FILTER (WHERE ts_epoch >= bounds.month), 0) AS cost_month
+FROM llm_calls, bounds
+WHERE ts_epoch >= MIN(:since, bounds.month)
+GROUP BY provider, source"""
+
+# get_calls page; {where} is built from a fixed set of filter clauses, so
+# each filter combination always yields the same statement text. Columns
+# are in LLMCallRecord field order, NULLs already replaced by the defaults.
+_SELECT_CALLS_SQL = """SELECT id, timestamp, provider, COALESCE(model, ''),
+    COALESCE(prompt_preview, ''), COALESCE(prompt_hash, ''),
+    COALESCE(prompt_size_bytes, 0), COALESCE(response_size_bytes, 0),
+    COALESCE(input_tokens, 0), COALESCE(output_tokens, 0),
+    COALESCE(cache_read_tokens, 0), COALESCE(cache_creation_tokens, 0),
+    COALESCE(cost_estimate, 0.0), COALESCE(source, ''), COALESCE(duration_ms, 0),
+    success, COALESCE(error_message, '')
+FROM llm_calls {where} ORDER BY id DESC LIMIT ? OFFSET ?"""
+
+_DAILY_COSTS_SQL = """SELECT DATE(timestamp) as day,
+       provider,
+       COUNT(*) as calls,
+       COALESCE(SUM(cost_estimate), 0) as cost,
+       COALESCE(SUM(input_tokens), 0) as input_tokens,
+       COALESCE(SUM(output_tokens), 0) as output_tokens
+FROM llm_calls
+WHERE ts_epoch >= ?
+GROUP BY day, provider
+ORDER BY day"""
+
+_PRUNE_SQL = "DELETE FROM llm_calls WHERE ts_epoch < ?"
+
+# Prepared statements kept per connection (sqlite3 keys them by SQL text);
+# the logger's constant statements plus every get_calls filter combination.
+_STATEMENT_CACHE_SIZE = 256
+
+# The background writer coalesces queued calls into one transaction (one
+# fsync) per batch: it writes once it has _WRITE_BATCH_SIZE calls or the
+# first queued call has waited _WRITE_BATCH_WINDOW_S, whichever comes first.
+_WRITE_BATCH_SIZE = 32
+_WRITE_BATCH_WINDOW_S = 0.5
+
+# Queued by flush() to end the writer's current batch window early.
+_FLUSH_REQUEST: dict[str, Any] = {}
+# Queued by close(): the writer writes what it holds and exits.
+_STOP_WRITER: dict[str, Any] = {}
+
+# Prompt hashes are BLAKE2b-128, tagged so they can be told apart from the
+# untagged SHA-256 hashes in rows logged before the switch.
+_PROMPT_HASH_PREFIX = "b2:"
+
 
 # ═══════════════════════════════════════════════════════════════════════════
 # Data classes
 # ═══════════════════════════════════════════════════════════════════════════
 
 
-@dataclass
+@dataclass(slots=True)
 class LLMCallRecord:
     """A single logged LLM invocation."""
 
@@ -132,13 +236,15 @@ class TransparencyStats:
     bytes_sent_total: int = 0
 
     def to_dict(self) -> dict[str, Any]:
+        # Round each cost once; the same values feed the nested and legacy keys
+        cost_by_provider = {k: round(v, 6) for k, v in self.cost_by_provider.items()}
+        total_cost = round(self.total_cost, 6)
+
         # Merge provider calls + costs into a single nested dict (matches frontend schema)
-        by_provider: dict[str, dict[str, Any]] = {}
-        for provider, calls in self.calls_by_provider.items():
-            by_provider[provider] = {
-                "calls": calls,
-                "cost": round(self.cost_by_provider.get(provider, 0.0), 6),
-            }
+        by_provider: dict[str, dict[str, Any]] = {
+            provider: {"calls": calls, "cost": cost_by_provider.get(provider, 0.0)}
+            for provider, calls in self.calls_by_provider.items()
+        }
 
         # Merge source calls into a nested dict (frontend expects by_source.calls)
         by_source: dict[str, dict[str, Any]] = {
@@ -150,14 +256,14 @@ class TransparencyStats:
             "total_calls": self.total_calls,
             "total_input_tokens": self.total_input_tokens,
             "total_output_tokens": self.total_output_tokens,
-            "total_cost_usd": round(self.total_cost, 6),
+            "total_cost_usd": total_cost,
             # Legacy key kept for backward compat
-            "total_cost": round(self.total_cost, 6),
+            "total_cost": total_cost,
             "by_provider": by_provider,
             "by_source": by_source,
             # Legacy keys kept for backward compat
             "calls_by_provider": self.calls_by_provider,
-            "cost_by_provider": {k: round(v, 6) for k, v in self.cost_by_provider.items()},
+            "cost_by_provider": cost_by_provider,
             "calls_by_source": self.calls_by_source,
             "avg_duration_ms": round(self.avg_duration_ms, 1),
             "calls_today": self.calls_today,
@@ -176,7 +282,8 @@ class TransparencyLogger:
     """Logs every LLM call to SQLite for full auditability.
 
     Designed to wrap LLMRouter.stream() with zero overhead on the
-    streaming path — the write happens after the stream completes.
+    streaming path — calls logged from a stream are queued and written
+    by a background thread; queries flush the queue first.
 
     Usage::
 
@@ -190,29 +297,94 @@ class TransparencyLogger:
 
     def __init__(self, data_dir: Path) -> None:
         self._db_path = data_dir / "omnibrain.db"
+        # One connection for the logger's lifetime, shared across threads
+        # (stream hooks fire from worker threads) and serialized by _lock.
+        self._conn: sqlite3.Connection | None = None
+        self._lock = threading.Lock()
+        self._queue: queue.Queue[dict[str, Any]] = queue.Queue()
+        self._writer: threading.Thread | None = None
+        self._writer_lock = threading.Lock()
         self._ensure_schema()
 
     def _ensure_schema(self) -> None:
         """Create transparency tables if they don't exist."""
         try:
             with self._connect() as conn:
+                if conn.execute(_SCHEMA_CURRENT_SQL).fetchone():
+                    return
                 conn.executescript(TRANSPARENCY_SCHEMA)
+                self._migrate_ts_epoch(conn)
+                conn.executescript(_EPOCH_SCHEMA)
         except Exception as e:
             logger.error(f"Failed to create transparency schema: {e}")
 
-    @contextmanager
-    def _connect(self) -> Generator[sqlite3.Connection, None, None]:
-        conn = sqlite3.connect(str(self._db_path))
-        conn.execute("PRAGMA journal_mode=WAL")
-        conn.execute("PRAGMA busy_timeout=5000")
+    @staticmethod
+    def _migrate_ts_epoch(conn: sqlite3.Connection) -> None:
+        """Add and backfill ts_epoch on databases created before it existed."""
+        cols = [r[1] for r in conn.execute("PRAGMA table_info(llm_calls)").fetchall()]
+        if "ts_epoch" in cols:
+            return
+        logger.info("Migrating llm_calls: adding ts_epoch")
+        conn.execute("BEGIN IMMEDIATE")
         try:
-            yield conn
-            conn.commit()
-        except Exception:
-            conn.rollback()
+            conn.execute("ALTER TABLE llm_calls ADD COLUMN ts_epoch INTEGER")
+            conn.execute(
+                "UPDATE llm_calls SET ts_epoch = "
+                "COALESCE(CAST(strftime('%s', timestamp) AS INTEGER), 0)"
+            )
+        except BaseException:
+            conn.execute("ROLLBACK")
             raise
-        finally:
-            conn.close()
+        conn.execute("COMMIT")
+
+    def _open(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(
+            str(self._db_path),
+            check_same_thread=False,
+            isolation_level=None,
+            cached_statements=_STATEMENT_CACHE_SIZE,
+        )
+        conn.row_factory = sqlite3.Row
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA busy_timeout=5000")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute("PRAGMA temp_store=MEMORY")
+        conn.execute("PRAGMA cache_size=-20000")
+        return conn
+
+    @contextmanager
+    def _connect(self, *, write: bool = False) -> Generator[sqlite3.Connection, None, None]:
+        """The shared connection, held under the lock.
+
+        The connection is in autocommit mode; ``write=True`` wraps the block
+        in an explicit transaction.
+        """
+        with self._lock:
+            if self._conn is None:
+                self._conn = self._open()
+            conn = self._conn
+            if not write:
+                yield conn
+                return
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                yield conn
+            except BaseException:
+                conn.execute("ROLLBACK")
+                raise
+            conn.execute("COMMIT")
+
+    def close(self) -> None:
+        """Write queued calls, stop the writer and close the shared connection.
+
+        Both come back on next use. Until then nothing (not even atexit)
+        holds a reference to the logger.
+        """
+        self._stop_writer()
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
 
     # ──────────────────────────────────────────────────────────
     # Core logging
@@ -224,7 +396,9 @@ class TransparencyLogger:
         provider: str,
         model: str = "",
         prompt_text: str = "",
+        prompt_parts: Sequence[str] = (),
         response_text: str = "",
+        response_size_bytes: int = 0,
         input_tokens: int = 0,
         output_tokens: int = 0,
         cache_read_tokens: int = 0,
@@ -235,35 +409,107 @@ class TransparencyLogger:
         success: bool = True,
         error_message: str = "",
     ) -> int:
-        """Log a single LLM call. Returns the row ID."""
-        prompt_preview = prompt_text[:500] if prompt_text else ""
-        prompt_hash = hashlib.sha256(prompt_text.encode()).hexdigest() if prompt_text else ""
-        prompt_size = len(prompt_text.encode()) if prompt_text else 0
-        response_size = len(response_text.encode()) if response_text else 0
+        """Log a single LLM call. Returns the row ID.
+
+        The prompt may be given whole (``prompt_text``) or as the pieces it
+        was assembled from (``prompt_parts``). Pass either ``response_text``
+        or, when only its size is known, ``response_size_bytes``.
 
+        Writes synchronously; the streaming paths use ``enqueue_call``.
+        """
+        row = _call_row(
+            provider=provider, model=model,
+            prompt_text=prompt_text, prompt_parts=prompt_parts,
+            response_text=response_text,
+            response_size_bytes=response_size_bytes,
+            input_tokens=input_tokens, output_tokens=output_tokens,
+            cache_read_tokens=cache_read_tokens, cache_creation_tokens=cache_creation_tokens,
+            cost_estimate=cost_estimate, source=source, duration_ms=duration_ms,
+            success=success, error_message=error_message,
+        )
         try:
-            with self._connect() as conn:
-                cursor = conn.execute(
-                    """INSERT INTO llm_calls
-                       (provider, model, prompt_preview, prompt_hash,
-                        prompt_size_bytes, response_size_bytes,
-                        input_tokens, output_tokens,
-                        cache_read_tokens, cache_creation_tokens,
-                        cost_estimate, source, duration_ms, success, error_message)
-                       VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)""",
-                    (
-                        provider, model, prompt_preview, prompt_hash,
-                        prompt_size, response_size,
-                        input_tokens, output_tokens,
-                        cache_read_tokens, cache_creation_tokens,
-                        cost_estimate, source, duration_ms, success, error_message,
-                    ),
-                )
+            with self._connect(write=True) as conn:
+                cursor = conn.execute(_INSERT_CALL_SQL, row)
                 return cursor.lastrowid or 0
         except Exception as e:
             logger.error(f"Failed to log LLM call: {e}")
             return 0
 
+    def enqueue_call(self, **call: Any) -> None:
+        """Queue an LLM call for the background writer and return at once.
+
+        Takes the same keyword arguments as ``log_call``. Hashing and the
+        INSERT happen on the writer thread, off the response path.
+        """
+        self._queue.put_nowait(call)
+        if self._writer is None:
+            self._start_writer()
+
+    def flush(self) -> None:
+        """Block until every queued call has been written."""
+        if self._writer is not None:
+            self._queue.put_nowait(_FLUSH_REQUEST)
+            self._queue.join()
+
+    def _start_writer(self) -> None:
+        with self._writer_lock:
+            if self._writer is not None:
+                return
+            self._writer = threading.Thread(
+                target=self._writer_loop, name="transparency-writer", daemon=True,
+            )
+            self._writer.start()
+            atexit.register(self.flush)
+
+    def _stop_writer(self) -> None:
+        with self._writer_lock:
+            writer = self._writer
+            if writer is None:
+                return
+            atexit.unregister(self.flush)
+            self._queue.put_nowait(_STOP_WRITER)
+            writer.join()
+            self._writer = None
+
+    def _writer_loop(self) -> None:
+        while True:
+            items = [self._queue.get()]
+            deadline = time.monotonic() + _WRITE_BATCH_WINDOW_S
+            while items[-1] is not _FLUSH_REQUEST and items[-1] is not _STOP_WRITER \
+                    and len(items) < _WRITE_BATCH_SIZE:
+                timeout = deadline - time.monotonic()
+                if timeout <= 0:
+                    break
+                try:
+                    items.append(self._queue.get(timeout=timeout))
+                except queue.Empty:
+                    break
+            try:
+                self._write_batch([
+                    item for item in items
+                    if item is not _FLUSH_REQUEST and item is not _STOP_WRITER
+                ])
+            finally:
+                for _ in items:
+                    self._queue.task_done()
+            if items[-1] is _STOP_WRITER:
+                return
+
+    def _write_batch(self, calls: list[dict[str, Any]]) -> None:
+        rows = []
+        for call in calls:
+            try:
+                rows.append(_call_row(**call))
+            except Exception as e:
+                logger.error(f"Dropping malformed LLM call log: {e}")
+        if not rows:
+            return
+        try:
+            with self._connect(write=True) as conn:
+                conn.executemany(_INSERT_CALL_SQL, rows)
+        except Exception as e:
+            logger.error(f"Failed to log {len(rows)} LLM calls: {e}")
+
     async def wrap_stream(
         self,
         stream: AsyncGenerator,
@@ -271,16 +517,15 @@ class TransparencyLogger:
         source: str = "",
         provider: str = "",
         prompt_text: str = "",
+        prompt_parts: Sequence[str] = (),
     ) -> AsyncGenerator:
         """Wrap an LLMRouter stream, accumulate metadata, log on completion.
 
         This is a transparent passthrough — the caller gets identical
         StreamChunk objects. The log write happens after the stream ends.
         """
-        from omnigent.cost_tracker import PRICING
-
         start_time = time.monotonic()
-        response_parts: list[str] = []
+        response_size = 0
         total_input = 0
         total_output = 0
         total_cache_read = 0
@@ -293,7 +538,8 @@ class TransparencyLogger:
             async for chunk in stream:
                 # Accumulate metadata from chunks
                 if chunk.content:
-                    response_parts.append(chunk.content)
+                    # Only the size is logged; the response itself is not kept.
+                    response_size += len(chunk.content.encode())
                 if chunk.model:
                     model = chunk.model
                 if chunk.input_tokens:
@@ -311,25 +557,17 @@ class TransparencyLogger:
             raise
         finally:
             duration_ms = int((time.monotonic() - start_time) * 1000)
-            response_text = "".join(response_parts)
-
-            # Compute cost from pricing table
-            cost = 0.0
-            provider_key = provider.lower()
-            if provider_key in PRICING:
-                pricing = PRICING[provider_key]
-                cost = (
-                    (total_input / 1_000_000) * pricing.input_per_million
-                    + (total_output / 1_000_000) * pricing.output_per_million
-                    + (total_cache_read / 1_000_000) * pricing.cache_read_per_million
-                    + (total_cache_creation / 1_000_000) * pricing.cache_creation_per_million
-                )
-
-            self.log_call(
+
+            cost = self._estimate_cost(
+                provider, total_input, total_output, total_cache_read, total_cache_creation,
+            )
+
+            self.enqueue_call(
                 provider=provider or "unknown",
                 model=model,
                 prompt_text=prompt_text,
-                response_text=response_text,
+                prompt_parts=prompt_parts,
+                response_size_bytes=response_size,
                 input_tokens=total_input,
                 output_tokens=total_output,
                 cache_read_tokens=total_cache_read,
@@ -355,22 +593,13 @@ class TransparencyLogger:
 
         Called automatically after every stream completes when the hook is
         registered on the router. Computes cost from the PRICING table and
-        persists a log record. Sync-safe (no async needed).
+        queues a log record for the background writer. Sync-safe (no async needed).
         """
-        from omnigent.cost_tracker import PRICING
-
-        cost = 0.0
-        provider_key = provider.lower()
-        if provider_key in PRICING:
-            p = PRICING[provider_key]
-            cost = (
-                (input_tokens / 1_000_000) * p.input_per_million
-                + (output_tokens / 1_000_000) * p.output_per_million
-                + (cache_read_tokens / 1_000_000) * p.cache_read_per_million
-                + (cache_creation_tokens / 1_000_000) * p.cache_creation_per_million
-            )
+        cost = self._estimate_cost(
+            provider, input_tokens, output_tokens, cache_read_tokens, cache_creation_tokens,
+        )
 
-        self.log_call(
+        self.enqueue_call(
             provider=provider,
             model=model,
             input_tokens=input_tokens,
@@ -381,6 +610,25 @@ class TransparencyLogger:
             source=source or "unknown",
         )
 
+    def _estimate_cost(
+        self,
+        provider: str,
+        input_tokens: int,
+        output_tokens: int,
+        cache_read_tokens: int,
+        cache_creation_tokens: int,
+    ) -> float:
+        """Cost in USD from the PRICING table; 0.0 for unpriced providers."""
+        rates = _per_token_rates(provider)
+        if rates is None:
+            return 0.0
+        return (
+            input_tokens * rates[0]
+            + output_tokens * rates[1]
+            + cache_read_tokens * rates[2]
+            + cache_creation_tokens * rates[3]
+        )
+
     # ──────────────────────────────────────────────────────────
     # Queries
     # ──────────────────────────────────────────────────────────
@@ -414,35 +662,16 @@ class TransparencyLogger:
 
         where = f"WHERE {' AND '.join(conditions)}" if conditions else ""
 
+        self.flush()
         try:
             with self._connect() as conn:
-                conn.row_factory = sqlite3.Row
-                rows = conn.execute(
-                    f"SELECT * FROM llm_calls {where} ORDER BY id DESC LIMIT ? OFFSET ?",  # noqa: S608
+                cursor = conn.cursor()
+                cursor.row_factory = None  # plain tuples, in field order
+                rows = cursor.execute(
+                    _SELECT_CALLS_SQL.format(where=where),
                     (*params, limit, offset),
                 ).fetchall()
-                return [
-                    LLMCallRecord(
-                        id=r["id"],
-                        timestamp=r["timestamp"],
-                        provider=r["provider"],
-                        model=r["model"] or "",
-                        prompt_preview=r["prompt_preview"] or "",
-                        prompt_hash=r["prompt_hash"] or "",
-                        prompt_size_bytes=r["prompt_size_bytes"] or 0,
-                        response_size_bytes=r["response_size_bytes"] or 0,
-                        input_tokens=r["input_tokens"] or 0,
-                        output_tokens=r["output_tokens"] or 0,
-                        cache_read_tokens=r["cache_read_tokens"] or 0,
-                        cache_creation_tokens=r["cache_creation_tokens"] or 0,
-                        cost_estimate=r["cost_estimate"] or 0.0,
-                        source=r["source"] or "",
-                        duration_ms=r["duration_ms"] or 0,
-                        success=bool(r["success"]),
-                        error_message=r["error_message"] or "",
-                    )
-                    for r in rows
-                ]
+                return [LLMCallRecord(*r[:-2], bool(r[-2]), r[-1]) for r in rows]
         except Exception as e:
             logger.error(f"Failed to query LLM calls: {e}")
             return []
@@ -455,77 +684,34 @@ class TransparencyLogger:
                   If 0, include all calls.
         """
         stats = TransparencyStats()
-        time_filter = ""
-        params: list[Any] = []
-
-        if days > 0:
-            since = (datetime.now() - timedelta(days=days)).isoformat()
-            time_filter = "WHERE timestamp >= ?"
-            params = [since]
+        params = {"since": _epoch(datetime.now() - timedelta(days=days)) if days > 0 else 0}
 
+        self.flush()
         try:
             with self._connect() as conn:
-                conn.row_factory = sqlite3.Row
-
-                # Overall totals
-                row = conn.execute(
-                    f"""SELECT
-                        COUNT(*) as total,
-                        COALESCE(SUM(input_tokens), 0) as total_in,
-                        COALESCE(SUM(output_tokens), 0) as total_out,
-                        COALESCE(SUM(cost_estimate), 0) as total_cost,
-                        COALESCE(AVG(duration_ms), 0) as avg_ms,
-                        COALESCE(SUM(prompt_size_bytes), 0) as bytes_sent
-                    FROM llm_calls {time_filter}""",
-                    params,
-                ).fetchone()
-                if row:
-                    stats.total_calls = row["total"]
-                    stats.total_input_tokens = row["total_in"]
-                    stats.total_output_tokens = row["total_out"]
-                    stats.total_cost = row["total_cost"]
-                    stats.avg_duration_ms = row["avg_ms"]
-                    stats.bytes_sent_total = row["bytes_sent"]
-
-                # By provider
-                for r in conn.execute(
-                    f"""SELECT provider, COUNT(*) as cnt, COALESCE(SUM(cost_estimate), 0) as cost
-                        FROM llm_calls {time_filter}
-                        GROUP BY provider""",
-                    params,
-                ).fetchall():
-                    stats.calls_by_provider[r["provider"]] = r["cnt"]
-                    stats.cost_by_provider[r["provider"]] = r["cost"]
-
-                # By source
-                for r in conn.execute(
-                    f"""SELECT source, COUNT(*) as cnt
-                        FROM llm_calls {time_filter}
-                        GROUP BY source""",
-                    params,
-                ).fetchall():
-                    stats.calls_by_source[r["source"] or "unknown"] = r["cnt"]
-
-                # Today
-                today = datetime.now().strftime("%Y-%m-%d")
-                today_row = conn.execute(
-                    """SELECT COUNT(*) as cnt, COALESCE(SUM(cost_estimate), 0) as cost
-                       FROM llm_calls WHERE timestamp >= ?""",
-                    (today,),
-                ).fetchone()
-                if today_row:
-                    stats.calls_today = today_row["cnt"]
-                    stats.cost_today = today_row["cost"]
-
-                # This month
-                month_start = datetime.now().strftime("%Y-%m-01")
-                month_row = conn.execute(
-                    """SELECT COALESCE(SUM(cost_estimate), 0) as cost
-                       FROM llm_calls WHERE timestamp >= ?""",
-                    (month_start,),
-                ).fetchone()
-                if month_row:
-                    stats.cost_this_month = month_row["cost"]
+                timed_calls = 0
+                total_duration = 0
+                for r in conn.execute(_STATS_SQL, params):
+                    stats.calls_today += r["calls_today"]
+                    stats.cost_today += r["cost_today"]
+                    stats.cost_this_month += r["cost_month"]
+                    if not r["calls"]:
+                        continue  # only counted for today / this month
+                    stats.total_calls += r["calls"]
+                    stats.total_input_tokens += r["input_tokens"]
+                    stats.total_output_tokens += r["output_tokens"]
+                    stats.total_cost += r["cost"]
+                    stats.bytes_sent_total += r["bytes_sent"]
+                    timed_calls += r["timed_calls"]
+                    total_duration += r["duration_ms"]
+
+                    provider = r["provider"]
+                    stats.calls_by_provider[provider] = stats.calls_by_provider.get(provider, 0) + r["calls"]
+                    stats.cost_by_provider[provider] = stats.cost_by_provider.get(provider, 0.0) + r["cost"]
+                    source = r["source"] or "unknown"
+                    stats.calls_by_source[source] = stats.calls_by_source.get(source, 0) + r["calls"]
+                if timed_calls:
+                    stats.avg_duration_ms = total_duration / timed_calls
 
         except Exception as e:
             logger.error(f"Failed to compute transparency stats: {e}")
@@ -534,23 +720,12 @@ class TransparencyLogger:
 
     def get_daily_costs(self, days: int = 30) -> list[dict[str, Any]]:
         """Get daily cost breakdown for charting."""
-        since = (datetime.now() - timedelta(days=days)).strftime("%Y-%m-%d")
+        start = datetime.now().replace(hour=0, minute=0, second=0, microsecond=0)
+        since = _epoch(start - timedelta(days=days))
+        self.flush()
         try:
             with self._connect() as conn:
-                conn.row_factory = sqlite3.Row
-                rows = conn.execute(
-                    """SELECT DATE(timestamp) as day,
-                              provider,
-                              COUNT(*) as calls,
-                              COALESCE(SUM(cost_estimate), 0) as cost,
-                              COALESCE(SUM(input_tokens), 0) as input_tokens,
-                              COALESCE(SUM(output_tokens), 0) as output_tokens
-                       FROM llm_calls
-                       WHERE timestamp >= ?
-                       GROUP BY day, provider
-                       ORDER BY day""",
-                    (since,),
-                ).fetchall()
+                rows = conn.execute(_DAILY_COSTS_SQL, (since,)).fetchall()
                 return [dict(r) for r in rows]
         except Exception as e:
             logger.error(f"Failed to get daily costs: {e}")
@@ -558,13 +733,11 @@ class TransparencyLogger:
 
     def prune(self, days: int = 90) -> int:
         """Remove log entries older than N days. Returns count deleted."""
-        cutoff = (datetime.now() - timedelta(days=days)).isoformat()
+        cutoff = _epoch(datetime.now() - timedelta(days=days))
+        self.flush()
         try:
-            with self._connect() as conn:
-                cursor = conn.execute(
-                    "DELETE FROM llm_calls WHERE timestamp < ?",
-                    (cutoff,),
-                )
+            with self._connect(write=True) as conn:
+                cursor = conn.execute(_PRUNE_SQL, (cutoff,))
                 deleted = cursor.rowcount
                 if deleted:
                     logger.info(f"Transparency log: pruned {deleted} entries older than {days} days")
@@ -572,3 +745,86 @@ class TransparencyLogger:
         except Exception as e:
             logger.error(f"Failed to prune transparency log: {e}")
             return 0
+
+
+# ═══════════════════════════════════════════════════════════════════════════
+# Helpers
+# ═══════════════════════════════════════════════════════════════════════════
+
+
+def _call_row(
+    *,
+    provider: str,
+    model: str = "",
+    prompt_text: str = "",
+    prompt_parts: Sequence[str] = (),
+    response_text: str = "",
+    response_size_bytes: int = 0,
+    input_tokens: int = 0,
+    output_tokens: int = 0,
+    cache_read_tokens: int = 0,
+    cache_creation_tokens: int = 0,
+    cost_estimate: float = 0.0,
+    source: str = "",
+    duration_ms: int = 0,
+    success: bool = True,
+    error_message: str = "",
+) -> tuple[Any, ...]:
+    """Parameters for ``_INSERT_CALL_SQL`` from ``log_call``'s arguments."""
+    prompt_preview, prompt_hash, prompt_size = _prompt_fields(
+        (prompt_text,) if prompt_text else prompt_parts
+    )
+    response_size = len(response_text.encode()) if response_text else response_size_bytes
+    return (
+        provider, model, prompt_preview, prompt_hash,
+        prompt_size, response_size,
+        input_tokens, output_tokens,
+        cache_read_tokens, cache_creation_tokens,
+        cost_estimate, source, duration_ms, success, error_message,
+    )
+
+
+def _prompt_fields(parts: Sequence[str]) -> tuple[str, str, int]:
+    """Preview, hash and UTF-8 size of the prompt made of ``parts``.
+
+    Each part is encoded once and fed to the hash as it goes, so a prompt
+    assembled from pieces is never joined; the hash equals that of the
+    joined text.
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    preview: list[str] = []
+    preview_len = 0
+    size = 0
+    for part in parts:
+        if not part:
+            continue
+        data = part.encode()
+        digest.update(data)
+        size += len(data)
+        if preview_len < 500:
+            preview.append(part[:500 - preview_len])
+            preview_len += len(preview[-1])
+    if not size:
+        return "", "", 0
+    return "".join(preview), _PROMPT_HASH_PREFIX + digest.hexdigest(), size
+
+
+@functools.lru_cache(maxsize=64)
+def _per_token_rates(provider: str) -> tuple[float, float, float, float] | None:
+    """Per-token (input, output, cache read, cache creation) prices for a
+    provider name as given (any case), or None if it has no pricing."""
+    from omnigent.cost_tracker import PRICING
+
+    pricing = PRICING.get(provider.lower())
+    if pricing is None:
+        return None
+    return (
+        pricing.input_per_million / 1_000_000,
+        pricing.output_per_million / 1_000_000,
+        pricing.cache_read_per_million / 1_000_000,
+        pricing.cache_creation_per_million / 1_000_000,
+    )
+
+
+def _epoch(dt: datetime) -> int:
+    return int(dt.timestamp())
@@ -5,11 +5,12 @@ Provides concrete examples for each tool to improve LLM tool accuracy.
 2-3 examples per tool (2 good + 1 anti-pattern).
 
 Architecture:
-  EXAMPLES is a dict of {tool_name: [ToolExample, ...]}.
-  Domain implementations populate this with their own examples.
+  EXAMPLES is a dict of {tool_name: (ToolExample, ...)}.
+  Domain implementations populate this via register_examples().
+  Large sets can ship as JSON packs: dump_examples() / load_examples(lazy=True).
 
 Example (security domain):
-  EXAMPLES["nmap"] = [
+  register_examples("nmap", [
       ToolExample(
           scenario="What services are running?",
           thinking="Need service detection scan...",
@@ -18,22 +19,80 @@ Example (security domain):
           expected_result="22/tcp ssh, 80/tcp http",
           is_good=True,
       ),
-  ]
+  ])
 """
 
+from __future__ import annotations
+
+import hashlib
+import heapq
+import itertools
+import json
+import logging
+import math
+import sys
+import weakref
+from collections.abc import Callable, Iterable, Sequence
 from dataclasses import dataclass
+from functools import lru_cache
+from pathlib import Path
+from typing import Any
+
+logger = logging.getLogger("omnigent.few_shot_examples")
+
+
+class _ToolArgs(dict):
+    """Read-only, hashable dict holding a ToolExample's tool arguments."""
+
+    __slots__ = ()
+
+    def __hash__(self) -> int:  # type: ignore[override]
+        return hash(frozenset(self.items()))
+
+    def __reduce__(self) -> tuple[Any, ...]:
+        return type(self), (dict(self),)
 
+    def _read_only(self, *args: Any, **kwargs: Any) -> Any:
+        raise TypeError("ToolExample.tool_args is read-only")
 
-@dataclass
+    __setitem__ = __delitem__ = __ior__ = _read_only
+    clear = pop = popitem = setdefault = update = _read_only
+
+
+@dataclass(frozen=True, slots=True)
 class ToolExample:
-    """A single few-shot example for a tool."""
+    """A single few-shot example for a tool.
+
+    Immutable and hashable. ``tool_args`` accepts a dict (or ``(key, value)``
+    pairs) and is stored as a read-only dict: lookups, ``.items()`` and
+    ``isinstance(..., dict)`` work as before, but in-place edits raise
+    ``TypeError``. Use ``tool_args_dict`` for a mutable copy. Hashing needs
+    hashable argument values.
+    """
     scenario: str      # User request context
     thinking: str      # Chain-of-thought reasoning
     tool_name: str
-    tool_args: dict
+    tool_args: dict[str, Any]
     expected_result: str
     is_good: bool      # True = good example, False = anti-pattern
 
+    def __post_init__(self) -> None:
+        # Tool names, arg keys and string arg values repeat across examples;
+        # intern them so equal strings share one object
+        object.__setattr__(self, "tool_name", sys.intern(self.tool_name))
+        object.__setattr__(self, "tool_args", _ToolArgs(
+            (_intern(key), _intern(value)) for key, value in dict(self.tool_args).items()
+        ))
+
+    @property
+    def tool_args_dict(self) -> dict[str, Any]:
+        """The tool arguments as a fresh, mutable dict."""
+        return dict(self.tool_args)
+
+
+def _intern(value: Any) -> Any:
+    return sys.intern(value) if type(value) is str else value
+
 
 # ═══════════════════════════════════════════════════════════════════════════
 # Examples Registry — populate in your domain implementation
@@ -41,10 +100,29 @@ class ToolExample:
 
 # Structure:
 #   {
-#       "tool_name": [ToolExample(...), ...],
+#       "tool_name": (ToolExample(...), ...),
 #   }
+# Plain lists assigned directly are still accepted, but only
+# register_examples() takes precedence over lazily loaded packs.
 
-EXAMPLES: dict[str, list[ToolExample]] = {}
+EXAMPLES: dict[str, Sequence[ToolExample]] = {}
+
+# Ordering stamps shared by register_examples() calls and lazy pack
+# declarations, so a queued pack never overrides a later registration
+_STAMPS = itertools.count(1)
+_REGISTERED_AT: dict[str, int] = {}
+
+# (path, declaration stamp) of packs queued by load_examples(lazy=True),
+# read on first lookup
+_PENDING_PACKS: list[tuple[Path, int]] = []
+
+# Unit embeddings of example texts, per embedder. Weakly keyed on the
+# embedder's owner (the model object, for bound methods), so the cache
+# never keeps a model alive; each owner's table is capped.
+_EXAMPLE_EMBEDDINGS: weakref.WeakKeyDictionary[Any, dict[tuple[Any, str], tuple[float, ...] | None]] = (
+    weakref.WeakKeyDictionary()
+)
+_EXAMPLE_EMBEDDINGS_PER_EMBEDDER = 1024
 
 
 # ═══════════════════════════════════════════════════════════════════════════
@@ -52,9 +130,235 @@ EXAMPLES: dict[str, list[ToolExample]] = {}
 # ═══════════════════════════════════════════════════════════════════════════
 
 
-def get_examples(tool_name: str) -> list[ToolExample]:
-    """Get few-shot examples for a tool."""
-    return EXAMPLES.get(tool_name, [])
+def register_examples(tool_name: str, examples: Iterable[ToolExample]) -> None:
+    """Register (or replace) the few-shot examples for a tool."""
+    EXAMPLES[tool_name] = tuple(examples)
+    _REGISTERED_AT[tool_name] = next(_STAMPS)
+
+
+def get_examples(
+    tool_name: str,
+    *,
+    good_only: bool = False,
+    k: int | None = None,
+) -> tuple[ToolExample, ...]:
+    """Get few-shot examples for a tool.
+
+    Args:
+        tool_name: Tool to look up.
+        good_only: Drop anti-pattern examples.
+        k: Return at most the first ``k`` examples (after filtering).
+
+    Unfiltered lookups of examples registered via register_examples() are
+    returned as-is (``tuple()`` of a tuple is the same object); lists placed
+    in EXAMPLES directly are copied so callers can't mutate the registry.
+    """
+    if _PENDING_PACKS:
+        _load_pending()
+    examples = tuple(EXAMPLES.get(tool_name, ()))
+    if good_only:
+        examples = tuple(ex for ex in examples if ex.is_good)
+    return examples if k is None else examples[:k]
+
+
+def get_examples_topk(
+    tool_name: str,
+    query: str,
+    k: int = 3,
+    *,
+    embed: Callable[[str], Sequence[float]] | None = None,
+) -> tuple[ToolExample, ...]:
+    """Get the ``k`` examples whose scenario best matches ``query``.
+
+    Examples are ranked by cosine similarity between ``embed(query)`` and
+    ``embed(scenario + thinking)``; example embeddings are memoized per
+    embedder, queries are not. Without an embedder or a query, the first
+    ``k`` examples in registration order are returned.
+    """
+    examples = get_examples(tool_name)
+    if embed is None or not query.strip() or len(examples) <= k:
+        return examples[:k]
+
+    q = _unit_vector(embed(query))
+    if q is None:
+        return examples[:k]
+    scores = []
+    for ex in examples:
+        vec = _example_embedding(embed, f"{ex.scenario}\n{ex.thinking}")
+        scores.append(sum(a * b for a, b in zip(q, vec, strict=True)) if vec else -1.0)
+    top = heapq.nlargest(k, range(len(examples)), key=scores.__getitem__)
+    return tuple(examples[i] for i in top)
+
+
+def render_examples(tool_name: str) -> str:
+    """Render a tool's examples as the text block appended to its description.
+
+    Returns "" when the tool has no examples. The text depends only on the
+    examples themselves, so the same registry always yields byte-identical
+    tool descriptions — which keeps provider prompt-prefix caches warm.
+    """
+    examples = get_examples(tool_name)
+    if not examples:
+        return ""
+    try:
+        return _render(examples)
+    except TypeError:
+        # Unhashable tool_args values — render without caching
+        return _render.__wrapped__(examples)
+
+
+def examples_fingerprint(tool_name: str) -> str:
+    """Short stable hash of a tool's examples ("" when it has none).
+
+    Changes only when the examples' content changes, so prompt builders can
+    key cached prompt segments on it.
+    """
+    examples = get_examples(tool_name)
+    if not examples:
+        return ""
+    try:
+        return _fingerprint(examples)
+    except TypeError:
+        return _fingerprint.__wrapped__(examples)
+
+
+def examples_fingerprint_all() -> str:
+    """Short stable hash over every tool's examples fingerprint."""
+    if _PENDING_PACKS:
+        _load_pending()
+    h = hashlib.blake2b(digest_size=8)
+    for tool_name in sorted(EXAMPLES):
+        fp = examples_fingerprint(tool_name)
+        if fp:
+            h.update(f"{tool_name}\0{fp}\n".encode())
+    return h.hexdigest()
+
+
+# ═══════════════════════════════════════════════════════════════════════════
+# Example Packs — JSON snapshots of the registry
+# ═══════════════════════════════════════════════════════════════════════════
+
+
+def dump_examples(path: str | Path, tool_names: Iterable[str] | None = None) -> None:
+    """Write examples (all tools, or ``tool_names``) to a JSON pack."""
+    if _PENDING_PACKS:
+        _load_pending()
+    names = sorted(EXAMPLES) if tool_names is None else tool_names
+    data = {
+        name: [
+            {
+                "scenario": ex.scenario,
+                "thinking": ex.thinking,
+                "tool_name": ex.tool_name,
+                "tool_args": ex.tool_args_dict,
+                "expected_result": ex.expected_result,
+                "is_good": ex.is_good,
+            }
+            for ex in get_examples(name)
+        ]
+        for name in names
+    }
+    Path(path).write_text(json.dumps(data, indent=2, ensure_ascii=False), encoding="utf-8")
+
+
+def load_examples(path: str | Path, *, lazy: bool = False) -> None:
+    """Register every tool's examples from a JSON pack written by dump_examples().
+
+    With ``lazy=True`` the file is only read on the first example lookup, so
+    domains can declare large packs at import time without paying for them
+    until a prompt actually needs examples. A lazy pack only fills in tools
+    not passed to register_examples() after it was declared, and a pack
+    that fails to load is logged and skipped rather than raised to lookups.
+    """
+    if lazy:
+        _PENDING_PACKS.append((Path(path), next(_STAMPS)))
+        return
+    for tool_name, examples in _read_pack(path).items():
+        register_examples(tool_name, examples)
+
+
+# ═══════════════════════════════════════════════════════════════════════════
+# Helpers
+# ═══════════════════════════════════════════════════════════════════════════
+
+
+def _read_pack(path: str | Path) -> dict[str, tuple[ToolExample, ...]]:
+    """Parse a JSON pack into examples per tool (all or nothing)."""
+    data = json.loads(Path(path).read_text(encoding="utf-8"))
+    return {
+        tool_name: tuple(ToolExample(**ex) for ex in examples)
+        for tool_name, examples in data.items()
+    }
+
+
+def _load_pending() -> None:
+    """Load queued lazy packs in the order they were declared."""
+    while _PENDING_PACKS:
+        path, stamp = _PENDING_PACKS.pop(0)
+        try:
+            pack = _read_pack(path)
+        except Exception as e:
+            logger.warning(f"Skipping few-shot examples pack {path}: {e}")
+            continue
+        for tool_name, examples in pack.items():
+            if _REGISTERED_AT.get(tool_name, 0) > stamp:
+                continue  # registered explicitly after the pack was declared
+            EXAMPLES[tool_name] = examples
+            _REGISTERED_AT[tool_name] = stamp
+
+
+def _example_embedding(
+    embed: Callable[[str], Sequence[float]], text: str,
+) -> tuple[float, ...] | None:
+    """``_unit_vector(embed(text))``, memoized in ``_EXAMPLE_EMBEDDINGS``.
+
+    Bound methods are rebuilt on every attribute access, so they are keyed
+    by their owner and function rather than by the method object itself.
+    """
+    owner = getattr(embed, "__self__", embed)
+    key = (getattr(embed, "__func__", None), text)
+    try:
+        table = _EXAMPLE_EMBEDDINGS.setdefault(owner, {})
+    except TypeError:
+        return _unit_vector(embed(text))  # Owner can't be weakly referenced
+    if key not in table:
+        if len(table) >= _EXAMPLE_EMBEDDINGS_PER_EMBEDDER:
+            table.clear()
+        table[key] = _unit_vector(embed(text))
+    return table[key]
+
+
+def _unit_vector(vec: Iterable[float]) -> tuple[float, ...] | None:
+    """L2-normalised copy of ``vec``, or None for a zero vector."""
+    vec = [float(x) for x in vec]
+    norm = math.sqrt(sum(x * x for x in vec))
+    if not norm:
+        return None
+    return tuple(x / norm for x in vec)
+
 
+@lru_cache(maxsize=256)
+def _fingerprint(examples: tuple[ToolExample, ...]) -> str:
+    """blake2b-64 of the examples' canonical JSON, in registration order."""
+    h = hashlib.blake2b(digest_size=8)
+    for ex in examples:
+        fields = [
+            ex.scenario, ex.thinking, ex.tool_name,
+            ex.tool_args_dict, ex.expected_result, ex.is_good,
+        ]
+        h.update(json.dumps(fields, sort_keys=True, default=str).encode())
+        h.update(b"\n")
+    return h.hexdigest()
 
 
+@lru_cache(maxsize=256)
+def _render(examples: tuple[ToolExample, ...]) -> str:
+    """Format examples in registration order. Cached by example content."""
+    lines = ["**Examples:**"]
+    for i, ex in enumerate(examples, 1):
+        outcome_emoji = "+" if ex.is_good else "-"
+        lines.append(f"{outcome_emoji} Example {i}: {ex.scenario}")
+        if ex.thinking:
+            lines.append(f"   Thinking: {ex.thinking[:100]}...")
+        lines.append(f"   Expected: {ex.expected_result[:80]}...")
+    return "\n".join(lines)
@@ -15,7 +15,7 @@ import asyncio
 import json
 import logging
 
-from omnigent.few_shot_examples import get_examples
+from omnigent.few_shot_examples import render_examples
 
 logger = logging.getLogger("omnigent.tools")
 
@@ -181,17 +181,10 @@ class ToolRegistry:
             }
 
             # Add few-shot examples
-            examples = get_examples(name)
+            examples = render_examples(name)
             if examples:
                 desc = schema["function"].get("description", "")
-                desc += "\n\n**Examples:**"
-                for i, ex in enumerate(examples, 1):
-                    outcome_emoji = "+" if ex.is_good else "-"
-                    desc += f"\n{outcome_emoji} Example {i}: {ex.scenario}"
-                    if ex.thinking:
-                        desc += f"\n   Thinking: {ex.thinking[:100]}..."
-                    desc += f"\n   Expected: {ex.expected_result[:80]}..."
-                schema["function"]["description"] = desc
+                schema["function"]["description"] = f"{desc}\n\n{examples}"
 
             schemas.append(schema)
 
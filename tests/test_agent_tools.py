@@ -0,0 +1,62 @@
+"""Tests for the OmniBrain agent ToolRegistry builder."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import time
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from omnibrain.agent_tools import _dumps, build_omnibrain_tools
+
+
+class TestToolResultSerialization:
+    def test_dumps_matches_stdlib(self):
+        payload = {"events": [{"title": "Café ☕", "attendees": ["a@x.com"], "n": 1}]}
+        assert json.loads(_dumps(payload)) == payload
+
+    def test_dumps_non_str_keys(self):
+        assert json.loads(_dumps({1: "a"})) == {"1": "a"}
+
+    @pytest.mark.asyncio
+    async def test_calendar_result_serialized_by_handler(self, tmp_path):
+        payload = {"events": [{"id": "evt_1", "title": "Standup"}], "count": 1}
+        with patch("omnibrain.tools.calendar_tools.get_today_events", return_value=payload):
+            registry = build_omnibrain_tools(db=MagicMock(), data_dir=tmp_path)
+            result = await registry.call("get_today_events", {})
+        assert isinstance(result, str)
+        assert json.loads(result) == payload
+
+
+class TestAsyncToolEntryPoints:
+    @pytest.mark.asyncio
+    async def test_email_and_calendar_calls_overlap(self, tmp_path):
+        from omnibrain.tools import fetch_emails_async, get_today_events_async
+
+        def slow(result):
+            def fn(*args, **kwargs):
+                time.sleep(0.2)
+                return result
+            return fn
+
+        with patch("omnibrain.tools.email_tools.fetch_emails", slow({"emails": []})), \
+                patch("omnibrain.tools.calendar_tools.get_today_events", slow({"events": []})):
+            start = time.perf_counter()
+            emails, events = await asyncio.gather(
+                fetch_emails_async(tmp_path), get_today_events_async(tmp_path),
+            )
+            elapsed = time.perf_counter() - start
+
+        assert emails == {"emails": []}
+        assert events == {"events": []}
+        assert elapsed < 0.35
+
+    @pytest.mark.asyncio
+    async def test_arguments_passed_through(self, tmp_path):
+        from omnibrain.tools import get_upcoming_events_async
+
+        with patch("omnibrain.tools.calendar_tools.get_upcoming_events", return_value={"count": 0}) as fn:
+            await get_upcoming_events_async(tmp_path, days=3, max_results=5)
+        fn.assert_called_once_with(tmp_path, days=3, max_results=5, no_cache=False)
@@ -356,6 +356,20 @@ class TestCalendarClient:
         assert event.id == "evt_001"
         assert event.title == "Team Standup"
 
+    @patch("omnibrain.integrations.calendar.CalendarClient.authenticate")
+    def test_requests_only_parsed_fields(self, mock_auth, tmp_data_dir, mock_calendar_service):
+        from omnibrain.integrations.calendar import _EVENT_FIELDS, CalendarClient
+
+        client = CalendarClient(tmp_data_dir)
+        client._service = mock_calendar_service
+        client._creds = MagicMock(valid=True)
+
+        client.get_upcoming_events(days=7)
+        client.get_event("evt_001")
+        events = mock_calendar_service.events.return_value
+        assert events.list.call_args.kwargs["fields"] == f"items({_EVENT_FIELDS})"
+        assert events.get.call_args.kwargs["fields"] == _EVENT_FIELDS
+
     @patch("omnibrain.integrations.calendar.CalendarClient.authenticate")
     def test_get_event_not_found(self, mock_auth, tmp_data_dir):
         from omnibrain.integrations.calendar import CalendarClient
@@ -459,6 +473,73 @@ class TestCalendarTools:
         assert "error" not in result
         assert result["events"][0]["title"] == "Standup"
         assert result["events"][0]["duration_minutes"] == 30
+        assert result["date"] == datetime.now().strftime("%Y-%m-%d")
+
+    @patch("omnibrain.tools.calendar_tools.CalendarClient")
+    def test_sync_calls_hold_api_lock(self, MockClient, tmp_data_dir):
+        from omnibrain.tools import calendar_tools
+        from omnibrain.tools._google_cache import _api_lock
+
+        held = []
+        mock_client = MockClient.return_value
+        mock_client.authenticate.side_effect = lambda: held.append(_api_lock(MockClient).locked()) or True
+        mock_client.get_upcoming_events.side_effect = lambda **kw: held.append(_api_lock(MockClient).locked()) or []
+        mock_client.get_event.side_effect = lambda event_id: held.append(_api_lock(MockClient).locked())
+
+        calendar_tools.get_upcoming_events(tmp_data_dir, no_cache=True)
+        calendar_tools.generate_meeting_brief(tmp_data_dir, "evt_1")
+        assert held == [True, True, True, True]
+        assert not _api_lock(MockClient).locked()
+
+    @patch("omnibrain.tools.calendar_tools.CalendarClient")
+    def test_client_reused_across_calls(self, MockClient, tmp_data_dir):
+        from omnibrain.tools.calendar_tools import get_today_events, get_upcoming_events
+
+        MockClient.return_value.authenticate.return_value = False
+        get_today_events(tmp_data_dir)
+        get_upcoming_events(tmp_data_dir / ".." / tmp_data_dir.name)
+        assert MockClient.call_count == 1
+        assert MockClient.return_value.authenticate.call_count == 2
+
+    @patch("omnibrain.tools.calendar_tools.CalendarClient")
+    def test_repeat_today_served_from_cache(self, MockClient, tmp_data_dir):
+        from omnibrain.tools.calendar_tools import get_today_events, invalidate_calendar_cache
+
+        MockClient.return_value.authenticate.return_value = True
+        MockClient.return_value.get_today_events.return_value = []
+
+        get_today_events(tmp_data_dir)
+        get_today_events(tmp_data_dir)
+        assert MockClient.return_value.get_today_events.call_count == 1
+
+        get_today_events(tmp_data_dir, no_cache=True)
+        invalidate_calendar_cache()
+        get_today_events(tmp_data_dir)
+        assert MockClient.return_value.get_today_events.call_count == 3
+
+    @patch("omnibrain.tools.calendar_tools.CalendarClient")
+    def test_event_times_formatted_once_per_event(self, MockClient, tmp_data_dir):
+        from omnibrain.tools import calendar_tools
+
+        now = datetime.now(timezone.utc)
+        MockClient.return_value.authenticate.return_value = True
+        MockClient.return_value.get_upcoming_events.return_value = [
+            CalendarEvent(
+                id=f"evt_{i}",
+                title=f"Meeting {i}",
+                start_time=now + timedelta(days=i),
+                end_time=now + timedelta(days=i, hours=1),
+            )
+            for i in range(3)
+        ]
+
+        real_of = calendar_tools._EventView.of
+        with patch.object(calendar_tools._EventView, "of", side_effect=real_of) as of:
+            result = calendar_tools.get_upcoming_events(tmp_data_dir, days=7)
+
+        assert of.call_count == 3
+        assert result["events"][1]["start_time"] == (now + timedelta(days=1)).isoformat()
+        assert (now + timedelta(days=2)).strftime("%Y-%m-%d (%A)") in result["summary"]
 
     @patch("omnibrain.tools.calendar_tools.CalendarClient")
     def test_get_today_events_not_authenticated(self, MockClient, tmp_data_dir):
@@ -511,7 +592,7 @@ class TestCalendarTools:
 
         # With DB mock that has contact data
         mock_db = MagicMock()
-        mock_db.get_contact.side_effect = lambda email: {
+        mock_db.get_contacts_by_email.return_value = {
             "marco@example.com": {
                 "name": "Marco Rossi",
                 "relationship": "colleague",
@@ -519,9 +600,12 @@ class TestCalendarTools:
                 "interaction_count": 42,
                 "last_interaction": "2026-02-14",
             },
-        }.get(email)
+        }
 
         result = generate_meeting_brief(tmp_data_dir, "evt_1", db=mock_db)
+        mock_db.get_contacts_by_email.assert_called_once_with(
+            ["marco@example.com", "giulia@example.com"],
+        )
         assert "error" not in result
         assert result["attendee_count"] == 2
         assert result["duration_minutes"] == 120
@@ -533,6 +617,31 @@ class TestCalendarTools:
         assert marco["name"] == "Marco Rossi"
         assert marco["interaction_count"] == 42
 
+    @patch("omnibrain.tools.calendar_tools.CalendarClient")
+    def test_generate_meeting_brief_dedupes_attendees(self, MockClient, tmp_data_dir):
+        from omnibrain.tools.calendar_tools import generate_meeting_brief
+
+        now = datetime.now(timezone.utc)
+        MockClient.return_value.authenticate.return_value = True
+        MockClient.return_value.get_event.return_value = CalendarEvent(
+            id="evt_1", title="Sync", start_time=now, end_time=now + timedelta(hours=1),
+            attendees=["Marco@Example.com", " marco@example.com", "giulia@example.com", ""],
+        )
+        mock_db = MagicMock()
+        mock_db.get_contacts_by_email.return_value = {
+            "marco@example.com": {"name": "Marco Rossi", "interaction_count": 3},
+        }
+
+        result = generate_meeting_brief(tmp_data_dir, "evt_1", db=mock_db)
+        mock_db.get_contacts_by_email.assert_called_once_with(
+            ["Marco@Example.com", "giulia@example.com", "marco@example.com"],
+        )
+        assert result["attendee_count"] == 2
+        assert [a["email"] for a in result["attendee_context"]] == ["Marco@Example.com", "giulia@example.com"]
+        assert result["event"]["attendees"] == ["Marco@Example.com", "giulia@example.com"]
+        assert result["event"]["attendees_summary"] == "2 people"
+        assert result["attendee_context"][0]["name"] == "Marco Rossi"
+
     @patch("omnibrain.tools.calendar_tools.CalendarClient")
     def test_generate_meeting_brief_event_not_found(self, MockClient, tmp_data_dir):
         from omnibrain.tools.calendar_tools import generate_meeting_brief
@@ -666,6 +775,7 @@ class TestStoreEventsInDB:
         from omnibrain.tools.calendar_tools import store_events_in_db
 
         mock_db = MagicMock()
+        mock_db.insert_events_bulk.side_effect = Exception("DB error")
         mock_db.insert_event.side_effect = Exception("DB error")
 
         now = datetime.now(timezone.utc)
@@ -683,6 +793,43 @@ class TestStoreEventsInDB:
         assert stored == 0
 
 
+    def test_store_events_single_transaction(self, tmp_data_dir):
+        from omnibrain.db import OmniBrainDB
+        from omnibrain.tools.calendar_tools import store_events_in_db
+
+        db = OmniBrainDB(tmp_data_dir)
+        now = datetime.now(timezone.utc)
+        events = [
+            CalendarEvent(
+                id=f"evt_{i}",
+                title=f"Meeting {i}",
+                start_time=now + timedelta(hours=i),
+                end_time=now + timedelta(hours=i, minutes=30),
+            )
+            for i in range(5)
+        ]
+        with patch.object(db, "insert_event") as per_row:
+            assert store_events_in_db(events, db) == 5
+        per_row.assert_not_called()
+        stored = db.get_events(source=EventSource.CALENDAR.value)
+        assert {e["external_id"] for e in stored} == {f"evt_{i}" for i in range(5)}
+
+    def test_store_events_falls_back_per_row(self):
+        from omnibrain.tools.calendar_tools import store_events_in_db
+
+        mock_db = MagicMock()
+        mock_db.insert_events_bulk.side_effect = Exception("bad row")
+        mock_db.insert_event.side_effect = [1, Exception("bad row"), 3]
+
+        now = datetime.now(timezone.utc)
+        events = [
+            CalendarEvent(id=f"evt_{i}", title="T", start_time=now, end_time=now)
+            for i in range(3)
+        ]
+        assert store_events_in_db(events, mock_db) == 2
+        assert mock_db.insert_event.call_count == 3
+
+
 # ═══════════════════════════════════════════════════════════════════════════
 # Tool Schemas Tests
 # ═══════════════════════════════════════════════════════════════════════════
@@ -820,6 +967,47 @@ class TestHelpers:
         assert "1 events" in summary
         assert "Monday Call" in summary
 
+    def test_make_week_summary_groups_out_of_order_events(self):
+        from omnibrain.tools.calendar_tools import _make_week_summary
+
+        day = datetime(2026, 3, 2, 9, 0, tzinfo=timezone.utc)
+        events = [
+            CalendarEvent(id=str(i), title=title, start_time=start, end_time=start + timedelta(hours=1))
+            for i, (title, start) in enumerate([
+                ("Tue Late", day + timedelta(days=1, hours=5)),
+                ("Mon", day),
+                ("Tue Early", day + timedelta(days=1)),
+            ])
+        ]
+        summary = _make_week_summary(events, 7)
+        assert summary.count("2026-03-03 (Tuesday)") == 1
+        assert summary.index("Mon") < summary.index("Tue Early") < summary.index("Tue Late")
+
+    def test_make_week_summary_all_day_and_negative_offset_share_a_header(self):
+        from omnibrain.tools.calendar_tools import _make_week_summary
+
+        eastern = timezone(timedelta(hours=-5))
+        all_day = datetime(2026, 3, 3, tzinfo=timezone.utc)
+        events = [
+            # 2026-03-02 22:00 at -05:00 is 2026-03-03 03:00 UTC, after all-day
+            CalendarEvent(
+                id="1", title="Mon Late", start_time=datetime(2026, 3, 2, 22, 0, tzinfo=eastern),
+                end_time=datetime(2026, 3, 2, 23, 0, tzinfo=eastern),
+            ),
+            CalendarEvent(
+                id="2", title="Tue Holiday", start_time=all_day,
+                end_time=all_day + timedelta(days=1),
+            ),
+            CalendarEvent(
+                id="3", title="Mon Early", start_time=datetime(2026, 3, 2, 9, 0, tzinfo=eastern),
+                end_time=datetime(2026, 3, 2, 10, 0, tzinfo=eastern),
+            ),
+        ]
+        summary = _make_week_summary(events, 7)
+        assert summary.count("2026-03-02 (Monday)") == 1
+        assert summary.count("2026-03-03 (Tuesday)") == 1
+        assert summary.index("Mon Early") < summary.index("Mon Late") < summary.index("Tue Holiday")
+
     def test_generate_prep_notes(self):
         from omnibrain.tools.calendar_tools import _generate_prep_notes
 
@@ -841,6 +1029,27 @@ class TestHelpers:
         assert "Alice" in notes
         assert "b@t.com" in notes
 
+    def test_prep_notes_group_attendees_in_order(self):
+        from omnibrain.tools.calendar_tools import _generate_prep_notes
+
+        now = datetime.now(timezone.utc)
+        event = CalendarEvent(id="1", title="Sync", start_time=now, end_time=now + timedelta(hours=1))
+        attendees = [
+            {"email": "new1@t.com", "interaction_count": 0},
+            {"email": "a@t.com", "name": "Alice", "interaction_count": 3},
+            {"email": "new2@t.com"},
+            {"email": "b@t.com", "relationship": "client", "interaction_count": 1},
+        ]
+
+        lines = _generate_prep_notes(event, attendees).splitlines()
+        known = lines.index("Known attendees (2):")
+        unknown = lines.index("New/unknown attendees (2):")
+        assert lines[known + 1:known + 3] == [
+            "  • Alice — unknown, 3 interactions",
+            "  • b@t.com — client, 1 interactions",
+        ]
+        assert lines[unknown + 1:] == ["  • new1@t.com", "  • new2@t.com"]
+
 
 # ═══════════════════════════════════════════════════════════════════════════
 # ApprovalGate Tests
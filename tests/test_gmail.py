@@ -17,6 +17,8 @@ from __future__ import annotations
 import base64
 import json
 import sqlite3
+import subprocess
+import sys
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any
@@ -442,6 +444,42 @@ class TestGmailClient:
             assert result is True
             assert client.is_authenticated
 
+    def test_authenticate_reused_within_ttl(self, tmp_data_dir: Path) -> None:
+        from omnibrain.integrations.gmail import AUTH_TTL_S, GmailClient
+
+        (tmp_data_dir / "google_token.json").write_text("{}")
+        client = GmailClient(tmp_data_dir)
+
+        with patch("google.oauth2.credentials.Credentials.from_authorized_user_file") as mock_creds_load, \
+             patch("googleapiclient.discovery.build"):
+            mock_creds_load.return_value = MagicMock(valid=True, expired=False)
+
+            assert client.authenticate() is True
+            assert client.authenticate() is True
+            assert mock_creds_load.call_count == 1
+
+            client._authed_at -= AUTH_TTL_S
+            assert client.authenticate() is True
+            assert mock_creds_load.call_count == 2
+
+    def test_api_auth_error_ends_auth_window(self, tmp_data_dir: Path) -> None:
+        from omnibrain.integrations.gmail import GmailAuthError, GmailClient
+
+        (tmp_data_dir / "google_token.json").write_text("{}")
+        client = GmailClient(tmp_data_dir)
+
+        with patch("google.oauth2.credentials.Credentials.from_authorized_user_file") as mock_creds_load, \
+             patch("googleapiclient.discovery.build") as mock_build:
+            mock_creds_load.return_value = MagicMock(valid=True, expired=False)
+            messages = mock_build.return_value.users.return_value.messages.return_value
+            messages.list.return_value.execute.side_effect = Exception("401 Unauthorized")
+
+            assert client.authenticate() is True
+            with pytest.raises(GmailAuthError):
+                client.fetch_recent()
+            assert client.authenticate() is True
+            assert mock_creds_load.call_count == 2
+
     def test_fetch_recent_not_authenticated(self, tmp_data_dir: Path) -> None:
         from omnibrain.integrations.gmail import GmailClient, GmailAuthError
 
@@ -449,6 +487,34 @@ class TestGmailClient:
         with pytest.raises(GmailAuthError):
             client.fetch_recent()
 
+    def test_fetch_recent_requests_partial_fields(self, tmp_data_dir: Path) -> None:
+        from omnibrain.integrations.gmail import _LIST_FIELDS, _MESSAGE_FIELDS, GmailClient
+
+        client = GmailClient(tmp_data_dir)
+        client._creds = MagicMock(valid=True)
+        client._service = service = MagicMock()
+        messages = service.users.return_value.messages.return_value
+        messages.list.return_value.execute.return_value = {"messages": [{"id": "m1"}]}
+        messages.get.return_value.execute.return_value = {
+            "id": "m1",
+            "payload": {"headers": [{"name": "Subject", "value": "Hi"}]},
+        }
+
+        emails = client.fetch_recent()
+        assert [e.subject for e in emails] == ["Hi"]
+        assert messages.list.call_args.kwargs["fields"] == _LIST_FIELDS
+        assert messages.get.call_args.kwargs["fields"] == _MESSAGE_FIELDS
+
+    def test_tool_import_leaves_google_libraries_unloaded(self) -> None:
+        # googleapiclient / google-auth are imported inside authenticate(),
+        # so sessions that never touch Gmail or Calendar don't pay for them.
+        code = (
+            "import sys, omnibrain.tools, omnibrain.agent_tools\n"
+            "print(sorted(m for m in sys.modules if m.split('.')[0] in ('google', 'googleapiclient', 'httplib2')))"
+        )
+        out = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)
+        assert out.stdout.strip() == "[]"
+
     def test_user_email_not_authenticated(self, tmp_data_dir: Path) -> None:
         from omnibrain.integrations.gmail import GmailClient
 
@@ -504,6 +570,57 @@ class TestFetchEmailsTool:
         assert "error" not in result
 
 
+    @patch("omnibrain.tools.email_tools.GmailClient")
+    def test_sync_calls_hold_api_lock(self, MockClient: MagicMock, tmp_data_dir: Path) -> None:
+        from omnibrain.integrations.calendar import CalendarClient
+        from omnibrain.tools import email_tools
+        from omnibrain.tools._google_cache import _api_lock
+
+        held = []
+        mock_client = MockClient.return_value
+        mock_client.authenticate.side_effect = lambda: held.append(_api_lock(MockClient).locked()) or True
+        mock_client.fetch_recent.side_effect = lambda **kw: held.append(_api_lock(MockClient).locked()) or []
+        mock_client.search.side_effect = lambda **kw: held.append(_api_lock(MockClient).locked()) or []
+
+        email_tools.fetch_emails(tmp_data_dir, no_cache=True)
+        email_tools.search_emails(tmp_data_dir, "from:boss", no_cache=True)
+        assert held == [True, True, True, True]
+        assert not _api_lock(MockClient).locked()
+        # Gmail and Calendar calls do not serialise against each other.
+        assert _api_lock(MockClient) is not _api_lock(CalendarClient)
+
+    @patch("omnibrain.tools.email_tools.GmailClient")
+    def test_fetch_repeat_served_from_cache(self, MockClient: MagicMock, tmp_data_dir: Path, sample_email_messages: list) -> None:
+        from omnibrain.tools.email_tools import fetch_emails, invalidate_email_cache
+
+        mock_client = MockClient.return_value
+        mock_client.authenticate.return_value = True
+        mock_client.fetch_recent.return_value = sample_email_messages
+
+        first = fetch_emails(tmp_data_dir, query="is:unread")
+        second = fetch_emails(tmp_data_dir, query="is:unread")
+        assert mock_client.fetch_recent.call_count == 1
+        assert first["emails"] == second["emails"]
+
+        fetch_emails(tmp_data_dir, query="is:starred")
+        fetch_emails(tmp_data_dir, query="is:unread", no_cache=True)
+        assert mock_client.fetch_recent.call_count == 3
+
+        invalidate_email_cache()
+        fetch_emails(tmp_data_dir, query="is:unread")
+        assert mock_client.fetch_recent.call_count == 4
+
+    def test_cached_fetch_returns_immutable_result(self) -> None:
+        from omnibrain.tools._google_cache import _cached_fetch, _FetchCache
+
+        cache = _FetchCache()
+        fetched = ["a", "b"]
+        first = _cached_fetch(cache, ("k",), lambda: fetched, False)
+        fetched.append("c")
+        second = _cached_fetch(cache, ("k",), lambda: ["unused"], False)
+        assert first == second == ("a", "b")
+
+
 class TestSearchEmailsTool:
     """Test search_emails tool handler."""
 
@@ -592,6 +709,62 @@ class TestClassifyEmailTool:
         assert result["urgency"] == "medium"
         assert result["category"] == "fyi"
 
+    def test_classify_highest_priority_rule_wins(self, tmp_data_dir: Path) -> None:
+        from omnibrain.tools.email_tools import classify_email
+
+        result = classify_email(
+            tmp_data_dir,
+            email_id="msg_006",
+            subject="Weekly newsletter",
+            body_preview="Payment failed — urgent",
+        )
+        assert result["urgency"] == "high"
+        assert result["category"] == "action_required"
+
+    def test_classify_overlapping_keywords(self, tmp_data_dir: Path) -> None:
+        from omnibrain.tools.email_tools import classify_email
+
+        # "unsubscribe" and "emergency" share the "e"
+        result = classify_email(tmp_data_dir, email_id="m", subject="unsubscribemergency")
+        assert result["urgency"] == "high"
+
+    def test_classify_automated_sender(self, tmp_data_dir: Path) -> None:
+        from omnibrain.tools.email_tools import classify_email
+
+        def category(subject: str, sender: str = "no-reply@service.com") -> str:
+            return classify_email(tmp_data_dir, email_id="m", subject=subject, sender=sender)["category"]
+
+        assert category("Your weekly stats") == "notification"
+        assert category("Your weekly stats", sender="anna@example.com") == "fyi"
+        assert category("Weekly digest") == "newsletter"
+        assert category("Critical security alert") == "action_required"
+        assert category("Your receipt", sender="Shop <NoReply@shop.com>") == "notification"
+
+    def test_classify_returns_shared_rule_constants(self) -> None:
+        from omnibrain.tools.email_tools import _EMAIL_DEFAULT, _EMAIL_RULES, _classify
+
+        assert _classify("URGENT: server down", "") is _EMAIL_RULES[0][1]
+        assert _classify("Lunch?", "see you at noon") is _EMAIL_DEFAULT
+
+    def test_classify_accented_text_not_spliced(self, tmp_data_dir: Path) -> None:
+        from omnibrain.tools.email_tools import classify_email
+
+        result = classify_email(tmp_data_dir, email_id="m", subject="ASAP", body_preview="ur\u00e9gent")
+        assert result["urgency"] == "high"
+        result = classify_email(tmp_data_dir, email_id="m", subject="Ciao", body_preview="ur\u00e9gent")
+        assert result["category"] == "fyi"
+
+    def test_classify_repeat_is_cached_per_content(self, tmp_data_dir: Path) -> None:
+        from omnibrain.tools.email_tools import _classify, classify_email
+
+        _classify.cache_clear()
+        first = classify_email(tmp_data_dir, email_id="a", subject="Weekly digest", body_preview="x")
+        second = classify_email(tmp_data_dir, email_id="b", subject="Weekly digest", body_preview="x")
+        assert _classify.cache_info().hits == 1
+        assert first["email_id"] == "a"
+        assert second["email_id"] == "b"
+        assert first["category"] == second["category"] == "newsletter"
+
 
 # ═══════════════════════════════════════════════════════════════════════════
 # Tests: Extractors
@@ -818,6 +991,18 @@ class TestEmailMessageModel:
         assert msg.sender_email == "john@example.com"
         assert msg.sender_name == "john@example.com"
 
+    def test_body_caps_follow_body(self) -> None:
+        msg = EmailMessage(
+            id="1", thread_id="1", sender="a@b.c",
+            recipients=[], subject="", body="x" * 5000,
+            date=datetime.now(timezone.utc),
+        )
+        assert len(msg.agent_body) == 500
+        assert len(msg.stored_body) == 2000
+        msg.body = "short"
+        assert msg.agent_body == msg.stored_body == "short"
+        assert msg == EmailMessage(**{f: getattr(msg, f) for f in msg.__dataclass_fields__})
+
     def test_sender_email_with_quotes(self) -> None:
         msg = EmailMessage(
             id="1", thread_id="1",
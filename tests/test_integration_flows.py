@@ -174,6 +174,18 @@ class TestDBEvents:
         db.insert_event("gmail", "notification", "A notification")
         assert len(db.get_events(event_type="email")) == 1
 
+    def test_insert_events_bulk(self, db):
+        n = db.insert_events_bulk([
+            {"source": "gmail", "event_type": "email", "title": "A",
+             "metadata": {"k": 1}, "timestamp": "2026-01-01T10:00:00", "external_id": "m1"},
+            {"source": "gmail", "event_type": "email", "title": "B", "external_id": "m2"},
+        ])
+        assert n == 2
+        events = {e["title"]: e for e in db.get_events(source="gmail")}
+        assert json.loads(events["A"]["metadata"]) == {"k": 1}
+        assert events["B"]["timestamp"]  # Defaulted to now
+        assert db.insert_events_bulk([]) == 0
+
     def test_limit(self, db):
         for i in range(10):
             db.insert_event("gmail", "email", f"Msg {i}")
@@ -217,6 +229,32 @@ class TestDBContacts:
     def test_nonexistent_contact(self, db):
         assert db.get_contact("nobody@test.com") is None
 
+    def test_upsert_contacts_bulk(self, db):
+        db.upsert_contact(ContactInfo(email="a@b.com", name="Alice"))
+        n = db.upsert_contacts_bulk([
+            ContactInfo(email="a@b.com", name=""),
+            ContactInfo(email="c@d.com", name="Carol"),
+            ContactInfo(email="a@b.com", name="Alice B"),
+        ])
+        assert n == 3
+        alice = db.get_contact("a@b.com")
+        assert alice.name == "Alice B"
+        assert alice.interaction_count == 2
+        assert db.get_contact("c@d.com").name == "Carol"
+
+    def test_get_contacts_by_email(self, db):
+        db.upsert_contact(ContactInfo(email="a@b.com", name="Alice"))
+        db.upsert_contact(ContactInfo(email="c@d.com", name="Carol"))
+        found = db.get_contacts_by_email(["a@b.com", "nobody@test.com", "c@d.com", "a@b.com"])
+        assert set(found) == {"a@b.com", "c@d.com"}
+        assert found["a@b.com"]["name"] == "Alice"
+        assert db.get_contacts_by_email([]) == {}
+
+    def test_get_contacts_by_email_chunks_large_lists(self, db):
+        db.upsert_contact(ContactInfo(email="last@e.com"))
+        emails = [f"u{i}@e.com" for i in range(2000)] + ["last@e.com"]
+        assert list(db.get_contacts_by_email(emails)) == ["last@e.com"]
+
 
 class TestDBProposals:
     def test_insert_and_get_pending(self, db):
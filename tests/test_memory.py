@@ -16,6 +16,7 @@ from __future__ import annotations
 import json
 import os
 import tempfile
+from collections import OrderedDict
 from pathlib import Path
 from typing import Any
 from unittest.mock import MagicMock, patch
@@ -28,6 +29,7 @@ from omnibrain.memory import (
     MemoryManager,
     MemoryStore,
     SQLiteMemoryStore,
+    SemanticResultCache,
     _chromadb_available,
     _generate_id,
     _sanitize_fts_query,
@@ -173,6 +175,25 @@ class TestSQLiteMemoryStore:
         assert retrieved is not None
         assert retrieved.text == "version 2"
 
+    def test_store_many_replaces_and_indexes(self, sqlite_store):
+        sqlite_store.store(MemoryDocument(id="a", text="old budget"))
+        stored = sqlite_store.store_many([
+            MemoryDocument(id="a", text="pricing draft"),
+            MemoryDocument(id="b", text="pricing review"),
+            MemoryDocument(id="b", text="pricing final"),
+        ])
+        assert stored == 2
+        assert sqlite_store.count() == 2
+        assert sqlite_store.get_by_id("b").text == "pricing final"
+        assert len(sqlite_store.search("pricing", time_range_days=1)) == 2
+        assert sqlite_store.search("budget", time_range_days=1) == []
+
+    def test_store_many_falls_back_per_document(self, sqlite_store):
+        bad = MemoryDocument(id="bad", text="x", metadata={"when": object()})
+        stored = sqlite_store.store_many([MemoryDocument(id="ok", text="fine"), bad])
+        assert stored == 1
+        assert sqlite_store.get_by_id("ok") is not None
+
     def test_search_basic(self, sqlite_store, sample_doc):
         sqlite_store.store(sample_doc)
         # sample_doc has old timestamp, use large time_range
@@ -512,6 +533,24 @@ class TestBatchIngestion:
         assert result["stored"] == 1
 
 
+    def test_ingest_uses_one_transaction(self, memory_manager):
+        emails = [{"id": f"e{i}", "subject": f"Mail {i}"} for i in range(20)]
+        with patch.object(memory_manager._sqlite, "store", wraps=memory_manager._sqlite.store) as single:
+            result = ingest_emails_to_memory(memory_manager, emails)
+        assert result["stored"] == 20
+        assert single.call_count == 0
+        assert memory_manager.count() == 20
+
+    def test_ingest_malformed_event_falls_back(self, memory_manager):
+        events = [
+            {"id": "ev1", "title": "Standup", "attendees": ["a@t.com"]},
+            {"id": "ev2", "title": "Broken", "attendees": 5},
+        ]
+        result = ingest_events_to_memory(memory_manager, events)
+        assert result == {"stored": 1, "failed": 1, "total": 2}
+        assert memory_manager.get_by_id("cal_ev1") is not None
+
+
 # ═══════════════════════════════════════════════════════════════════════════
 # Extractor Tests
 # ═══════════════════════════════════════════════════════════════════════════
@@ -656,6 +695,88 @@ class TestChromaMemoryStoreMocked:
         doc = MemoryDocument(id="1", text="test")
         assert store.store(doc) is False
 
+    def test_store_many_upserts_in_batches(self, tmp_dir):
+        from omnibrain.memory import _CHROMA_BATCH_SIZE
+
+        store = ChromaMemoryStore.__new__(ChromaMemoryStore)
+        store._client = None
+        store._collection = MagicMock()
+        docs = [MemoryDocument(id=str(i), text=f"doc {i}") for i in range(_CHROMA_BATCH_SIZE + 5)]
+
+        assert store.store_many(docs) == len(docs)
+        calls = store._collection.upsert.call_args_list
+        assert [len(c.kwargs["ids"]) for c in calls] == [_CHROMA_BATCH_SIZE, 5]
+        assert calls[1].kwargs["documents"][0] == f"doc {_CHROMA_BATCH_SIZE}"
+
+    def test_manager_batch_goes_to_chroma_once(self, tmp_dir, sample_email):
+        manager = MemoryManager(tmp_dir, enable_chroma=False)
+        manager._chroma = MagicMock()
+        manager.store_email_batch([sample_email, {**sample_email, "id": "other"}])
+        manager._chroma.store_many.assert_called_once()
+        manager._chroma.store.assert_not_called()
+
+    def _embedding_store(self):
+        store = ChromaMemoryStore.__new__(ChromaMemoryStore)
+        store._client = None
+        store._collection = MagicMock()
+        store._collection.query.return_value = {"documents": [[]], "ids": [[]], "metadatas": [[]]}
+        store._embedding_fn = MagicMock(return_value=[[0.5, 0.25]])
+        store._query_embeddings = OrderedDict()
+        return store
+
+    def test_query_embedding_cached(self, tmp_dir):
+        store = self._embedding_store()
+        assert store.embed_query("budget  meeting") == ((0.5, 0.25), False)
+        assert store.embed_query(" budget meeting ") == ((0.5, 0.25), True)
+        store._embedding_fn.assert_called_once_with(["budget meeting"])
+
+    def test_search_reuses_query_embedding(self, tmp_dir):
+        store = self._embedding_store()
+        store.search("budget")
+        store.search("budget")
+        store._embedding_fn.assert_called_once()
+        assert store._collection.query.call_args.kwargs["query_embeddings"] == [[0.5, 0.25]]
+
+    def test_query_embedding_cache_bounded(self, tmp_dir):
+        from omnibrain.memory import _QUERY_EMBEDDING_CACHE_SIZE
+
+        store = self._embedding_store()
+        for i in range(_QUERY_EMBEDDING_CACHE_SIZE + 1):
+            store.embed_query(f"q{i}")
+        assert len(store._query_embeddings) == _QUERY_EMBEDDING_CACHE_SIZE
+        assert "q0" not in store._query_embeddings
+
+    def test_search_memory_logs_embedding_cache(self, tmp_dir, caplog):
+        manager = MemoryManager(tmp_dir, enable_chroma=False)
+        manager._chroma = self._embedding_store()
+        with caplog.at_level("DEBUG", logger="omnibrain.tools.memory"):
+            search_memory(manager, {"query": "budget"})
+            second = search_memory(manager, {"query": "budget"})
+        assert "embedding_cache" not in second
+        assert second["backend"] == "semantic"
+        assert "embedding cache miss" in caplog.text
+        assert "embedding cache hit" in caplog.text
+
+    def test_near_duplicate_query_served_from_result_cache(self, tmp_dir):
+        manager = MemoryManager(tmp_dir, enable_chroma=False)
+        manager._chroma = self._embedding_store()
+        manager._chroma._embedding_fn.side_effect = [[[1.0, 0.0]], [[0.99, 0.05]], [[0.0, 1.0]]]
+        manager.search("emails from Alice")
+        manager.search("what emails did I get from Alice?")
+        assert manager._chroma._collection.query.call_count == 1
+        manager.search("emails from Alice", source_filter="email")
+        manager.search("calendar this week")
+        assert manager._chroma._collection.query.call_count == 3
+
+    def test_store_invalidates_result_cache(self, tmp_dir):
+        manager = MemoryManager(tmp_dir, enable_chroma=False)
+        manager._chroma = self._embedding_store()
+        manager._chroma.store = MagicMock()
+        manager.search("budget")
+        manager.store("new budget numbers", id="b1")
+        manager.search("budget")
+        assert manager._chroma._collection.query.call_count == 2
+
     def test_unavailable_search_returns_empty(self, tmp_dir):
         store = ChromaMemoryStore.__new__(ChromaMemoryStore)
         store._client = None
@@ -743,3 +864,73 @@ class TestIntegration:
         assert callable(sm)
         assert callable(so)
         assert len(schemas) == 2
+
+
+# ═══════════════════════════════════════════════════════════════════════════
+# Semantic Result Cache
+# ═══════════════════════════════════════════════════════════════════════════
+
+
+@pytest.fixture(params=["numpy", "pure"])
+def result_cache_factory(request):
+    """Build SemanticResultCache with NumPy (when installed) and without it."""
+    if request.param == "numpy":
+        pytest.importorskip("numpy")
+        return SemanticResultCache
+    def factory(*args, **kwargs):
+        with patch.dict("sys.modules", {"numpy": None}):
+            cache = SemanticResultCache(*args, **kwargs)
+        assert cache._np is None
+        return cache
+    return factory
+
+
+class TestSemanticResultCache:
+    def test_similar_embedding_hits(self, result_cache_factory):
+        cache = result_cache_factory(threshold=0.95)
+        cache.put([1.0, 0.0], "k", ["a"])
+        assert cache.get([2.0, 0.1], "k") == ["a"]
+        assert cache.get([0.5, 0.5], "k") is None
+
+    def test_key_must_match(self, result_cache_factory):
+        cache = result_cache_factory()
+        cache.put([1.0, 0.0], ("all", 10), ["a"])
+        assert cache.get([1.0, 0.0], ("email", 10)) is None
+
+    def test_best_match_wins(self, result_cache_factory):
+        cache = result_cache_factory(threshold=0.9)
+        cache.put([1.0, 0.2], "k", "near")
+        cache.put([1.0, 0.0], "k", "exact")
+        assert cache.get([1.0, 0.0], "k") == "exact"
+
+    def test_fifo_eviction(self, result_cache_factory):
+        cache = result_cache_factory(max_entries=2)
+        cache.put([1.0, 0.0], "k", "first")
+        cache.put([0.0, 1.0], "k", "second")
+        cache.put([1.0, 1.0], "k", "third")
+        assert len(cache) == 2
+        assert cache.get([1.0, 0.0], "k") is None
+        assert cache.get([0.0, 1.0], "k") == "second"
+
+    def test_zero_and_mismatched_vectors(self, result_cache_factory):
+        cache = result_cache_factory()
+        cache.put([0.0, 0.0], "k", "zero")
+        assert len(cache) == 0
+        cache.put([1.0, 0.0], "k", "2d")
+        assert cache.get([1.0, 0.0, 0.0], "k") is None
+        cache.put([1.0, 0.0, 0.0], "k", "3d")
+        assert len(cache) == 1
+
+    def test_ring_buffer_keeps_newest(self, result_cache_factory):
+        cache = result_cache_factory(max_entries=3)
+        for i in range(7):
+            cache.put([1.0, float(i)], i, f"v{i}")
+        assert len(cache) == 3
+        assert [cache.get([1.0, float(i)], i) for i in range(7)] == [None] * 4 + ["v4", "v5", "v6"]
+
+    def test_caller_embedding_not_modified(self, result_cache_factory):
+        embedding = [3.0, 4.0]
+        cache = result_cache_factory()
+        cache.put(embedding, "k", "v")
+        cache.get(embedding, "k")
+        assert embedding == [3.0, 4.0]
@@ -1,12 +1,18 @@
 """Tests for data-driven registries (chains, extractors, reflection, error recovery, knowledge, few-shot)."""
 
+import pickle
+import sys
+
 import pytest
 from omnigent.chains import CHAINS, ChainStep, get_escalation_chain, format_chain_for_prompt
 from omnigent.extractors import EXTRACTORS, run_extractor
 from omnigent.reflection import REFLECTORS, reflect_on_result_async
 from omnigent.error_recovery import ERROR_PATTERNS, RecoveryStrategy, get_recovery_strategy
 from omnigent.knowledge_loader import KNOWLEDGE_MAP, PHASE_BUDGETS
-from omnigent.few_shot_examples import EXAMPLES, ToolExample, get_examples
+from omnigent.few_shot_examples import (
+    EXAMPLES, ToolExample, dump_examples, examples_fingerprint, examples_fingerprint_all,
+    get_examples, get_examples_topk, load_examples, register_examples, render_examples,
+)
 
 
 class TestChains:
@@ -98,9 +104,42 @@ class TestFewShotExamples:
         assert ex.scenario == "Test scenario"
         assert ex.is_good is True
 
+    def test_tool_example_is_frozen_and_hashable(self):
+        kwargs = dict(
+            scenario="s", thinking="t", tool_name="tool",
+            expected_result="r", is_good=True,
+        )
+        a = ToolExample(tool_args={"b": 2, "a": 1}, **kwargs)
+        b = ToolExample(tool_args={"a": 1, "b": 2}, **kwargs)
+        assert a.tool_args == {"a": 1, "b": 2}
+        assert a.tool_args["a"] == 1
+        assert isinstance(a.tool_args, dict)
+        assert a.tool_args_dict == {"a": 1, "b": 2}
+        with pytest.raises(TypeError):
+            a.tool_args["a"] = 3
+        assert pickle.loads(pickle.dumps(a)) == a
+        assert a == b and hash(a) == hash(b)
+        assert not hasattr(a, "__dict__")
+        assert a.tool_name is b.tool_name
+        with pytest.raises(AttributeError):
+            a.scenario = "changed"
+
+    def test_tool_example_interns_strings(self):
+        name, key, value = "".join(["dyn", "_tool"]), "".join(["ta", "rget"]), "".join(["10.0", ".0.5"])
+        ex = ToolExample("s", "t", name, {key: value, "ports": [22]}, "r", True)
+        assert ex.tool_name is sys.intern("dyn_tool")
+        (arg_key, arg_value), ports = ex.tool_args.items()
+        assert arg_key is sys.intern("target")
+        assert arg_value is sys.intern("10.0.0.5")
+        assert ports == ("ports", [22])
+
+    def test_tool_example_non_str_arg_keys(self):
+        ex = ToolExample("s", "t", "tool", {1: "one", "b": 2}, "r", True)
+        assert ex.tool_args == {1: "one", "b": 2}
+
     def test_get_examples_missing(self):
         result = get_examples("nonexistent_tool_xyz")
-        assert result == [] or result is None
+        assert result == ()
 
     def test_get_examples_registered(self):
         # Register a temporary example
@@ -119,3 +158,181 @@ class TestFewShotExamples:
         assert results[0].scenario == "Test"
         # Cleanup
         del EXAMPLES["_test_tool"]
+
+    def test_register_examples_returns_shared_tuple(self):
+        ex = ToolExample(
+            scenario="Test", thinking="", tool_name="_test_tool",
+            tool_args={}, expected_result="OK", is_good=True,
+        )
+        register_examples("_test_tool", [ex])
+        try:
+            first = get_examples("_test_tool")
+            assert first == (ex,)
+            assert get_examples("_test_tool") is first
+        finally:
+            del EXAMPLES["_test_tool"]
+
+    def test_get_examples_good_only_and_k(self):
+        def ex(scenario, is_good):
+            return ToolExample(scenario, "", "_test_tool", {}, "OK", is_good)
+
+        register_examples("_test_tool", [ex("a", True), ex("bad", False), ex("b", True)])
+        try:
+            assert [e.scenario for e in get_examples("_test_tool", good_only=True)] == ["a", "b"]
+            assert [e.scenario for e in get_examples("_test_tool", k=2)] == ["a", "bad"]
+            assert [e.scenario for e in get_examples("_test_tool", good_only=True, k=1)] == ["a"]
+        finally:
+            del EXAMPLES["_test_tool"]
+
+    def test_get_examples_topk(self):
+        def embed(text):
+            text = text.lower()
+            return [text.count("port"), text.count("web"), text.count("dns")]
+
+        register_examples("_test_tool", [
+            ToolExample("Find web servers", "", "_test_tool", {}, "OK", True),
+            ToolExample("Which port is open", "port scan", "_test_tool", {}, "OK", True),
+            ToolExample("Resolve dns names", "", "_test_tool", {}, "OK", True),
+        ])
+        try:
+            top = get_examples_topk("_test_tool", "open port?", k=1, embed=embed)
+            assert [e.scenario for e in top] == ["Which port is open"]
+            top = get_examples_topk("_test_tool", "dns or web", k=2, embed=embed)
+            assert {e.scenario for e in top} == {"Find web servers", "Resolve dns names"}
+            # No embedder → registration order
+            top = get_examples_topk("_test_tool", "open port?", k=2)
+            assert [e.scenario for e in top] == ["Find web servers", "Which port is open"]
+        finally:
+            del EXAMPLES["_test_tool"]
+
+    def test_topk_caches_examples_weakly_and_skips_queries(self):
+        import gc
+
+        from omnigent import few_shot_examples
+
+        class Model:
+            def __init__(self):
+                self.calls = []
+
+            def embed(self, text):
+                self.calls.append(text)
+                return [text.count("a") + 1.0, 1.0]
+
+        register_examples("_test_tool", [
+            ToolExample(s, "", "_test_tool", {}, "OK", True) for s in ("aa", "b")
+        ])
+        try:
+            before = len(few_shot_examples._EXAMPLE_EMBEDDINGS)
+            model = Model()
+            get_examples_topk("_test_tool", "aaa", k=1, embed=model.embed)
+            get_examples_topk("_test_tool", "aaa", k=1, embed=model.embed)
+            # Examples embedded once; the query every call
+            assert model.calls.count("aa\n") == 1
+            assert model.calls.count("aaa") == 2
+            assert model in few_shot_examples._EXAMPLE_EMBEDDINGS
+            del model
+            gc.collect()
+            assert len(few_shot_examples._EXAMPLE_EMBEDDINGS) == before
+        finally:
+            del EXAMPLES["_test_tool"]
+
+    def test_topk_dimension_mismatch_raises(self):
+        dims = iter([[1.0, 0.0, 0.0], [1.0, 0.0], [0.0, 1.0]])
+        register_examples("_test_tool", [
+            ToolExample(s, "", "_test_tool", {}, "OK", True) for s in ("x", "y")
+        ])
+        try:
+            with pytest.raises(ValueError):
+                get_examples_topk("_test_tool", "q", k=1, embed=lambda text: next(dims))
+        finally:
+            del EXAMPLES["_test_tool"]
+
+    def test_examples_fingerprint(self):
+        assert examples_fingerprint("nonexistent_tool_xyz") == ""
+        before_all = examples_fingerprint_all()
+        ex = ToolExample("Test", "Why", "_test_tool", {"a": 1, "b": 2}, "OK", True)
+        register_examples("_test_tool", [ex])
+        try:
+            fp = examples_fingerprint("_test_tool")
+            assert len(fp) == 16
+            # Same content → same fingerprint, regardless of arg order
+            register_examples("_test_tool", [
+                ToolExample("Test", "Why", "_test_tool", {"b": 2, "a": 1}, "OK", True),
+            ])
+            assert examples_fingerprint("_test_tool") == fp
+            assert examples_fingerprint_all() != before_all
+            register_examples("_test_tool", [
+                ToolExample("Test", "Why", "_test_tool", {"a": 1, "b": 2}, "OK", False),
+            ])
+            assert examples_fingerprint("_test_tool") != fp
+        finally:
+            del EXAMPLES["_test_tool"]
+        assert examples_fingerprint_all() == before_all
+
+    def test_dump_and_load_examples(self, tmp_path):
+        pack = tmp_path / "examples.json"
+        ex = ToolExample("Test", "Why", "_test_tool", {"a": 1}, "OK", True)
+        register_examples("_test_tool", [ex])
+        dump_examples(pack, ["_test_tool"])
+        del EXAMPLES["_test_tool"]
+        try:
+            load_examples(pack)
+            assert get_examples("_test_tool") == (ex,)
+        finally:
+            EXAMPLES.pop("_test_tool", None)
+
+    def test_load_examples_lazy(self, tmp_path):
+        pack = tmp_path / "examples.json"
+        ex = ToolExample("Test", "Why", "_test_tool", {"a": 1}, "OK", False)
+        register_examples("_test_tool", [ex])
+        dump_examples(pack, ["_test_tool"])
+        del EXAMPLES["_test_tool"]
+        try:
+            load_examples(pack, lazy=True)
+            assert "_test_tool" not in EXAMPLES
+            assert get_examples("_test_tool") == (ex,)
+        finally:
+            EXAMPLES.pop("_test_tool", None)
+
+    def test_lazy_pack_does_not_override_later_registration(self, tmp_path):
+        pack = tmp_path / "examples.json"
+        old = ToolExample("Old", "", "_test_tool", {}, "OK", True)
+        new = ToolExample("New", "", "_test_tool", {}, "OK", True)
+        register_examples("_test_tool", [old])
+        dump_examples(pack, ["_test_tool"])
+        try:
+            load_examples(pack, lazy=True)
+            register_examples("_test_tool", [new])
+            assert get_examples("_test_tool") == (new,)
+            # A pack declared after the registration still wins
+            load_examples(pack, lazy=True)
+            assert get_examples("_test_tool") == (old,)
+        finally:
+            EXAMPLES.pop("_test_tool", None)
+
+    def test_bad_lazy_pack_is_logged_not_raised(self, tmp_path, caplog):
+        load_examples(tmp_path / "missing.json", lazy=True)
+        with caplog.at_level("WARNING", logger="omnigent.few_shot_examples"):
+            assert get_examples("nonexistent_tool_xyz") == ()
+        assert "missing.json" in caplog.text
+
+    def test_render_examples(self):
+        assert render_examples("nonexistent_tool_xyz") == ""
+        register_examples("_test_tool", [
+            ToolExample("Test", "Why", "_test_tool", {"a": 1}, "OK", True),
+        ])
+        try:
+            text = render_examples("_test_tool")
+            assert text.startswith("**Examples:**\n+ Example 1: Test")
+            assert render_examples("_test_tool") is text  # cached
+        finally:
+            del EXAMPLES["_test_tool"]
+
+    def test_render_examples_unhashable_args(self):
+        EXAMPLES["_test_tool"] = [
+            ToolExample("Test", "", "_test_tool", {"ports": [22, 80]}, "OK", False),
+        ]
+        try:
+            assert render_examples("_test_tool").startswith("**Examples:**\n- Example 1")
+        finally:
+            del EXAMPLES["_test_tool"]
@@ -78,6 +78,11 @@ class TestInitSkill:
         with pytest.raises(FileExistsError):
             init_skill("dupe-skill", output_dir=tmp_path)
 
+    def test_raises_on_unknown_category(self, tmp_path):
+        with pytest.raises(ValueError):
+            init_skill("odd-skill", output_dir=tmp_path, category="gardening")
+        assert not (tmp_path / "odd-skill").exists()
+
     def test_handler_files_are_valid_python(self, tmp_path):
         path = init_skill("syntax-check", output_dir=tmp_path, with_event_handler=True)
         for handler in ["poll.py", "ask.py", "event.py"]:
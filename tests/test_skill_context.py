@@ -310,12 +310,39 @@ class TestEventBus:
         await event_bus.emit("ev", {})
         assert called == [True]
 
+    @pytest.mark.asyncio
+    async def test_subscribe_during_emit_uses_snapshot(self, event_bus):
+        calls = []
+
+        async def late(et, data):
+            calls.append("late")
+
+        async def first(et, data):
+            calls.append("first")
+            event_bus.subscribe("ev", late)
+
+        event_bus.subscribe("ev", first)
+        await event_bus.emit("ev", {})
+        assert calls == ["first"]
+        await event_bus.emit("ev", {})
+        assert calls == ["first", "first", "late"]
+
     def test_listener_count(self, event_bus):
         async def cb(et, data): ...
         event_bus.subscribe("a", cb)
         event_bus.subscribe("b", cb)
         assert event_bus.listener_count == 2
 
+    def test_listener_count_after_unsubscribe(self, event_bus):
+        async def cb(et, data): ...
+        async def other(et, data): ...
+        event_bus.subscribe("a", cb)
+        event_bus.subscribe("a", cb)
+        event_bus.subscribe("a", other)
+        event_bus.unsubscribe("a", cb)
+        event_bus.unsubscribe("missing", cb)
+        assert event_bus.listener_count == 1
+
     @pytest.mark.asyncio
     async def test_emit_event_from_context(self, full_ctx, event_bus):
         received = []
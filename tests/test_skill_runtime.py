@@ -164,6 +164,14 @@ class TestManifestParsing:
         assert isinstance(d["triggers"], list)
         assert d["triggers"][0]["kind"] == "on_ask"
 
+    def test_to_dict_cached_and_tracks_enabled(self, tmp_path):
+        _write_skill(tmp_path, "test-skill", MINIMAL_YAML)
+        m = parse_manifest(tmp_path / "test-skill" / "skill.yaml")
+        d = m.to_dict()
+        assert m.to_dict() is d
+        m.enabled = False
+        assert m.to_dict()["enabled"] is False
+
     def test_multi_trigger_yaml(self, tmp_path):
         yaml_ = """\
         name: multi
@@ -182,6 +190,18 @@ class TestManifestParsing:
         assert len(m.ask_triggers) == 1
         assert len(m.event_triggers) == 1
 
+    def test_invalid_on_ask_regex_dropped_at_parse(self, tmp_path):
+        yaml_ = """\
+        name: badre
+        triggers:
+          - on_ask: "[invalid"
+          - on_ask: "valid"
+        """
+        _write_skill(tmp_path, "badre", yaml_)
+        m = parse_manifest(tmp_path / "badre" / "skill.yaml")
+        assert [t.value for t in m.ask_triggers] == ["valid"]
+        assert m.ask_triggers[0].compiled is not None
+
 
 # ═══════════════════════════════════════════════════════════════════════════
 # Schedule Parsing
@@ -213,6 +233,19 @@ class TestScheduleParsing:
     def test_case_insensitive(self):
         assert parse_schedule("Every 10M") == 600
 
+    def test_spelled_out_units(self):
+        assert parse_schedule("every 10 minutes") == 600
+        assert parse_schedule("every 2 hours") == 7200
+
+    def test_malformed_every(self):
+        assert parse_schedule("every5m") == 0
+        assert parse_schedule("every 5") == 0
+        assert parse_schedule("every ²m") == 0
+
+    def test_interval_cached_on_trigger(self):
+        assert SkillTrigger(kind="schedule", value="every 5m").interval_s == 300
+        assert SkillTrigger(kind="on_event", value="every 5m").interval_s == 0
+
 
 # ═══════════════════════════════════════════════════════════════════════════
 # Trigger Matching
@@ -243,6 +276,18 @@ class TestTriggerMatching:
         t = SkillTrigger(kind="on_ask", value="email")
         assert t.matches_event("email") is False
 
+    def test_kind_codes(self):
+        from omnibrain.skill_runtime import KIND_ASK, KIND_EVENT, KIND_SCHEDULE
+        assert SkillTrigger(kind="schedule", value="every 1h").code == KIND_SCHEDULE
+        assert SkillTrigger(kind="on_ask", value="x").code == KIND_ASK
+        assert SkillTrigger(kind="on_event", value="x").code == KIND_EVENT
+        assert SkillTrigger(kind="bogus", value="x").code == -1
+
+    def test_identical_patterns_share_compiled_regex(self):
+        a = SkillTrigger(kind="on_ask", value="weather|forecast")
+        b = SkillTrigger(kind="on_ask", value="weather|forecast")
+        assert a.compiled is b.compiled
+
     def test_bad_regex_no_crash(self):
         t = SkillTrigger(kind="on_ask", value="[invalid")
         assert t.matches_ask("test") is False
@@ -281,6 +326,17 @@ class TestDiscovery:
         rt.discover([tmp_path])  # second scan
         assert len(rt.skills) == 1
 
+    def test_rediscover_reuses_unchanged_manifest(self, tmp_path, monkeypatch):
+        _write_skill(tmp_path, "test-skill", MINIMAL_YAML)
+        rt = SkillRuntime()
+        rt.discover([tmp_path])
+
+        import omnibrain.skill_runtime as sr
+        calls = []
+        monkeypatch.setattr(sr, "parse_manifest", lambda p: calls.append(p))
+        assert rt.discover([tmp_path]) == []
+        assert calls == []
+
     def test_discover_skips_bad_manifest(self, tmp_path):
         skill_dir = tmp_path / "bad-skill"
         skill_dir.mkdir()
@@ -308,6 +364,25 @@ class TestHandlerLoading:
         fn = _load_handler(tmp_path, "handlers/nonexistent.py")
         assert fn is None
 
+    def test_shared_handler_file_imported_once(self, tmp_path):
+        counter = "LOADS = []\nLOADS.append(1)\n\nasync def handle(ctx, *a):\n    return len(LOADS)\n"
+        _write_skill(tmp_path, "s", MINIMAL_YAML, {"ask.py": counter})
+        first = _load_handler(tmp_path / "s", "handlers/ask.py")
+        second = _load_handler(tmp_path / "s", "handlers/../handlers/ask.py")
+        assert first is second
+
+    def test_discover_preloads_handlers(self, tmp_path):
+        _write_skill(tmp_path, "test-skill", MINIMAL_YAML, {"ask.py": ASK_HANDLER})
+        rt = SkillRuntime()
+        rt.discover([tmp_path])
+        assert rt._handlers_cache
+
+    def test_sandboxed_discover_does_not_import(self, tmp_path):
+        _write_skill(tmp_path, "test-skill", MINIMAL_YAML, {"ask.py": ASK_HANDLER})
+        rt = SkillRuntime(sandbox_enabled=True)
+        rt.discover([tmp_path])
+        assert rt._handlers_cache == {}
+
     def test_load_handler_no_handle_fn(self, tmp_path):
         _write_skill(tmp_path, "s", MINIMAL_YAML, {"ask.py": "x = 1\n"})
         fn = _load_handler(tmp_path / "s", "handlers/ask.py")
@@ -350,6 +425,139 @@ class TestMatchAsk:
         results = await rt.match_ask("hello")
         assert results == []
 
+    @pytest.mark.asyncio
+    async def test_combined_prefilter_keeps_unmergeable_patterns(self, tmp_path):
+        _write_skill(tmp_path, "a", MINIMAL_YAML.replace("test-skill", "a").replace(
+            "hello|world", "(?i)(weather|forecast)"), {"ask.py": ASK_HANDLER})
+        _write_skill(tmp_path, "b", MINIMAL_YAML.replace("test-skill", "b").replace(
+            "hello|world", "(ab)\\\\1"), {"ask.py": ASK_HANDLER})
+        rt = SkillRuntime()
+        rt.discover([tmp_path])
+        assert rt._ask_master_re is not None
+        assert [m.name for m, _ in rt._ask_fallback_skills] == ["b"]
+
+        assert [r["skill"] for r in await rt.match_ask("Weather today?")] == ["a"]
+        assert [r["skill"] for r in await rt.match_ask("abab")] == ["b"]
+        assert await rt.match_ask("nothing here") == []
+
+    @pytest.mark.asyncio
+    async def test_matching_handlers_run_concurrently(self, tmp_path):
+        slow_handler = """\
+import asyncio
+
+async def handle(ctx, message):
+    await asyncio.sleep(0.2)
+    return message
+"""
+        for name in ("slow-a", "slow-b"):
+            _write_skill(tmp_path, name, MINIMAL_YAML.replace("test-skill", name),
+                         {"ask.py": slow_handler})
+        rt = SkillRuntime()
+        rt.discover([tmp_path])
+
+        loop = asyncio.get_running_loop()
+        started = loop.time()
+        results = await rt.match_ask("hello")
+        assert loop.time() - started < 0.35
+        assert [r["skill"] for r in results] == ["slow-a", "slow-b"]
+        assert all(r["result"] == "hello" for r in results)
+
+    @pytest.mark.asyncio
+    async def test_repeat_message_memoised(self, tmp_path):
+        counting = """\
+CALLS = []
+
+async def handle(ctx, message):
+    CALLS.append(message)
+    return len(CALLS)
+"""
+        _write_skill(tmp_path, "impure", MINIMAL_YAML.replace("test-skill", "impure"),
+                     {"ask.py": counting})
+        _write_skill(tmp_path, "pure", MINIMAL_YAML.replace("test-skill", "pure") + "pure: true\n",
+                     {"ask.py": counting})
+        rt = SkillRuntime()
+        rt.discover([tmp_path])
+        assert rt.skills["pure"].pure is True
+
+        first = await rt.match_ask("hello")
+        second = await rt.match_ask("hello")
+        assert "hello" in rt._ask_match_cache
+        by_skill = {r["skill"]: r["result"] for r in second}
+        assert by_skill["impure"] == 2  # handler re-ran
+        assert by_skill["pure"] == {r["skill"]: r["result"] for r in first}["pure"]
+
+    @pytest.mark.asyncio
+    async def test_set_skill_enabled_updates_dispatch(self, tmp_path):
+        _write_skill(tmp_path, "test-skill", MINIMAL_YAML, {"ask.py": ASK_HANDLER})
+        rt = SkillRuntime()
+        rt.discover([tmp_path])
+
+        assert rt.set_skill_enabled("test-skill", False) is True
+        assert await rt.match_ask("hello") == []
+        rt.set_skill_enabled("test-skill", True)
+        results = await rt.match_ask("hello")
+        assert [r["skill"] for r in results] == ["test-skill"]
+
+
+class TestContextReuse:
+    def test_context_cached_per_skill(self, tmp_path):
+        _write_skill(tmp_path, "test-skill", MINIMAL_YAML)
+        rt = SkillRuntime()
+        rt.discover([tmp_path])
+        manifest = rt.skills["test-skill"]
+
+        ctx = rt._make_context(manifest)
+        ctx.log("first")
+        rt._release_context(manifest, ctx)
+        again = rt._make_context(manifest)
+        assert again is ctx
+        assert again._log_buffer == []
+        assert again.permissions == frozenset({"read_memory", "notify"})
+
+    def test_context_in_flight_not_shared(self, tmp_path):
+        _write_skill(tmp_path, "test-skill", MINIMAL_YAML)
+        rt = SkillRuntime()
+        rt.discover([tmp_path])
+        manifest = rt.skills["test-skill"]
+
+        ctx = rt._make_context(manifest)
+        ctx.log("mine")
+        assert rt._make_context(manifest) is not ctx
+        assert ctx._log_buffer[0]["message"] == "mine"
+
+    @pytest.mark.asyncio
+    async def test_concurrent_invocations_keep_separate_logs(self, tmp_path):
+        HANDLER = """\
+        import asyncio
+
+        async def handle(ctx, message):
+            ctx.log(message)
+            await asyncio.sleep(0.01)
+            return [entry["message"] for entry in ctx._log_buffer]
+        """
+        _write_skill(tmp_path, "test-skill", MINIMAL_YAML, {"ask.py": HANDLER})
+        rt = SkillRuntime()
+        rt.discover([tmp_path])
+        manifest = rt.skills["test-skill"]
+
+        results = await asyncio.gather(
+            rt._invoke_handler(manifest, "on_ask", "a"),
+            rt._invoke_handler(manifest, "on_ask", "b"),
+        )
+        assert results == [["a"], ["b"]]
+
+    def test_context_dropped_on_enable_toggle(self, tmp_path):
+        _write_skill(tmp_path, "test-skill", MINIMAL_YAML)
+        rt = SkillRuntime()
+        rt.discover([tmp_path])
+        manifest = rt.skills["test-skill"]
+
+        ctx = rt._make_context(manifest)
+        rt._release_context(manifest, ctx)
+        rt.set_skill_enabled("test-skill", False)
+        rt.set_skill_enabled("test-skill", True)
+        assert rt._make_context(manifest) is not ctx
+
 
 # ═══════════════════════════════════════════════════════════════════════════
 # Runtime — handle_event
@@ -375,6 +583,16 @@ class TestHandleEvent:
         count = await rt.handle_event("unknown_event", {})
         assert count == 0
 
+    @pytest.mark.asyncio
+    async def test_disabled_skill_not_dispatched(self, tmp_path):
+        _write_skill(tmp_path, "event-skill", EVENT_YAML, {"event.py": EVENT_HANDLER})
+        rt = SkillRuntime()
+        rt.discover([tmp_path])
+        rt.set_skill_enabled("event-skill", False)
+
+        count = await rt.handle_event("new_email", {})
+        assert count == 0
+
 
 # ═══════════════════════════════════════════════════════════════════════════
 # Runtime — tick (schedule)
@@ -401,6 +619,29 @@ class TestTick:
         count = await rt.tick()  # immediately after → too soon
         assert count == 0
 
+    @pytest.mark.asyncio
+    async def test_tick_reschedules_after_interval(self, tmp_path):
+        _write_skill(tmp_path, "sched-skill", SCHEDULE_YAML, {"poll.py": SCHEDULE_HANDLER})
+        rt = SkillRuntime()
+        rt.discover([tmp_path])
+
+        await rt.tick()
+        (due, *_rest), = rt._schedule_heap
+        assert due > 0
+        # Pretend the 5-minute interval has elapsed
+        rt._schedule_heap = [(0.0, *_rest)]
+        assert await rt.tick() == 1
+        assert len(rt._schedule_heap) == 1
+
+    @pytest.mark.asyncio
+    async def test_tick_skips_disabled_skill(self, tmp_path):
+        _write_skill(tmp_path, "sched-skill", SCHEDULE_YAML, {"poll.py": SCHEDULE_HANDLER})
+        rt = SkillRuntime()
+        rt.discover([tmp_path])
+        rt.set_skill_enabled("sched-skill", False)
+
+        assert await rt.tick() == 0
+
 
 # ═══════════════════════════════════════════════════════════════════════════
 # Runtime — event bus wiring
@@ -439,6 +680,21 @@ class TestRuntimeLifecycle:
         await task
         assert rt._running is False
 
+    @pytest.mark.asyncio
+    async def test_discover_wakes_idle_loop(self, tmp_path):
+        _write_skill(tmp_path, "sched-skill", SCHEDULE_YAML, {"poll.py": SCHEDULE_HANDLER})
+        rt = SkillRuntime()
+        task = asyncio.create_task(rt.run())
+        await asyncio.sleep(0.05)  # loop is now idle-sleeping
+
+        rt.tick = AsyncMock(wraps=rt.tick)
+        rt.discover([tmp_path])
+        await asyncio.sleep(0.05)
+        assert rt.tick.await_count == 1
+
+        await rt.stop()
+        await asyncio.wait_for(task, timeout=1)
+
     def test_get_status(self, tmp_path):
         _write_skill(tmp_path, "test-skill", MINIMAL_YAML)
         rt = SkillRuntime()
@@ -12,9 +12,15 @@ Groups:
 from __future__ import annotations
 
 import asyncio
+import io
 import json
+import logging
+import os
+import struct
+import subprocess
 import sys
 import textwrap
+import time
 from pathlib import Path
 from unittest.mock import AsyncMock, MagicMock, patch
 
@@ -22,6 +28,9 @@ import pytest
 
 from omnibrain.skill_sandbox import (
     ALLOWED_METHODS,
+    MAX_BATCH_SIZE,
+    RPC_EMIT_EVENT,
+    RPC_GET_CONTACTS,
     RPC_GET_EVENTS,
     RPC_GET_PREFERENCE,
     RPC_LOG,
@@ -30,10 +39,20 @@ from omnibrain.skill_sandbox import (
     RPC_MEMORY_STORE,
     RPC_NOTIFY,
     RPC_PROPOSE,
+    SandboxPool,
     SkillContextProxy,
+    run_handler_sandboxed,
     SkillSandboxBridge,
     ensure_skill_venv,
+    _can_limit_from_parent,
+    _dumps,
     _hash_deps,
+    _iter_frames,
+    _loads,
+    _process_cpu_seconds,
+    _rpc_head,
+    _run_quiet,
+    _sandbox_python,
 )
 
 
@@ -52,6 +71,37 @@ def _make_bridge(**kwargs) -> SkillSandboxBridge:
     return SkillSandboxBridge(**defaults)
 
 
+class _FakeRouter:
+    """LLM router stub whose stream() yields fixed chunks."""
+
+    def __init__(self, *chunks: str) -> None:
+        self.chunks = chunks
+
+    async def stream(self, messages):
+        for text in self.chunks:
+            yield MagicMock(content=text)
+
+
+def _framed(*messages) -> io.BytesIO:
+    """Length-prefixed frames for the given messages, ready to be read."""
+    buf = io.BytesIO()
+    for msg in messages:
+        payload = json.dumps(msg).encode()
+        buf.write(struct.pack(">I", len(payload)) + payload)
+    buf.seek(0)
+    return buf
+
+
+def _unframe(data: bytes) -> list:
+    """Decode every length-prefixed frame in *data*."""
+    out, pos = [], 0
+    while pos < len(data):
+        (size,) = struct.unpack(">I", data[pos:pos + 4])
+        out.append(json.loads(data[pos + 4:pos + 4 + size]))
+        pos += 4 + size
+    return out
+
+
 def _make_rpc(method: str, params: dict = None, req_id: int = 1) -> dict:
     return {
         "jsonrpc": "2.0",
@@ -93,6 +143,12 @@ class TestBridgePermissions:
         bridge = _make_bridge(permissions={"llm_access"})
         assert bridge.check_permission(RPC_LLM_COMPLETE) is True
 
+    def test_allowed_set_precomputed(self):
+        bridge = _make_bridge(permissions={"read_memory"})
+        assert bridge._allowed == frozenset({RPC_MEMORY_SEARCH, RPC_LOG})
+        assert RPC_NOTIFY in bridge._denied
+        assert bridge.check_permission("unknown_method") is True
+
     def test_all_methods_have_permission_mapping(self):
         """Every allowed RPC method must have a permission mapping."""
         for method in ALLOWED_METHODS:
@@ -106,12 +162,12 @@ class TestBridgeRPC:
         resp = await bridge.handle_rpc(_make_rpc(RPC_MEMORY_SEARCH, {"query": "test"}))
         assert "error" in resp
         assert resp["error"]["code"] == -32001
-        assert "Permission denied" in resp["error"]["message"]
+        assert resp["error"]["message"] == "Permission denied: memory_search requires read_memory"
 
     @pytest.mark.asyncio
     async def test_rate_limit(self):
         bridge = _make_bridge()
-        bridge._max_calls_per_invocation = 2
+        bridge._remaining = 2
 
         # First two calls pass
         resp1 = await bridge.handle_rpc(_make_rpc(RPC_LOG, {"message": "a"}, 1))
@@ -182,6 +238,23 @@ class TestBridgeRPC:
         )
         assert resp["result"] == "dark"
 
+    @pytest.mark.asyncio
+    async def test_get_contacts_projects_objects(self):
+        from omnibrain.models import ContactInfo
+
+        mock_db = MagicMock()
+        mock_db.get_contacts.return_value = [
+            ContactInfo(email="a@x.com", name="A"),
+            ContactInfo(email="b@x.com", name="B"),
+        ]
+        bridge = _make_bridge(permissions={"read_contacts"}, db=mock_db)
+        resp = await bridge.handle_rpc(_make_rpc(RPC_GET_CONTACTS, {"limit": 2}))
+        assert [c["email"] for c in resp["result"]] == ["a@x.com", "b@x.com"]
+
+        mock_db.get_contacts.return_value = [{"email": "c@x.com"}]
+        resp = await bridge.handle_rpc(_make_rpc(RPC_GET_CONTACTS))
+        assert resp["result"] == [{"email": "c@x.com"}]
+
     @pytest.mark.asyncio
     async def test_propose_action_dispatch(self):
         mock_db = MagicMock()
@@ -208,6 +281,38 @@ class TestBridgeRPC:
         assert resp["error"]["code"] == -32603
         assert "DB crashed" in resp["error"]["message"]
 
+    def test_only_live_services_registered(self):
+        bridge = _make_bridge(memory=MagicMock())
+        assert set(bridge._handlers) == {RPC_LOG, RPC_MEMORY_SEARCH, RPC_MEMORY_STORE}
+
+    @pytest.mark.asyncio
+    async def test_no_backend_fallbacks(self):
+        bridge = _make_bridge(permissions={"notify", "write_memory", "read_preferences"})
+        assert (await bridge.handle_rpc(_make_rpc(RPC_NOTIFY)))["result"] is True
+        assert (await bridge.handle_rpc(_make_rpc(RPC_MEMORY_STORE)))["result"] is False
+        assert (await bridge.handle_rpc(_make_rpc(RPC_GET_PREFERENCE)))["result"] is None
+        assert (await bridge.handle_rpc(_make_rpc("unknown_method")))["result"] is None
+
+    @pytest.mark.asyncio
+    async def test_llm_stream_sends_partials(self):
+        bridge = _make_bridge(llm_router=_FakeRouter("hel", "", "lo"))
+        sent = []
+
+        async def send(msg):
+            sent.append(msg)
+
+        resp = await bridge.handle_rpc(
+            _make_rpc(RPC_LLM_COMPLETE, {"messages": [], "stream": True}, 4), send,
+        )
+        assert sent == [{"id": 4, "partial": "hel"}, {"id": 4, "partial": "lo"}]
+        assert resp == {"id": 4, "result": None}
+
+    @pytest.mark.asyncio
+    async def test_llm_without_send_buffers(self):
+        bridge = _make_bridge(llm_router=_FakeRouter("a", "b"))
+        resp = await bridge.handle_rpc(_make_rpc(RPC_LLM_COMPLETE, {"stream": True}))
+        assert resp["result"] == "ab"
+
     @pytest.mark.asyncio
     async def test_no_backend_returns_empty(self):
         """If no memory/db is wired, gracefully return empty."""
@@ -216,14 +321,108 @@ class TestBridgeRPC:
         assert resp["result"] == []
 
 
+class TestCodec:
+    def test_round_trip(self):
+        msg = {"id": 1, "result": [{"text": "ü", "score": 0.5}]}
+        assert isinstance(_dumps(msg), bytes)
+        assert _loads(_dumps(msg)) == msg
+
+    def test_matches_stdlib_edge_cases(self):
+        assert _loads(_dumps({1: "a"})) == {"1": "a"}
+        assert _loads(_dumps([2 ** 70])) == [2 ** 70]
+
+
+class TestRequestTemplates:
+    def test_request_head_matches_json(self):
+        payload = _rpc_head(RPC_LOG, with_id=True) % 12 + b'{"message":"hi"}}'
+        assert json.loads(payload) == _make_rpc(RPC_LOG, {"message": "hi"}, 12)
+
+    def test_notification_head_has_no_id(self):
+        payload = _rpc_head(RPC_NOTIFY, with_id=False) + b"{}}"
+        assert json.loads(payload) == {"jsonrpc": "2.0", "method": RPC_NOTIFY, "params": {}}
+
+    def test_unusual_method_name_escaped(self):
+        payload = _rpc_head('odd"%d', with_id=True) % 1 + b"{}}"
+        assert json.loads(payload)["method"] == 'odd"%d'
+
+
+class TestFraming:
+    @pytest.mark.asyncio
+    async def test_iter_frames_splits_bursts_and_partial_reads(self):
+        data = _framed({"a": 1}, [1, 2], {"b": "x" * 100}).getvalue()
+        reader = asyncio.StreamReader()
+        reader.feed_data(data[:3])        # partial header
+        reader.feed_data(data[3:20])      # rest of frame 1 + part of frame 2
+        reader.feed_data(data[20:])
+        reader.feed_eof()
+        frames = [json.loads(f) async for f in _iter_frames(reader)]
+        assert frames == [{"a": 1}, [1, 2], {"b": "x" * 100}]
+
+
+class TestRawResponses:
+    @pytest.mark.asyncio
+    async def test_raw_matches_dict(self):
+        mock_mem = MagicMock()
+        mock_mem.search.return_value = [MagicMock(text="t", source="s", score=1.0)]
+        for req in (
+            _make_rpc(RPC_MEMORY_SEARCH, {"query": "q"}, 3),
+            _make_rpc(RPC_NOTIFY, {}, "str-id"),
+        ):
+            raw_bridge = _make_bridge(permissions={"read_memory"}, memory=mock_mem)
+            dict_bridge = _make_bridge(permissions={"read_memory"}, memory=mock_mem)
+            raw = await raw_bridge.handle_rpc_raw(req)
+            assert json.loads(raw) == await dict_bridge.handle_rpc(req)
+
+    @pytest.mark.asyncio
+    async def test_raw_batch(self):
+        bridge = _make_bridge()
+        note = {"jsonrpc": "2.0", "method": RPC_LOG, "params": {}}
+        assert await bridge.handle_batch_raw([note]) is None
+        raw = await bridge.handle_batch_raw([note, _make_rpc(RPC_LOG, {}, 5)])
+        assert json.loads(raw) == [{"id": 5, "result": True}]
+
+
+class TestBridgeBatch:
+    @pytest.mark.asyncio
+    async def test_batch_reserves_remaining_budget(self):
+        bridge = _make_bridge()
+        bridge._remaining = 2
+        reqs = [_make_rpc(RPC_LOG, {"message": "m"}, i) for i in range(3)]
+        resps = await bridge.handle_batch(reqs)
+        assert ["result" in r for r in resps] == [True, True, False]
+        assert resps[2]["error"]["code"] == -32000
+        assert bridge._remaining == 0
+        single = await bridge.handle_rpc(_make_rpc(RPC_LOG, {}, 9))
+        assert single["error"]["code"] == -32000
+
+    @pytest.mark.asyncio
+    async def test_batch_skips_notifications(self):
+        bridge = _make_bridge()
+        note = {"jsonrpc": "2.0", "method": RPC_LOG, "params": {"message": "x"}}
+        resps = await bridge.handle_batch([
+            note, _make_rpc(RPC_MEMORY_SEARCH, {"query": "q"}, 7),
+        ])
+        assert resps == [{"id": 7, "result": []}]
+
+    @pytest.mark.asyncio
+    async def test_batch_limit(self):
+        bridge = _make_bridge()
+        reqs = [_make_rpc(RPC_LOG, {"message": "m"}, i) for i in range(MAX_BATCH_SIZE + 2)]
+        resps = await bridge.handle_batch(reqs)
+        assert len(resps) == MAX_BATCH_SIZE + 2
+        assert all("result" in r for r in resps[:MAX_BATCH_SIZE])
+        assert resps[-1]["error"]["code"] == -32600
+
+
 # ═══════════════════════════════════════════════════════════════════════════
 # Venv Management
 # ═══════════════════════════════════════════════════════════════════════════
 
 
 class TestVenvManagement:
-    def test_no_deps_returns_sys_executable(self, tmp_path):
-        result = ensure_skill_venv(tmp_path, [])
+    @pytest.mark.asyncio
+    async def test_no_deps_returns_sys_executable(self, tmp_path):
+        result = await ensure_skill_venv(tmp_path, [])
         assert result == sys.executable
 
     def test_hash_deps_deterministic(self):
@@ -241,7 +440,8 @@ class TestVenvManagement:
         h2 = _hash_deps(["httpx"])
         assert h1 != h2
 
-    def test_cached_venv_reused(self, tmp_path):
+    @pytest.mark.asyncio
+    async def test_cached_venv_reused(self, tmp_path):
         """If venv + marker exist and match, we skip creation."""
         skill_path = tmp_path / "test-skill"
         skill_path.mkdir()
@@ -258,9 +458,54 @@ class TestVenvManagement:
         marker = skill_path / ".venv" / ".deps_installed"
         marker.write_text(_hash_deps(deps))
 
-        result = ensure_skill_venv(skill_path, deps)
+        result = await ensure_skill_venv(skill_path, deps)
         assert result == str(fake_python)
 
+    def test_sandbox_python_probe_memoised(self, tmp_path):
+        skill_path = tmp_path / "probe-skill"
+        skill_path.mkdir()
+        assert _sandbox_python(skill_path) == sys.executable
+        venv_bin = skill_path / ".venv" / "bin"
+        venv_bin.mkdir(parents=True)
+        (venv_bin / "python").write_text("")
+        assert _sandbox_python(skill_path) == sys.executable
+
+    @pytest.mark.asyncio
+    async def test_verified_venv_memoised(self, tmp_path):
+        """After one verification the marker is not consulted again."""
+        skill_path = tmp_path / "memo-skill"
+        venv_bin = skill_path / ".venv" / "bin"
+        venv_bin.mkdir(parents=True)
+        (venv_bin / "python").write_text("")
+        deps = ["httpx", "requests"]
+        marker = skill_path / ".venv" / ".deps_installed"
+        marker.write_text(_hash_deps(deps))
+
+        first = await ensure_skill_venv(skill_path, deps)
+        marker.unlink()
+        with patch("omnibrain.skill_sandbox.asyncio.create_subprocess_exec") as mock_exec:
+            second = await ensure_skill_venv(skill_path, list(reversed(deps)))
+        mock_exec.assert_not_called()
+        assert first == second == str(venv_bin / "python")
+
+    @pytest.mark.asyncio
+    async def test_run_quiet_reports_stderr_on_failure(self):
+        cmd = "import sys; print('chatter'); sys.stderr.write('bad dep'); sys.exit(3)"
+        with pytest.raises(subprocess.CalledProcessError) as exc:
+            await _run_quiet([sys.executable, "-c", cmd], timeout=30)
+        assert exc.value.returncode == 3
+        assert exc.value.stderr == b"bad dep"
+
+    @pytest.mark.asyncio
+    async def test_failed_install_falls_back(self, tmp_path):
+        skill_path = tmp_path / "broken-skill"
+        skill_path.mkdir()
+        with patch(
+            "omnibrain.skill_sandbox._run_quiet",
+            side_effect=subprocess.CalledProcessError(1, ["pip"], stderr=b"no such dep"),
+        ):
+            assert await ensure_skill_venv(skill_path, ["nope"]) == sys.executable
+
 
 # ═══════════════════════════════════════════════════════════════════════════
 # SkillContextProxy
@@ -273,66 +518,126 @@ class TestSkillContextProxy:
         assert proxy.skill_name == "my-skill"
         assert proxy._request_id == 0
 
-    def test_send_rpc_increments_id(self):
+    @pytest.mark.asyncio
+    async def test_send_rpc_increments_id(self):
         """Verify that _send_rpc produces incrementing request IDs."""
-        proxy = SkillContextProxy("test")
-
-        response1 = json.dumps({"id": 1, "result": [{"text": "hi"}]}) + "\n"
-        response2 = json.dumps({"id": 2, "result": True}) + "\n"
-
-        captured = []
-        call_count = 0
-
-        def mock_write(data):
-            captured.append(data)
+        reader = _framed({"id": 1, "result": [{"text": "hi"}]}, {"id": 2, "result": True})
+        writer = io.BytesIO()
+        proxy = SkillContextProxy("test", reader=reader, writer=writer)
 
-        def mock_readline():
-            nonlocal call_count
-            call_count += 1
-            if call_count == 1:
-                return response1
-            return response2
-
-        with patch.object(sys, "stdout", wraps=sys.stdout) as mock_stdout, \
-             patch.object(sys, "stdin", wraps=sys.stdin) as mock_stdin:
-            mock_stdout.write = mock_write
-            mock_stdout.flush = MagicMock()
-            mock_stdin.readline = mock_readline
-
-            result1 = proxy._send_rpc(RPC_MEMORY_SEARCH, {"query": "test"})
-            result2 = proxy._send_rpc(RPC_LOG, {"message": "hello"})
+        result1 = await proxy._send_rpc(RPC_MEMORY_SEARCH, {"query": "test"})
+        result2 = await proxy._send_rpc(RPC_LOG, {"message": "hello"})
 
         assert proxy._request_id == 2
         assert result1 == [{"text": "hi"}]
         assert result2 is True
 
-        # Parse captured writes — each _send_rpc does one write (json + newline)
-        requests_sent = [
-            json.loads(s) for s in captured if s.strip() and s.strip().startswith("{")
-        ]
+        requests_sent = _unframe(writer.getvalue())
         assert len(requests_sent) == 2
         assert requests_sent[0]["id"] == 1
         assert requests_sent[0]["method"] == RPC_MEMORY_SEARCH
         assert requests_sent[1]["id"] == 2
         assert requests_sent[1]["method"] == RPC_LOG
 
-    def test_send_rpc_error_raises(self):
+    @pytest.mark.asyncio
+    async def test_send_rpc_error_raises(self):
         """Verify that RPC errors are raised as RuntimeError."""
-        proxy = SkillContextProxy("test")
-
-        error_response = json.dumps({
+        reader = _framed({
             "id": 1,
             "error": {"code": -32001, "message": "Permission denied"},
-        }) + "\n"
+        })
+        proxy = SkillContextProxy("test", reader=reader, writer=io.BytesIO())
+
+        with pytest.raises(RuntimeError, match="Permission denied"):
+            await proxy._send_rpc(RPC_MEMORY_SEARCH, {"query": "x"})
 
-        with patch.object(sys, "stdout", wraps=sys.stdout) as mock_stdout, \
-             patch.object(sys, "stdin", wraps=sys.stdin) as mock_stdin:
-            mock_stdout.write = MagicMock()
-            mock_stdout.flush = MagicMock()
-            mock_stdin.readline = MagicMock(return_value=error_response)
+    @pytest.mark.asyncio
+    async def test_llm_stream_yields_partials(self):
+        reader = _framed(
+            {"id": 1, "partial": "hel"},
+            {"id": 1, "partial": "lo"},
+            {"id": 1, "result": None},
+        )
+        writer = io.BytesIO()
+        proxy = SkillContextProxy("test", reader=reader, writer=writer)
+        chunks = [c async for c in proxy.llm_stream([{"role": "user", "content": "hi"}])]
+        assert chunks == ["hel", "lo"]
+        assert _unframe(writer.getvalue())[0]["params"]["stream"] is True
+
+    @pytest.mark.asyncio
+    async def test_llm_complete_joins_stream(self):
+        reader = _framed({"id": 1, "partial": "a"}, {"id": 1, "partial": "b"}, {"id": 1, "result": None})
+        proxy = SkillContextProxy("test", reader=reader, writer=io.BytesIO())
+        assert await proxy.llm_complete([]) == "ab"
+
+    @pytest.mark.asyncio
+    async def test_send_rpc_eof_returns_none(self):
+        proxy = SkillContextProxy("test", reader=io.BytesIO(), writer=io.BytesIO())
+        assert await proxy._send_rpc(RPC_MEMORY_SEARCH, {"query": "x"}) is None
+
+    @pytest.mark.asyncio
+    async def test_gathered_calls_matched_by_id(self):
+        """Responses may come back in any order; each call gets its own."""
+        reader = _framed({"id": 2, "result": "second"}, {"id": 1, "result": "first"})
+        writer = io.BytesIO()
+        proxy = SkillContextProxy("test", reader=reader, writer=writer)
+
+        results = await asyncio.gather(
+            proxy.get_preference("a"), proxy.get_preference("b"),
+        )
+
+        assert results == ["first", "second"]
+        assert [m["id"] for m in _unframe(writer.getvalue())] == [1, 2]
+
+    @pytest.mark.asyncio
+    async def test_notifications_ride_along_with_next_call(self):
+        writer = io.BytesIO()
+        proxy = SkillContextProxy(
+            "test", reader=_framed([{"id": 1, "result": []}]), writer=writer,
+        )
 
-            with pytest.raises(RuntimeError, match="Permission denied"):
-                proxy._send_rpc(RPC_MEMORY_SEARCH, {"query": "x"})
+        await proxy.log("one")
+        await proxy.emit_event("ev", {"a": 1})
+        assert writer.getvalue() == b""
+        result = await proxy.memory_search("q")
+
+        assert result == []
+        sent = _unframe(writer.getvalue())
+        assert len(sent) == 1
+        assert [m["method"] for m in sent[0]] == [RPC_LOG, RPC_EMIT_EVENT, RPC_MEMORY_SEARCH]
+        assert "id" not in sent[0][0]
+        assert sent[0][2]["id"] == 1
+
+    @pytest.mark.asyncio
+    async def test_log_below_level_not_sent(self):
+        writer = io.BytesIO()
+        proxy = SkillContextProxy("test", writer=writer, min_log_level=logging.INFO)
+        await proxy.log("noisy", level="debug")
+        assert proxy._pending == []
+        await proxy.log("kept", level="warning")
+        proxy.flush()
+        assert _unframe(writer.getvalue())[0]["params"]["message"] == "kept"
+
+    def test_log_level_from_env(self, monkeypatch):
+        monkeypatch.setenv("OMNIBRAIN_SKILL_LOG_LEVEL", str(logging.WARNING))
+        assert SkillContextProxy("test")._min_log_level == logging.WARNING
+
+    @pytest.mark.asyncio
+    async def test_batch_returns_results_in_order(self):
+        reader = _framed([
+            {"id": 2, "result": "pref"},
+            {"id": 1, "result": [{"text": "hit"}]},
+        ])
+        writer = io.BytesIO()
+        proxy = SkillContextProxy("test", reader=reader, writer=writer)
+
+        results = await proxy.batch([
+            (RPC_MEMORY_SEARCH, {"query": "q"}),
+            (RPC_GET_PREFERENCE, {"key": "k"}),
+        ])
+
+        assert results == [[{"text": "hit"}], "pref"]
+        assert len(_unframe(writer.getvalue())) == 1
 
 
 # ═══════════════════════════════════════════════════════════════════════════
@@ -450,6 +755,38 @@ class TestVenvOnDiscovery:
             mock_venv.assert_called_once()
             assert rt._skill_python["dep-skill"] == "/fake/python"
 
+    @pytest.mark.asyncio
+    async def test_discovery_in_loop_builds_venv_in_background(self, tmp_path):
+        from omnibrain.skill_runtime import SkillRuntime
+
+        YAML = """\
+        name: dep-skill
+        version: 1.0.0
+        triggers: []
+        permissions: []
+        handlers: {}
+        dependencies:
+          - requests
+        """
+        _write_skill(tmp_path, "dep-skill", YAML)
+        rt = SkillRuntime()
+        release = asyncio.Event()
+
+        async def slow_venv(path, deps):
+            await release.wait()
+            return "/fake/python"
+
+        with patch("omnibrain.skill_sandbox.ensure_skill_venv", side_effect=slow_venv):
+            rt.discover([tmp_path])
+            assert "dep-skill" not in rt._skill_python
+            task = rt._venv_tasks["dep-skill"]
+            release.set()
+            await task
+            await asyncio.sleep(0)
+
+        assert rt._skill_python["dep-skill"] == "/fake/python"
+        assert rt._venv_tasks == {}
+
     def test_no_deps_no_venv(self, tmp_path):
         from omnibrain.skill_runtime import SkillRuntime
 
@@ -466,3 +803,362 @@ class TestVenvOnDiscovery:
         with patch("omnibrain.skill_sandbox.ensure_skill_venv") as mock_venv:
             rt.discover([tmp_path])
             mock_venv.assert_not_called()
+
+
+@pytest.fixture
+async def pool():
+    """A private worker pool, shut down after the test."""
+    p = SandboxPool()
+    yield p
+    await p.close()
+
+
+class TestSandboxEndToEnd:
+    """Run real handlers in a sandbox subprocess."""
+
+    @pytest.mark.asyncio
+    async def test_handler_round_trip(self, tmp_path, pool):
+        HANDLER = """\
+        async def handle(ctx, msg):
+            await ctx.log("starting")
+            await ctx.notify("heads up")
+            hits, pref = await ctx.batch([
+                ("memory_search", {"query": msg}),
+                ("get_preference", {"key": "theme"}),
+            ])
+            return {"echo": msg, "hits": hits, "pref": pref}
+        """
+        skill_dir = _write_skill(tmp_path, "e2e", "name: e2e\n", {"ask.py": HANDLER})
+        mock_db = MagicMock()
+        mock_db.get_preference.return_value = "dark"
+        mock_bus = MagicMock()
+
+        result = await run_handler_sandboxed(
+            skill_name="e2e",
+            skill_path=skill_dir,
+            handler_relpath="handlers/ask.py",
+            handler_key="on_ask",
+            permissions={"read_memory", "read_preferences", "notify"},
+            args_json='["hi"]',
+            timeout=30,
+            db=mock_db,
+            event_bus=mock_bus,
+            pool=pool,
+        )
+
+        assert result == {"echo": "hi", "hits": [], "pref": "dark"}
+        mock_bus.publish.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_llm_complete_streams_through_bridge(self, tmp_path, pool):
+        HANDLER = """\
+        async def handle(ctx):
+            chunks = [c async for c in ctx.llm_stream([{"role": "user", "content": "hi"}])]
+            return chunks
+        """
+        skill_dir = _write_skill(tmp_path, "llm", "name: llm\n", {"ask.py": HANDLER})
+        result = await run_handler_sandboxed(
+            skill_name="llm",
+            skill_path=skill_dir,
+            handler_relpath="handlers/ask.py",
+            handler_key="on_ask",
+            permissions={"llm_access"},
+            timeout=30,
+            llm_router=_FakeRouter("Hello", ", ", "world"),
+            pool=pool,
+        )
+        assert result == ["Hello", ", ", "world"]
+
+    @pytest.mark.asyncio
+    async def test_gathered_calls_overlap(self, tmp_path, pool):
+        class _SlowRouter:
+            async def stream(self, messages):
+                await asyncio.sleep(0.5)
+                yield MagicMock(content=messages[0]["content"])
+
+        HANDLER = """\
+        import asyncio
+
+        async def handle(ctx):
+            return await asyncio.gather(
+                ctx.llm_complete([{"role": "user", "content": "a"}]),
+                ctx.llm_complete([{"role": "user", "content": "b"}]),
+                ctx.llm_complete([{"role": "user", "content": "c"}]),
+            )
+        """
+        skill_dir = _write_skill(tmp_path, "fan", "name: fan\n", {"ask.py": HANDLER})
+        kwargs = dict(
+            skill_name="fan",
+            skill_path=skill_dir,
+            handler_relpath="handlers/ask.py",
+            handler_key="on_ask",
+            permissions={"llm_access"},
+            timeout=30,
+            llm_router=_SlowRouter(),
+            pool=pool,
+        )
+        await run_handler_sandboxed(**kwargs)  # Warm the worker
+
+        start = time.monotonic()
+        result = await run_handler_sandboxed(**kwargs)
+
+        assert result == ["a", "b", "c"]
+        assert time.monotonic() - start < 1.2
+
+    @pytest.mark.asyncio
+    async def test_trailing_notifications_drained_before_return(self, tmp_path, pool):
+        HANDLER = """\
+        async def handle(ctx):
+            await ctx.notify("bye")
+            return {"method": "notify", "result": "not an rpc"}
+        """
+        skill_dir = _write_skill(tmp_path, "tail", "name: tail\n", {"ask.py": HANDLER})
+        mock_bus = MagicMock()
+        result = await run_handler_sandboxed(
+            skill_name="tail",
+            skill_path=skill_dir,
+            handler_relpath="handlers/ask.py",
+            handler_key="on_ask",
+            permissions={"notify"},
+            timeout=30,
+            event_bus=mock_bus,
+            pool=pool,
+        )
+        assert result == {"method": "notify", "result": "not an rpc"}
+        mock_bus.publish.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_runs_from_skill_dir(self, tmp_path, pool):
+        HANDLER = """\
+        import os
+        import helper
+
+        async def handle(ctx):
+            return [os.getcwd(), helper.VALUE]
+        """
+        skill_dir = _write_skill(tmp_path, "cwd", "name: cwd\n", {"ask.py": HANDLER})
+        (skill_dir / "helper.py").write_text("VALUE = 42\n")
+        result = await run_handler_sandboxed(
+            skill_name="cwd",
+            skill_path=skill_dir,
+            handler_relpath="handlers/ask.py",
+            handler_key="on_ask",
+            permissions=set(),
+            timeout=30,
+            pool=pool,
+        )
+        assert result == [str(skill_dir), 42]
+
+    @pytest.mark.asyncio
+    async def test_unserializable_result_returns_rpc_error(self, tmp_path, pool):
+        HANDLER = """\
+        async def handle(ctx):
+            try:
+                await ctx.get_preference("theme")
+            except RuntimeError as e:
+                return "error"
+            return "ok"
+        """
+        skill_dir = _write_skill(tmp_path, "badres", "name: badres\n", {"ask.py": HANDLER})
+        mock_db = MagicMock()
+        mock_db.get_preference.return_value = object()
+        start = time.monotonic()
+        result = await run_handler_sandboxed(
+            skill_name="badres",
+            skill_path=skill_dir,
+            handler_relpath="handlers/ask.py",
+            handler_key="on_ask",
+            permissions={"read_preferences"},
+            timeout=30,
+            db=mock_db,
+            pool=pool,
+        )
+        assert result == "error"
+        assert time.monotonic() - start < 10
+
+    @pytest.mark.asyncio
+    async def test_handler_prints_do_not_corrupt_protocol(self, tmp_path, pool):
+        HANDLER = """\
+        async def handle(ctx):
+            print("noise on stdout")
+            return "ok"
+        """
+        skill_dir = _write_skill(tmp_path, "noisy", "name: noisy\n", {"poll.py": HANDLER})
+        result = await run_handler_sandboxed(
+            skill_name="noisy",
+            skill_path=skill_dir,
+            handler_relpath="handlers/poll.py",
+            handler_key="schedule",
+            permissions=set(),
+            timeout=30,
+            pool=pool,
+        )
+        assert result == "ok"
+
+
+class TestSandboxPool:
+    """Pooled workers serve successive invocations."""
+
+    PID_HANDLER = """\
+    import os
+
+    async def handle(ctx, *args):
+        if args and args[0] == "boom":
+            raise ValueError("boom")
+        if args and args[0] == "hang":
+            import asyncio
+            await asyncio.sleep(60)
+        return os.getpid()
+    """
+
+    async def _run(self, skill_dir, pool, *args, timeout=30):
+        return await run_handler_sandboxed(
+            skill_name="pooled",
+            skill_path=skill_dir,
+            handler_relpath="handlers/pid.py",
+            handler_key="on_ask",
+            permissions=set(),
+            args_json=json.dumps(list(args)),
+            timeout=timeout,
+            pool=pool,
+        )
+
+    @pytest.mark.asyncio
+    async def test_worker_reused(self, tmp_path, pool):
+        skill_dir = _write_skill(tmp_path, "pooled", "name: pooled\n", {"pid.py": self.PID_HANDLER})
+        first = await self._run(skill_dir, pool)
+        second = await self._run(skill_dir, pool)
+        assert isinstance(first, int)
+        assert first == second
+
+    @pytest.mark.asyncio
+    async def test_limits_bound_at_launch(self, tmp_path, pool):
+        pytest.importorskip("resource")
+        HANDLER = """\
+        import resource
+
+        async def handle(ctx):
+            return [resource.getrlimit(resource.RLIMIT_NOFILE),
+                    resource.getrlimit(resource.RLIMIT_AS),
+                    resource.getrlimit(resource.RLIMIT_CPU)]
+        """
+        skill_dir = _write_skill(tmp_path, "pooled", "name: pooled\n", {"pid.py": HANDLER})
+        nofile, mem, cpu = await self._run(skill_dir, pool)
+        assert nofile == [64, 64]
+        assert mem == [256 * 1024 * 1024] * 2
+        assert cpu == [30, 30]
+
+    @pytest.mark.asyncio
+    async def test_raised_cpu_limit_still_killed(self, tmp_path, pool, monkeypatch):
+        pytest.importorskip("resource")
+        if not _can_limit_from_parent():
+            pytest.skip("limits are only patchable where the parent binds them")
+        monkeypatch.setattr("omnibrain.skill_sandbox._SANDBOX_RLIMITS", (("RLIMIT_CPU", 1, 1),))
+        HANDLER = """\
+        import resource
+        import signal
+        import time
+
+        async def handle(ctx):
+            signal.signal(signal.SIGXCPU, signal.SIG_IGN)
+            hard = resource.getrlimit(resource.RLIMIT_CPU)[1]
+            resource.setrlimit(resource.RLIMIT_CPU, (hard, hard))
+            try:
+                resource.setrlimit(resource.RLIMIT_CPU, (resource.RLIM_INFINITY,) * 2)
+            except ValueError:
+                pass
+            end = time.monotonic() + 30
+            while time.monotonic() < end:
+                pass
+            return "survived"
+        """
+        skill_dir = _write_skill(tmp_path, "pooled", "name: pooled\n", {"pid.py": HANDLER})
+        start = time.monotonic()
+        assert await self._run(skill_dir, pool, timeout=20) is None
+        assert time.monotonic() - start < 15
+
+    @pytest.mark.asyncio
+    async def test_worker_retired_after_cpu_reuse_budget(self, tmp_path, pool, monkeypatch):
+        if _process_cpu_seconds(os.getpid()) is None:
+            pytest.skip("worker CPU time not readable on this platform")
+        monkeypatch.setattr("omnibrain.skill_sandbox._WORKER_CPU_REUSE_S", 0.0)
+        skill_dir = _write_skill(tmp_path, "pooled", "name: pooled\n", {"pid.py": self.PID_HANDLER})
+        first = await self._run(skill_dir, pool)
+        second = await self._run(skill_dir, pool)
+        assert isinstance(first, int)
+        assert first != second
+
+    @pytest.mark.asyncio
+    async def test_handler_error_keeps_worker(self, tmp_path, pool):
+        skill_dir = _write_skill(tmp_path, "pooled", "name: pooled\n", {"pid.py": self.PID_HANDLER})
+        pid = await self._run(skill_dir, pool)
+        assert await self._run(skill_dir, pool, "boom") is None
+        assert await self._run(skill_dir, pool) == pid
+
+    @pytest.mark.asyncio
+    async def test_timeout_evicts_worker(self, tmp_path, pool):
+        skill_dir = _write_skill(tmp_path, "pooled", "name: pooled\n", {"pid.py": self.PID_HANDLER})
+        pid = await self._run(skill_dir, pool)
+        assert await self._run(skill_dir, pool, "hang", timeout=1) is None
+        fresh = await self._run(skill_dir, pool)
+        assert isinstance(fresh, int)
+        assert fresh != pid
+
+    @pytest.mark.asyncio
+    async def test_module_imported_once_per_worker(self, tmp_path, pool):
+        HANDLER = """\
+        import itertools
+        _calls = itertools.count(1)
+
+        async def handle(ctx):
+            return next(_calls)
+        """
+        skill_dir = _write_skill(tmp_path, "pooled", "name: pooled\n", {"pid.py": HANDLER})
+        assert await self._run(skill_dir, pool) == 1
+        assert await self._run(skill_dir, pool) == 2
+
+    @pytest.mark.asyncio
+    async def test_symlinked_handler_shares_module(self, tmp_path, pool):
+        HANDLER = """\
+        import itertools
+        _calls = itertools.count(1)
+
+        async def handle(ctx):
+            return next(_calls)
+        """
+        skill_dir = _write_skill(tmp_path, "pooled", "name: pooled\n", {"pid.py": HANDLER})
+        (skill_dir / "handlers" / "alias.py").symlink_to(skill_dir / "handlers" / "pid.py")
+        assert await self._run(skill_dir, pool) == 1
+        result = await run_handler_sandboxed(
+            skill_name="pooled",
+            skill_path=skill_dir,
+            handler_relpath="handlers/alias.py",
+            handler_key="on_ask",
+            permissions=set(),
+            timeout=30,
+            pool=pool,
+        )
+        assert result == 2
+
+    @pytest.mark.asyncio
+    async def test_edited_handler_reloaded(self, tmp_path, pool):
+        skill_dir = _write_skill(tmp_path, "pooled", "name: pooled\n", {
+            "pid.py": "async def handle(ctx):\n    return 'v1'\n",
+        })
+        assert await self._run(skill_dir, pool) == "v1"
+        handler = skill_dir / "handlers" / "pid.py"
+        handler.write_text("async def handle(ctx):\n    return 'v2'\n")
+        st = handler.stat()
+        os.utime(handler, ns=(st.st_atime_ns, st.st_mtime_ns + 10**9))
+        assert await self._run(skill_dir, pool) == "v2"
+
+    @pytest.mark.asyncio
+    async def test_idle_workers_expire(self, tmp_path):
+        skill_dir = _write_skill(tmp_path, "pooled", "name: pooled\n", {"pid.py": self.PID_HANDLER})
+        pool = SandboxPool(idle_timeout=0.0)
+        try:
+            first = await self._run(skill_dir, pool)
+            second = await self._run(skill_dir, pool)
+        finally:
+            await pool.close()
+        assert first != second
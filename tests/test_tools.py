@@ -58,6 +58,30 @@ class TestToolRegistry:
         assert len(schemas) == 1
         assert schemas[0]["function"]["name"] == "my_tool"
 
+    def test_get_schemas_appends_examples(self):
+        from omnigent.few_shot_examples import EXAMPLES, ToolExample, register_examples
+
+        reg = ToolRegistry()
+        async def my_tool():
+            return "ok"
+        reg.register("_ex_tool", my_tool, {"description": "A test tool"})
+        register_examples("_ex_tool", [
+            ToolExample("Scan it", "Need a scan", "_ex_tool", {}, "open ports", True),
+            ToolExample("Guess it", "", "_ex_tool", {}, "nothing", False),
+        ])
+        try:
+            desc = reg.get_schemas()[0]["function"]["description"]
+        finally:
+            del EXAMPLES["_ex_tool"]
+        assert desc == (
+            "A test tool\n\n**Examples:**"
+            "\n+ Example 1: Scan it"
+            "\n   Thinking: Need a scan..."
+            "\n   Expected: open ports..."
+            "\n- Example 2: Guess it"
+            "\n   Expected: nothing..."
+        )
+
     def test_scope_check_default_allows_all(self):
         reg = ToolRegistry()
         assert reg._check_scope("any_tool", {"url": "http://anything.com"}) is None
@@ -3,6 +3,7 @@ Tests for Transparency Logger — LLM call logging, querying, stats, and pruning
 
 Groups:
     LogCall     — log_call() writes correct data
+    Connection  — shared persistent connection
     GetCalls    — pagination, provider/source/date filters
     GetStats    — aggregated stats correctness
     DailyCosts  — daily breakdown for charting
@@ -14,8 +15,9 @@ from __future__ import annotations
 
 import asyncio
 import sqlite3
+import threading
 import time
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
 from pathlib import Path
 from unittest.mock import AsyncMock, MagicMock, patch
 
@@ -77,7 +79,15 @@ class TestLogCall:
     def test_prompt_hash_computed(self, tmp_logger):
         _insert_call(tmp_logger, prompt_text="test prompt")
         call = tmp_logger.get_calls()[0]
-        assert len(call.prompt_hash) == 64  # SHA-256 hex
+        assert call.prompt_hash.startswith("b2:")
+        assert len(call.prompt_hash) == 3 + 32  # BLAKE2b-128 hex
+
+    def test_prompt_hash_stable_and_distinct(self, tmp_logger):
+        _insert_call(tmp_logger, prompt_text="same")
+        _insert_call(tmp_logger, prompt_text="same")
+        _insert_call(tmp_logger, prompt_text="different")
+        hashes = [c.prompt_hash for c in tmp_logger.get_calls()]
+        assert hashes[1] == hashes[2] != hashes[0]
 
     def test_empty_prompt_handled(self, tmp_logger):
         row_id = _insert_call(tmp_logger, prompt_text="")
@@ -97,6 +107,25 @@ class TestLogCall:
         assert call.success is False
         assert "Rate limited" in call.error_message
 
+    def test_prompt_parts_match_whole_prompt(self, tmp_logger):
+        parts = ["system: " + "x" * 600, "user: caffè?"]
+        _insert_call(tmp_logger, prompt_text="".join(parts))
+        _insert_call(tmp_logger, prompt_text="", prompt_parts=parts)
+        whole, pieces = tmp_logger.get_calls()[::-1]
+        assert pieces.prompt_hash == whole.prompt_hash
+        assert pieces.prompt_size_bytes == whole.prompt_size_bytes == len("".join(parts).encode())
+        assert pieces.prompt_preview == whole.prompt_preview
+        assert len(pieces.prompt_preview) == 500
+
+    def test_empty_prompt_parts(self, tmp_logger):
+        _insert_call(tmp_logger, prompt_text="", prompt_parts=["", ""])
+        call = tmp_logger.get_calls()[0]
+        assert (call.prompt_hash, call.prompt_size_bytes, call.prompt_preview) == ("", 0, "")
+
+    def test_response_size_without_text(self, tmp_logger):
+        _insert_call(tmp_logger, response_text="", response_size_bytes=1234)
+        assert tmp_logger.get_calls()[0].response_size_bytes == 1234
+
     def test_prompt_size_bytes_stored(self, tmp_logger):
         prompt = "hello" * 10  # 50 bytes
         _insert_call(tmp_logger, prompt_text=prompt)
@@ -112,6 +141,200 @@ class TestLogCall:
         assert providers == {"deepseek", "claude", "openai"}
 
 
+# ═══════════════════════════════════════════════════════════════════════════
+# Connection
+# ═══════════════════════════════════════════════════════════════════════════
+
+
+class TestConnection:
+    def test_connection_reused_across_calls(self, tmp_logger):
+        _insert_call(tmp_logger)
+        conn = tmp_logger._conn
+        tmp_logger.get_calls()
+        tmp_logger.get_stats()
+        _insert_call(tmp_logger)
+        assert tmp_logger._conn is conn
+
+    def test_concurrent_threads_all_logged(self, tmp_logger):
+        threads = [
+            threading.Thread(target=lambda: [_insert_call(tmp_logger) for _ in range(20)])
+            for _ in range(4)
+        ]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        assert tmp_logger.get_stats().total_calls == 80
+
+    def test_failed_write_rolls_back(self, tmp_logger):
+        with pytest.raises(RuntimeError), tmp_logger._connect(write=True) as conn:
+            conn.execute("INSERT INTO llm_calls (provider) VALUES ('x')")
+            raise RuntimeError("boom")
+        assert tmp_logger.get_calls() == []
+        assert _insert_call(tmp_logger) > 0
+
+    def test_close_reopens_on_next_use(self, tmp_logger):
+        _insert_call(tmp_logger)
+        tmp_logger.close()
+        assert tmp_logger._conn is None
+        assert len(tmp_logger.get_calls()) == 1
+
+
+class TestBackgroundWriter:
+    def _raw_count(self, tlog):
+        with sqlite3.connect(str(tlog._db_path)) as conn:
+            return conn.execute("SELECT COUNT(*) FROM llm_calls").fetchone()[0]
+
+    def test_calls_coalesced_until_window_or_flush(self, tmp_logger):
+        with patch("omnibrain.transparency._WRITE_BATCH_WINDOW_S", 30.0):
+            for _ in range(3):
+                tmp_logger.enqueue_call(provider="deepseek")
+            time.sleep(0.05)
+            assert self._raw_count(tmp_logger) == 0
+            started = time.monotonic()
+            tmp_logger.flush()
+            assert time.monotonic() - started < 5
+            assert self._raw_count(tmp_logger) == 3
+
+    def test_full_batch_written_without_waiting(self, tmp_logger):
+        from omnibrain.transparency import _WRITE_BATCH_SIZE
+
+        with patch("omnibrain.transparency._WRITE_BATCH_WINDOW_S", 30.0), \
+                patch.object(tmp_logger, "_write_batch", wraps=tmp_logger._write_batch) as write:
+            for _ in range(_WRITE_BATCH_SIZE):
+                tmp_logger.enqueue_call(provider="deepseek")
+            for _ in range(100):
+                if write.called:
+                    break
+                time.sleep(0.02)
+            assert len(write.call_args.args[0]) == _WRITE_BATCH_SIZE
+            tmp_logger.flush()
+
+    def test_close_stops_writer_and_releases_logger(self, tmp_path):
+        import gc
+        import weakref
+
+        tlog = TransparencyLogger(tmp_path)
+        with patch("omnibrain.transparency._WRITE_BATCH_WINDOW_S", 30.0):
+            tlog.enqueue_call(provider="deepseek")
+            writer = tlog._writer
+            tlog.close()
+        assert not writer.is_alive()
+        assert self._raw_count(tlog) == 1
+
+        # Usable again after close: the writer restarts on demand
+        tlog.enqueue_call(provider="deepseek")
+        tlog.close()
+        assert self._raw_count(tlog) == 2
+
+        ref = weakref.ref(tlog)
+        del tlog
+        gc.collect()
+        assert ref() is None
+
+    def test_window_expiry_writes_without_flush(self, tmp_logger):
+        with patch("omnibrain.transparency._WRITE_BATCH_WINDOW_S", 0.01):
+            tmp_logger.enqueue_call(provider="deepseek")
+            for _ in range(100):
+                if self._raw_count(tmp_logger):
+                    break
+                time.sleep(0.02)
+            assert self._raw_count(tmp_logger) == 1
+
+    def test_enqueue_returns_before_write_and_flush_persists(self, tmp_logger):
+        tmp_logger.enqueue_call(provider="deepseek", prompt_text="hi", source="hook")
+        tmp_logger.flush()
+        with sqlite3.connect(str(tmp_logger._db_path)) as conn:
+            rows = conn.execute("SELECT provider, source, prompt_hash FROM llm_calls").fetchall()
+        assert len(rows) == 1
+        assert rows[0][:2] == ("deepseek", "hook")
+        assert rows[0][2]
+
+    def test_queries_see_queued_calls(self, tmp_logger):
+        for _ in range(100):
+            tmp_logger.enqueue_call(provider="openai", cost_estimate=0.01)
+        assert tmp_logger.get_stats().total_calls == 100
+
+    def test_writer_started_once(self, tmp_logger):
+        tmp_logger.enqueue_call(provider="a")
+        writer = tmp_logger._writer
+        tmp_logger.enqueue_call(provider="b")
+        tmp_logger.flush()
+        assert tmp_logger._writer is writer
+        assert writer.daemon
+
+    def test_bad_call_does_not_stop_writer(self, tmp_logger):
+        tmp_logger.enqueue_call(provider="a", unknown_field=1)
+        tmp_logger.enqueue_call(provider="b")
+        tmp_logger.flush()
+        tmp_logger.enqueue_call(provider="c")
+        assert {c.provider for c in tmp_logger.get_calls()} == {"b", "c"}
+
+    def test_log_from_hook_is_queued(self, tmp_logger):
+        with patch.object(tmp_logger, "log_call") as log_call:
+            tmp_logger.log_from_hook("deepseek", "m", 10, 5, 0, 0, "chat")
+        log_call.assert_not_called()
+        assert tmp_logger.get_calls()[0].source == "chat"
+
+
+class TestEpochTimestamps:
+    def test_logged_calls_get_epoch(self, tmp_logger):
+        before = int(time.time())
+        _insert_call(tmp_logger)
+        tmp_logger.enqueue_call(provider="queued")
+        tmp_logger.flush()
+        with sqlite3.connect(str(tmp_logger._db_path)) as conn:
+            epochs = [r[0] for r in conn.execute("SELECT ts_epoch FROM llm_calls")]
+        assert len(epochs) == 2
+        assert all(before - 1 <= e <= time.time() + 1 for e in epochs)
+
+    def test_trigger_fills_epoch_from_timestamp(self, tmp_logger):
+        with sqlite3.connect(str(tmp_logger._db_path)) as conn:
+            conn.execute(
+                "INSERT INTO llm_calls (provider, timestamp) VALUES ('x', '2024-01-02 03:04:05')"
+            )
+            epoch = conn.execute("SELECT ts_epoch FROM llm_calls").fetchone()[0]
+        assert epoch == int(datetime(2024, 1, 2, 3, 4, 5, tzinfo=timezone.utc).timestamp())
+
+    def test_schema_scripts_skipped_when_current(self, tmp_path):
+        TransparencyLogger(tmp_path).close()
+        tlog = TransparencyLogger(tmp_path)  # warm start on an existing DB
+        statements = []
+        tlog._conn.set_trace_callback(statements.append)
+        tlog._ensure_schema()
+        assert not any("CREATE" in sql for sql in statements)
+
+    def test_schema_recreated_after_table_dropped(self, tmp_logger):
+        _insert_call(tmp_logger)
+        with tmp_logger._connect() as conn:
+            conn.execute("DROP TABLE llm_calls")
+        tmp_logger._ensure_schema()
+        assert _insert_call(tmp_logger) > 0
+        assert tmp_logger.get_stats().total_calls == 1
+
+    def test_migrates_database_without_epoch_column(self, tmp_path):
+        with sqlite3.connect(str(tmp_path / "omnibrain.db")) as conn:
+            conn.execute(
+                "CREATE TABLE llm_calls (id INTEGER PRIMARY KEY AUTOINCREMENT,"
+                " timestamp TEXT NOT NULL DEFAULT (datetime('now')), provider TEXT NOT NULL,"
+                " model TEXT, prompt_preview TEXT, prompt_hash TEXT,"
+                " prompt_size_bytes INTEGER DEFAULT 0, response_size_bytes INTEGER DEFAULT 0,"
+                " input_tokens INTEGER DEFAULT 0, output_tokens INTEGER DEFAULT 0,"
+                " cache_read_tokens INTEGER DEFAULT 0, cache_creation_tokens INTEGER DEFAULT 0,"
+                " cost_estimate REAL DEFAULT 0.0, source TEXT DEFAULT '',"
+                " duration_ms INTEGER DEFAULT 0, success BOOLEAN DEFAULT 1, error_message TEXT)"
+            )
+            conn.execute("INSERT INTO llm_calls (provider) VALUES ('legacy')")
+            conn.execute(
+                "INSERT INTO llm_calls (provider, timestamp) VALUES ('ancient', '2000-01-01 00:00:00')"
+            )
+        tlog = TransparencyLogger(tmp_path)
+        assert tlog.get_stats(days=30).calls_by_provider == {"legacy": 1}
+        assert tlog.prune(days=90) == 1
+        _insert_call(tlog)
+        assert {c.provider for c in tlog.get_calls()} == {"legacy", "deepseek"}
+
+
 # ═══════════════════════════════════════════════════════════════════════════
 # GetCalls — Filtering
 # ═══════════════════════════════════════════════════════════════════════════
@@ -195,6 +418,31 @@ class TestGetCalls:
         assert call.source == "chat"
         assert call.duration_ms == 350
 
+    def test_null_columns_read_as_defaults(self, tmp_logger):
+        with sqlite3.connect(str(tmp_logger._db_path)) as conn:
+            conn.execute(
+                "INSERT INTO llm_calls (provider, model, prompt_preview, prompt_size_bytes,"
+                " input_tokens, cost_estimate, source, duration_ms, success, error_message)"
+                " VALUES ('x', NULL, NULL, NULL, NULL, NULL, NULL, NULL, 0, NULL)"
+            )
+        call = tmp_logger.get_calls()[0]
+        assert call == LLMCallRecord(
+            id=call.id, timestamp=call.timestamp, provider="x", success=False,
+        )
+        assert call.success is False
+
+    def test_select_matches_record_fields(self, tmp_logger):
+        from dataclasses import fields
+
+        from omnibrain.transparency import _SELECT_CALLS_SQL
+
+        with tmp_logger._connect() as conn:
+            cursor = conn.execute(_SELECT_CALLS_SQL.format(where=""), (1, 0))
+            assert len(cursor.description) == len(fields(LLMCallRecord))
+        _insert_call(tmp_logger, error_message="boom", success=False)
+        call = tmp_logger.get_calls()[0]
+        assert (call.success, call.error_message) == (False, "boom")
+
 
 # ═══════════════════════════════════════════════════════════════════════════
 # GetStats
@@ -260,6 +508,55 @@ class TestGetStats:
         assert "calls_by_provider" in d
         assert isinstance(d["total_cost"], float)
 
+    def test_today_starts_at_local_midnight(self, tmp_logger, monkeypatch):
+        monkeypatch.setenv("TZ", "America/New_York")
+        time.tzset()
+        try:
+            midnight = int(datetime.now().replace(hour=0, minute=0, second=0, microsecond=0).timestamp())
+            with sqlite3.connect(str(tmp_logger._db_path)) as conn:
+                for provider, epoch in [("before", midnight - 1), ("after", midnight + 1)]:
+                    conn.execute(
+                        "INSERT INTO llm_calls (provider, ts_epoch, cost_estimate) VALUES (?, ?, 1.0)",
+                        (provider, epoch),
+                    )
+            stats = tmp_logger.get_stats()
+        finally:
+            monkeypatch.undo()
+            time.tzset()
+        assert stats.calls_today == 1
+        assert stats.cost_today == pytest.approx(1.0)
+
+    def test_window_excludes_old_calls_but_month_and_today_do_not(self, tmp_logger):
+        now = datetime.now()
+        with sqlite3.connect(str(tmp_logger._db_path)) as conn:
+            for age_days, provider, source, cost in [
+                (0, "deepseek", "chat", 0.01),
+                (0, "deepseek", "", 0.02),
+                (10, "claude", "briefing", 0.04),
+                (400, "openai", "chat", 0.08),
+            ]:
+                ts = (now - timedelta(days=age_days)).astimezone(timezone.utc).strftime("%Y-%m-%d %H:%M:%S")
+                conn.execute(
+                    "INSERT INTO llm_calls (provider, source, cost_estimate, duration_ms, timestamp)"
+                    " VALUES (?, ?, ?, ?, ?)",
+                    (provider, source, cost, 100 * (age_days + 1), ts),
+                )
+        stats = tmp_logger.get_stats(days=7)
+        assert stats.total_calls == 2
+        assert stats.calls_by_provider == {"deepseek": 2}
+        assert stats.calls_by_source == {"chat": 1, "unknown": 1}
+        assert stats.total_cost == pytest.approx(0.03)
+        assert stats.avg_duration_ms == pytest.approx(100)
+        assert stats.calls_today == 2
+        assert stats.cost_today == pytest.approx(0.03)
+        month_cost = 0.03 + (0.04 if (now - timedelta(days=10)).month == now.month else 0)
+        assert stats.cost_this_month == pytest.approx(month_cost)
+
+        all_time = tmp_logger.get_stats()
+        assert all_time.total_calls == 4
+        assert all_time.calls_by_source == {"chat": 2, "unknown": 1, "briefing": 1}
+        assert all_time.cost_this_month == pytest.approx(month_cost)
+
 
 # ═══════════════════════════════════════════════════════════════════════════
 # DailyCosts
@@ -394,6 +691,30 @@ class TestWrapStream:
             received.append(chunk.content)
 
         assert received == ["hello", " world"]
+        assert tmp_logger.get_calls()[0].response_size_bytes == len("hello world")
+
+    @pytest.mark.asyncio
+    async def test_response_size_counts_utf8_bytes(self, tmp_logger):
+        from dataclasses import dataclass
+
+        @dataclass
+        class FakeChunk:
+            content: str = ""
+            model: str = ""
+            input_tokens: int = 0
+            output_tokens: int = 0
+            cache_read_tokens: int = 0
+            cache_creation_tokens: int = 0
+
+        async def fake_stream():
+            yield FakeChunk(content="caffè ")
+            yield FakeChunk(content="")
+            yield FakeChunk(content="☕")
+
+        async for _ in tmp_logger.wrap_stream(fake_stream(), provider="deepseek"):
+            pass
+
+        assert tmp_logger.get_calls()[0].response_size_bytes == len("caffè ☕".encode())
 
     @pytest.mark.asyncio
     async def test_wrap_stream_logs_after_completion(self, tmp_logger):
@@ -457,3 +778,42 @@ class TestWrapStream:
         assert len(calls) == 1
         assert calls[0].success is False
         assert "connection reset" in calls[0].error_message
+
+
+# ═══════════════════════════════════════════════════════════════════════════
+# Cost estimate
+# ═══════════════════════════════════════════════════════════════════════════
+
+
+class TestEstimateCost:
+    def test_matches_pricing_table(self, tmp_logger):
+        from omnigent.cost_tracker import PRICING
+
+        p = PRICING["deepseek"]
+        expected = (
+            (1_000 / 1_000_000) * p.input_per_million
+            + (500 / 1_000_000) * p.output_per_million
+        )
+        cost = tmp_logger._estimate_cost("DeepSeek", 1_000, 500, 0, 0)
+        assert cost == pytest.approx(expected)
+
+    def test_unknown_provider_is_free(self, tmp_logger):
+        assert tmp_logger._estimate_cost("nobody", 1_000, 500, 10, 10) == 0.0
+
+    def test_rates_looked_up_once_per_provider(self, tmp_logger):
+        from omnibrain.transparency import _per_token_rates
+
+        _per_token_rates.cache_clear()
+        tmp_logger._estimate_cost("deepseek", 1, 1, 0, 0)
+        tmp_logger._estimate_cost("deepseek", 2, 2, 0, 0)
+        tmp_logger._estimate_cost("nobody", 1, 1, 0, 0)
+        info = _per_token_rates.cache_info()
+        assert (info.hits, info.misses) == (1, 2)
+        assert _per_token_rates("nobody") is None
+        assert _per_token_rates("DeepSeek") == _per_token_rates("deepseek")
+
+    def test_hook_logs_estimated_cost(self, tmp_logger):
+        tmp_logger.log_from_hook("deepseek", "deepseek-chat", 1_000_000, 0, 0, 0, "chat")
+        expected = tmp_logger._estimate_cost("deepseek", 1_000_000, 0, 0, 0)
+        assert tmp_logger.get_calls()[0].cost_estimate == pytest.approx(expected)
+        assert expected > 0